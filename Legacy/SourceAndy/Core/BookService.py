@@ -8,14 +8,50 @@ Description: COMPLETE FIX - Book Service with All Missing Methods
 Added missing GetSubjectsForCategory method and fixed all compatibility issues.
 """
 
+import io
 import logging
 import subprocess
 import platform
 import os
-from typing import List, Optional, Dict, Any
+import shutil
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from itertools import repeat
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Set
 from pathlib import Path
 
 from Source.Core.DatabaseManager import DatabaseManager
+from Source.Data.DatabaseModels import SearchCriteria
+
+# Pillow is optional: without it the pre-scaled thumbnail cache is simply not used
+try:
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+# Pre-scaled thumbnails: Data/Thumbs/<mode>/<book id>.jpg, sized to the BookCard cover box;
+# deleted by ClearCache on library refresh, since ids do not track cover changes
+THUMBNAIL_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "Data" / "Thumbs"
+THUMBNAIL_SIZES = {"grid": (156, 196), "list": (56, 56)}
+THUMBNAIL_QUALITY = 85
+
+# Rows handed to each worker process per round-trip when priming the cache
+THUMBNAIL_PRIME_CHUNK_SIZE = 32
+
+
+def RenderThumbnailJpeg(ThumbnailData: bytes, TargetSize: Tuple[int, int]) -> bytes:
+    """
+    Decode a cover BLOB, fit it to the cover box and encode it as JPEG.
+    Module-level and Qt-free so it can run in a worker process.
+    """
+    with Image.open(io.BytesIO(ThumbnailData)) as Source:
+        Source.draft("RGB", TargetSize)  # JPEG: let the decoder downscale
+        # Fit the cover box (up or down), matching the card's KeepAspectRatio scaling
+        Scaled = ImageOps.contain(Source.convert("RGB"), TargetSize, Image.LANCZOS)
+    Output = io.BytesIO()
+    Scaled.save(Output, "JPEG", quality=THUMBNAIL_QUALITY)
+    return Output.getvalue()
 
 
 class BookService:
@@ -38,6 +74,17 @@ class BookService:
         self._SubjectCache: Optional[List[str]] = None
         self._CategorySubjectCache: Optional[Dict[str, List[str]]] = None
         
+        # Only one background thumbnail priming run at a time; the pool is kept so
+        # StopThumbnailPriming can cancel it, and fully primed modes are skipped
+        self._PrimeLock = threading.Lock()
+        self._PrimePool: Optional[ProcessPoolExecutor] = None
+        self._PrimeStopped = False
+        self._PrimedModes: Set[str] = set()
+        
+        # Cache files are keyed by book id only; ClearCache deletes them and bumps the
+        # generation so renders started before the purge are not written back
+        self._ThumbnailGeneration = 0
+        
         self.Logger.info("BookService initialized with complete method support")
     
     def GetAllBooks(self) -> List[Dict[str, Any]]:
@@ -95,6 +142,57 @@ class BookService:
             self.Logger.error(f"Failed to filter books: {Error}")
             return []
     
+    def Query(self, Category: str = "", Subject: str = "", SearchTerm: str = "",
+              Limit: Optional[int] = None, Offset: int = 0,
+              IncludeThumbnails: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get books matching category, subject and search text together in one query.
+        Thumbnail BLOBs are skipped by default; cards fetch them by ID when shown.
+        
+        Args:
+            Category: Category name to filter by
+            Subject: Subject name to filter by
+            SearchTerm: Title/author search text
+            Limit: Maximum number of books to return (None for all)
+            Offset: Number of matching books to skip
+            IncludeThumbnails: Include ThumbnailData BLOBs in the rows
+            
+        Returns:
+            List of matching Book dictionaries
+        """
+        try:
+            Criteria = None
+            if Limit is not None or Offset:
+                Criteria = SearchCriteria(
+                    SearchTerm=SearchTerm or None,
+                    Categories=[Category] if Category else [],
+                    Subjects=[Subject] if Subject else [],
+                    Limit=Limit,
+                    Offset=Offset
+                )
+            Books = self.DatabaseManager.GetBooks(Category=Category, Subject=Subject,
+                                                  SearchTerm=SearchTerm, Criteria=Criteria,
+                                                  IncludeThumbnails=IncludeThumbnails)
+            self.Logger.debug(f"Query Category='{Category}', Subject='{Subject}', "
+                              f"Search='{SearchTerm}' returned {len(Books)} books")
+            return Books
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to query books: {Error}")
+            return []
+    
+    def GetThumbnailBlob(self, BookId: int) -> Optional[bytes]:
+        """
+        Get the thumbnail BLOB for one book (for rows queried without thumbnails).
+        
+        Args:
+            BookId: Database ID of the book
+            
+        Returns:
+            BLOB data as bytes, or None if the book has no thumbnail
+        """
+        return self.DatabaseManager.GetThumbnailBlob(BookId)
+    
     def GetCategories(self) -> List[str]:
         """
         Get all available categories using new schema.
@@ -183,17 +281,17 @@ class BookService:
                     BookData = Books[0]
                     
             elif isinstance(BookIdentifier, int):
-                # Search by ID
-                Books = self.DatabaseManager.GetBooks()
+                # Primary-key lookup of just the columns needed to open the file
+                Row = self.DatabaseManager.ExecuteQueryOne(
+                    "SELECT id, title, COALESCE(FilePath, '') FROM books WHERE id = ?",
+                    (BookIdentifier,)
+                )
                 
-                for Book in Books:
-                    if Book.get('ID', 0) == BookIdentifier:
-                        BookData = Book
-                        break
-                
-                if not BookData:
+                if not Row:
                     self.Logger.warning(f"Book not found with ID: {BookIdentifier}")
                     return False
+                
+                BookData = {'id': Row[0], 'Title': Row[1], 'FilePath': Row[2]}
             else:
                 self.Logger.error(f"Invalid book identifier type: {type(BookIdentifier)}")
                 return False
@@ -217,8 +315,8 @@ class BookService:
             else:  # Linux/Unix
                 subprocess.run(['xdg-open', FilePath], check=True)
             
-            # Update last opened timestamp
-            self.DatabaseManager.UpdateLastOpened(BookTitle)
+            # Update last opened timestamp (primary-key lookup)
+            self.DatabaseManager.UpdateLastOpened(BookData.get('id'))
             
             self.Logger.info(f"Successfully opened book: {BookTitle}")
             return True
@@ -255,7 +353,154 @@ class BookService:
             self.Logger.error(f"Failed to get book details: {Error}")
             return None
     
-    def GetDatabaseStats(self) -> Dict[str, int]:
+    @staticmethod
+    def GetThumbnailCachePath(BookId: int, Mode: str) -> Path:
+        """Path of the pre-scaled thumbnail for a book in the given view mode."""
+        return THUMBNAIL_CACHE_DIR / Mode / f"{BookId}.jpg"
+    
+    def EnsureThumbnail(self, BookId: int, Mode: str,
+                        ThumbnailData: Optional[bytes] = None) -> Optional[Path]:
+        """
+        Get the pre-scaled thumbnail file for a book, writing it on first use.
+        Safe to call from worker threads; files are written atomically.
+        
+        Args:
+            BookId: Database ID of the book
+            Mode: View mode ("grid" or "list")
+            ThumbnailData: Thumbnail BLOB if the caller already has it
+            
+        Returns:
+            Path to the cached JPEG, or None if there is no thumbnail to cache
+        """
+        ThumbPath = self.GetThumbnailCachePath(BookId, Mode)
+        if ThumbPath.exists():
+            return ThumbPath
+        Generation = self._ThumbnailGeneration
+        
+        TargetSize = THUMBNAIL_SIZES.get(Mode)
+        if Image is None or TargetSize is None:
+            return None
+        
+        try:
+            if ThumbnailData is None:
+                ThumbnailData = self.DatabaseManager.GetThumbnailBlob(BookId)
+            if not ThumbnailData:
+                return None
+            
+            JpegData = RenderThumbnailJpeg(ThumbnailData, TargetSize)
+            if Generation != self._ThumbnailGeneration:
+                return None  # Cache purged meanwhile; this BLOB may be out of date
+            self._WriteThumbnail(ThumbPath, JpegData)
+            return ThumbPath
+            
+        except Exception as Error:
+            self.Logger.warning(f"Failed to cache thumbnail for book {BookId}: {Error}")
+            return None
+    
+    @staticmethod
+    def _WriteThumbnail(ThumbPath: Path, JpegData: bytes) -> None:
+        """Write a cache file atomically (concurrent writers never expose partial files)."""
+        ThumbPath.parent.mkdir(parents=True, exist_ok=True)
+        TempPath = ThumbPath.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        TempPath.write_bytes(JpegData)
+        os.replace(TempPath, ThumbPath)
+    
+    def PrimeThumbnailCache(self, Books: Iterable[Dict[str, Any]], Mode: str,
+                            MaxWorkers: Optional[int] = None) -> int:
+        """
+        Render every missing pre-scaled thumbnail for the given books in a process pool.
+        Decoding and resampling are CPU-bound, so separate processes use all cores
+        without contending for the GIL; only JPEG bytes come back to this process.
+        Workers are spawned, not forked: this runs beside live Qt and pool threads.
+        Intended to run on a background thread; returns immediately if a run is active,
+        if the mode is already primed, or after StopThumbnailPriming.
+        
+        Args:
+            Books: Book records with 'id'; a missing 'ThumbnailData' BLOB is read by id
+            Mode: View mode ("grid" or "list")
+            MaxWorkers: Worker process count (defaults to the CPU count)
+            
+        Returns:
+            Number of thumbnails written
+        """
+        TargetSize = THUMBNAIL_SIZES.get(Mode)
+        if Image is None or TargetSize is None:
+            return 0
+        if self._PrimeStopped or self.IsThumbnailCachePrimed(Mode):
+            return 0
+        if not self._PrimeLock.acquire(blocking=False):
+            return 0
+        
+        try:
+            Generation = self._ThumbnailGeneration
+            Missing = []
+            for Book in Books:
+                if self._PrimeStopped:
+                    return 0  # Window closing; stop reading BLOBs
+                BookId = Book.get('id')
+                if BookId is None or self.GetThumbnailCachePath(BookId, Mode).exists():
+                    continue
+                # Rows loaded without BLOBs get them here, only for covers not yet cached
+                Data = Book.get('ThumbnailData') or self.DatabaseManager.GetThumbnailBlob(BookId)
+                if Data:
+                    Missing.append((BookId, Data))
+            if not Missing:
+                if Generation == self._ThumbnailGeneration:
+                    self._PrimedModes.add(Mode)
+                return 0
+            
+            Written = 0
+            BookIds = [BookId for BookId, _ in Missing]
+            with ProcessPoolExecutor(max_workers=MaxWorkers or os.cpu_count(),
+                                     mp_context=multiprocessing.get_context("spawn")) as Pool:
+                self._PrimePool = Pool
+                if self._PrimeStopped:
+                    return 0  # Stopped while the pool was starting
+                Results = Pool.map(RenderThumbnailJpeg, [Data for _, Data in Missing],
+                                   repeat(TargetSize), chunksize=THUMBNAIL_PRIME_CHUNK_SIZE)
+                for BookId, JpegData in zip(BookIds, Results):
+                    if Generation != self._ThumbnailGeneration:
+                        self.Logger.info("Thumbnail cache purged during priming; run discarded")
+                        return Written
+                    self._WriteThumbnail(self.GetThumbnailCachePath(BookId, Mode), JpegData)
+                    Written += 1
+            
+            self._PrimedModes.add(Mode)
+            self.Logger.info(f"Primed {Written} {Mode} thumbnails")
+            return Written
+            
+        except CancelledError:
+            self.Logger.info("Thumbnail priming cancelled")
+            return 0
+        except Exception as Error:
+            self.Logger.warning(f"Thumbnail priming stopped: {Error}")
+            return 0
+        finally:
+            self._PrimePool = None
+            self._PrimeLock.release()
+    
+    def PurgeThumbnailCache(self) -> None:
+        """
+        Delete every pre-scaled thumbnail so covers are re-rendered from the database.
+        Files are named by book id, which stays the same when a cover is replaced and
+        can be reused after a book is deleted, so they cannot be trusted after a refresh.
+        """
+        self._ThumbnailGeneration += 1
+        self._PrimedModes.clear()
+        shutil.rmtree(THUMBNAIL_CACHE_DIR, ignore_errors=True)
+    
+    def IsThumbnailCachePrimed(self, Mode: str) -> bool:
+        """True once a priming run has cached every thumbnail for the mode (until ClearCache)."""
+        return Mode in self._PrimedModes
+    
+    def StopThumbnailPriming(self) -> None:
+        """Cancel a running priming pool and refuse new runs (call on application close)."""
+        self._PrimeStopped = True
+        Pool = self._PrimePool
+        if Pool is not None:
+            Pool.shutdown(wait=False, cancel_futures=True)
+    
+    def GetDatabaseStats(self) -> Dict[str, Any]:
         """
         Get database statistics.
         
@@ -273,10 +518,12 @@ class BookService:
         self._CategoryCache = None
         self._SubjectCache = None
         self._CategorySubjectCache = None
+        self.PurgeThumbnailCache()
         self.Logger.info("BookService caches cleared")
     
     # ADDITIONAL COMPATIBILITY METHODS
-    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "") -> List[Dict[str, Any]]:
+    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "",
+                 Criteria: Optional[SearchCriteria] = None) -> List[Dict[str, Any]]:
         """
         ADDED: Direct compatibility method for legacy calls.
         
@@ -284,12 +531,14 @@ class BookService:
             Category: Category filter
             Subject: Subject filter
             SearchTerm: Search term filter
+            Criteria: Optional SearchCriteria with multi-value filters and paging
             
         Returns:
             List of Book dictionaries
         """
         try:
-            return self.DatabaseManager.GetBooks(Category=Category, Subject=Subject, SearchTerm=SearchTerm)
+            return self.DatabaseManager.GetBooks(Category=Category, Subject=Subject,
+                                                 SearchTerm=SearchTerm, Criteria=Criteria)
         except Exception as Error:
             self.Logger.error(f"Failed to get books with filters: {Error}")
             return []
\ No newline at end of file
@@ -11,9 +11,222 @@ Perfect for future web/mobile deployment!
 
 import sqlite3
 import logging
+import threading
+import time
+import json
 from pathlib import Path
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Iterator, Iterable, Callable
 import os
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+
+# Application database, resolved against the application root (Source/Core/ -> root)
+DEFAULT_DATABASE_PATH = str(Path(__file__).resolve().parent.parent.parent / "Data" / "Databases" / "MyLibrary.db")
+
+# Full-text search over title/author, kept in sync with books by triggers.
+# The trigram tokenizer (SQLite 3.34+) matches any substring of 3+ characters,
+# so a MATCH finds the same books as LIKE '%term%' ("script" finds "JavaScript").
+SEARCH_SCHEMA_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, author,
+        content='books', content_rowid='id',
+        tokenize='trigram'
+    );
+    CREATE TRIGGER IF NOT EXISTS books_ai AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END;
+    CREATE TRIGGER IF NOT EXISTS books_ad AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+    END;
+    CREATE TRIGGER IF NOT EXISTS books_au AFTER UPDATE OF title, author ON books BEGIN
+        INSERT INTO books_fts(books_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+        INSERT INTO books_fts(rowid, title, author) VALUES (new.id, new.title, new.author);
+    END;
+"""
+
+# Indexes for the category/subject filter paths and name lookups
+FILTER_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_books_category_subject_title "
+    "ON books (category_id, subject_id, title)",
+    "CREATE INDEX IF NOT EXISTS idx_books_category_title ON books (category_id, title)",
+    "CREATE INDEX IF NOT EXISTS idx_books_subject_title ON books (subject_id, title)",
+    "CREATE INDEX IF NOT EXISTS idx_categories_category ON categories (category)",
+    "CREATE INDEX IF NOT EXISTS idx_subjects_subject ON subjects (subject)",
+)
+
+# Drops a search index built by an earlier schema (word tokenizer) so it is rebuilt
+DROP_SEARCH_SCHEMA_SQL = """
+    DROP TRIGGER IF EXISTS books_ai;
+    DROP TRIGGER IF EXISTS books_ad;
+    DROP TRIGGER IF EXISTS books_au;
+    DROP TABLE IF EXISTS books_fts;
+"""
+
+# Trigrams need 3+ characters; LIKE wildcards in the term keep their LIKE meaning
+FTS_MIN_TERM_LENGTH = 3
+LIKE_WILDCARD_PATTERN = re.compile(r"[%_]")
+
+# Writes that change category/subject metadata and must invalidate cached lookups
+METADATA_WRITE_PATTERN = re.compile(
+    r"^\s*(INSERT|UPDATE|DELETE|REPLACE)\b.*\b(categories|subjects)\b",
+    re.IGNORECASE | re.DOTALL
+)
+
+# All statistics in one round-trip: counts plus the five most recently opened books
+DATABASE_STATS_SQL = """
+    WITH Counts AS (
+        SELECT (SELECT COUNT(*) FROM categories) AS TotalCategories,
+               (SELECT COUNT(*) FROM subjects) AS TotalSubjects,
+               (SELECT COUNT(*) FROM books) AS TotalBooks
+    )
+    SELECT TotalCategories, TotalSubjects, TotalBooks,
+           (SELECT json_group_array(json_object('Title', title, 'LastOpened', last_opened))
+            FROM (SELECT title, last_opened FROM books
+                  WHERE last_opened IS NOT NULL
+                  ORDER BY last_opened DESC LIMIT 5))
+    FROM Counts
+"""
+
+# books.last_opened is TEXT "YYYY-MM-DD HH:MM:SS" local time; SQLite formats it from epoch seconds
+LAST_OPENED_UPDATE_SQL = "UPDATE books SET last_opened = datetime(?, 'unixepoch', 'localtime') WHERE id = ?"
+
+# Write-behind for last_opened: flush after this many updates or once the oldest is this old
+LAST_OPENED_FLUSH_COUNT = 32
+LAST_OPENED_FLUSH_SECONDS = 5.0
+
+# GetBooks search modes
+SEARCH_NONE, SEARCH_FTS, SEARCH_LIKE = 0, 1, 2
+
+
+# SearchCriteria.SortBy values mapped to SQL sort columns (whitelist, never interpolated from input)
+BOOK_SORT_COLUMNS = {
+    "Title": "b.title",
+    "Author": "b.author",
+    "Authors": "b.author",
+    "Category": "c.category",
+    "Subject": "s.subject",
+    "Rating": "b.Rating",
+    "AddedDate": "b.id",
+    "LastOpened": "b.last_opened",
+}
+
+
+def _InList(Column: str, Count: int) -> str:
+    """Equality for one value, a parameterized IN-list for several."""
+    if Count == 1:
+        return f"{Column} = ?"
+    return f"{Column} IN ({','.join('?' * Count)})"
+
+
+@lru_cache(maxsize=256)
+def _GetBookQuery(SearchMode: int, CategoryCount: int = 0, SubjectCount: int = 0,
+                  AuthorCount: int = 0, HasMinRating: bool = False, HasMaxRating: bool = False,
+                  SortBy: str = "Title", SortOrder: str = "ASC", Paged: bool = False,
+                  IncludeThumbnails: bool = True) -> str:
+    """
+    Build one GetBooks SQL variant, memoized per filter shape.
+    Reusing identical SQL strings keeps each variant hot in sqlite3's statement cache.
+    Parameter order: search term(s), categories, subjects, authors, min/max rating, limit, offset.
+    """
+    # Columns in BookRow order; display defaults are applied by SQLite, not per row in Python.
+    # Without thumbnails the BLOB column is NULL, so the row shape stays the same.
+    ThumbnailColumn = "b.ThumbnailImage" if IncludeThumbnails else "NULL"
+    Query = f"""
+        SELECT b.id, b.title,
+               COALESCE(NULLIF(b.author, ''), 'Unknown Author'),
+               COALESCE(NULLIF(c.category, ''), 'General') as Category,
+               COALESCE(NULLIF(s.subject, ''), 'General') as Subject,
+               COALESCE(b.FilePath, ''), {ThumbnailColumn},
+               b.last_opened, COALESCE(b.Rating, 0), COALESCE(b.Notes, '')
+    """
+    JoinClause = """
+        LEFT JOIN categories c ON b.category_id = c.id
+        LEFT JOIN subjects s ON b.subject_id = s.id
+    """
+    if SearchMode == SEARCH_FTS:
+        Query += "FROM books_fts f JOIN books b ON b.id = f.rowid" + JoinClause
+        Conditions = ["books_fts MATCH ?"]
+    else:
+        Query += "FROM books b" + JoinClause
+        Conditions = []
+    if SearchMode == SEARCH_LIKE:
+        Conditions.append("(b.title LIKE ? OR b.author LIKE ?)")
+    if CategoryCount:
+        Conditions.append(_InList("c.category", CategoryCount))
+    if SubjectCount:
+        Conditions.append(_InList("s.subject", SubjectCount))
+    if AuthorCount:
+        Conditions.append(_InList("b.author", AuthorCount))
+    if HasMinRating:
+        Conditions.append("b.Rating >= ?")
+    if HasMaxRating:
+        Conditions.append("b.Rating <= ?")
+    if Conditions:
+        Query += "WHERE " + " AND ".join(Conditions)
+    
+    SortColumn = BOOK_SORT_COLUMNS.get(SortBy, "b.title")
+    Direction = "DESC" if SortOrder == "DESC" else "ASC"
+    Query += f" ORDER BY {SortColumn} {Direction}"
+    if SortColumn != "b.title":
+        Query += ", b.title"
+    if Paged:
+        Query += " LIMIT ? OFFSET ?"
+    return Query
+
+
+@lru_cache(maxsize=64)
+def _CompileBookQuery(SearchMode: int, CategoryCount: int = 0, SubjectCount: int = 0,
+                      AuthorCount: int = 0, HasMinRating: bool = False, HasMaxRating: bool = False,
+                      SortBy: str = "Title", SortOrder: str = "ASC", Paged: bool = False,
+                      IncludeThumbnails: bool = True) -> Tuple[str, Callable[..., tuple]]:
+    """
+    Compile one GetBooks filter shape into its SQL and a parameter builder.
+    The builder takes (search parameters, categories, subjects, authors,
+    (min rating, max rating, limit, offset)) and returns the bound parameter tuple;
+    which scalars apply is decided here once, not on every call.
+    """
+    Query = _GetBookQuery(SearchMode, CategoryCount, SubjectCount, AuthorCount,
+                          HasMinRating, HasMaxRating, SortBy, SortOrder, Paged, IncludeThumbnails)
+    ScalarIndexes = tuple(Index for Index, Active in
+                          enumerate((HasMinRating, HasMaxRating, Paged, Paged)) if Active)
+    
+    if not ScalarIndexes:
+        def BuildParameters(Search, Categories, Subjects, Authors, Scalars) -> tuple:
+            return (*Search, *Categories, *Subjects, *Authors)
+    else:
+        def BuildParameters(Search, Categories, Subjects, Authors, Scalars) -> tuple:
+            return (*Search, *Categories, *Subjects, *Authors,
+                    *[Scalars[Index] for Index in ScalarIndexes])
+    return Query, BuildParameters
+
+
+class BookRow(namedtuple('BookRow', 'id Title Author Category Subject FilePath ThumbnailData LastOpened Rating Notes')):
+    """
+    Immutable book record returned by GetBooks.
+    Keeps the dict-style reads callers use (get, [name], in) on a slot-free tuple.
+    """
+    __slots__ = ()
+    
+    def get(self, Key: str, Default: Any = None) -> Any:
+        return getattr(self, Key) if Key in self._fields else Default
+    
+    def __getitem__(self, Key):
+        if isinstance(Key, str):
+            return getattr(self, Key)
+        return tuple.__getitem__(self, Key)
+    
+    def __contains__(self, Key) -> bool:
+        return Key in self._fields
+    
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+
+def _BookRowFactory(Cursor: sqlite3.Cursor, Row: tuple) -> BookRow:
+    """Wrap a GetBooks result row as a BookRow (the SELECT already matches its field order)."""
+    return tuple.__new__(BookRow, Row)
 
 
 class DatabaseManager:
@@ -22,125 +235,376 @@ class DatabaseManager:
     Optimized for web/mobile deployment with minimal Google Drive interactions.
     """
     
-    def __init__(self, DatabasePath: str = "Data/Databases/MyLibrary.db"):
+    # Fixed attribute layout: slot loads instead of __dict__ lookups on hot paths
+    __slots__ = (
+        "DatabasePath", "Logger", "FtsAvailable",
+        "_Local", "_Connections", "_ConnectionsLock",
+        "_MetadataGeneration", "_MetadataCache",
+        "_DataGeneration", "_StatsCache", "_StatsThread",
+        "_PendingLastOpened", "_PendingLastOpenedSince", "_PendingLock",
+    )
+    
+    # One-time schema setup results per database file: resolved path -> FTS5 available
+    _InitializedDatabases: Dict[str, bool] = {}
+    _InitializeLock = threading.Lock()
+    
+    def __init__(self, DatabasePath: str = DEFAULT_DATABASE_PATH):
         self.DatabasePath = DatabasePath
-        self.Connection = None
         self.Logger = logging.getLogger(self.__class__.__name__)
+        
+        # Connection pool: one connection per thread, tracked for Close()
+        self._Local = threading.local()
+        self._Connections: List[sqlite3.Connection] = []
+        self._ConnectionsLock = threading.Lock()
+        
+        # Category/subject lookup cache: key -> (generation, values)
+        self._MetadataGeneration = 0
+        self._MetadataCache: Dict[tuple, Tuple[int, List[str]]] = {}
+        
+        # Statistics snapshot: (data generation, stats), prefetched in the background
+        self._DataGeneration = 0
+        self._StatsCache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._StatsThread: Optional[threading.Thread] = None
+        
+        # Buffered last_opened updates: (epoch seconds, book id) pairs awaiting one batched write
+        self._PendingLastOpened: List[Tuple[float, int]] = []
+        self._PendingLastOpenedSince = 0.0
+        self._PendingLock = threading.Lock()
+        
+        # FTS5 may be missing from the SQLite build (set by InitializeSchema)
+        self.FtsAvailable = False
+        
         self.EnsureDatabaseDirectory()
-        self.Connect()
+        if not self.Connect():
+            raise ConnectionError(f"Could not connect to database: {DatabasePath}")
+    
+    @property
+    def Connection(self) -> Optional[sqlite3.Connection]:
+        """Connection owned by the calling thread, or None if not yet opened."""
+        return getattr(self._Local, 'Connection', None)
     
     def EnsureDatabaseDirectory(self):
         """Ensure the database directory exists."""
         DatabaseDir = Path(self.DatabasePath).parent
         DatabaseDir.mkdir(parents=True, exist_ok=True)
     
+    def _CreateConnection(self) -> sqlite3.Connection:
+        """Open and tune a new connection for the calling thread."""
+        Connection = sqlite3.connect(
+            self.DatabasePath,
+            check_same_thread=False,  # Close() may run on another thread
+            cached_statements=100     # Reuse prepared statements for hot queries
+        )
+        # Default tuple rows: cheaper than sqlite3.Row, callers index by position
+        
+        # Cheap per-connection tuning; WAL mode is persistent and set by InitializeSchema
+        Connection.execute("PRAGMA busy_timeout=5000")
+        Connection.execute("PRAGMA wal_autocheckpoint=1000")
+        Connection.execute("PRAGMA synchronous=NORMAL")
+        Connection.execute("PRAGMA temp_store=MEMORY")
+        Connection.execute("PRAGMA cache_size=-65536")
+        Connection.execute("PRAGMA mmap_size=268435456")
+        
+        self._Local.Connection = Connection
+        with self._ConnectionsLock:
+            self._Connections.append(Connection)
+        return Connection
+    
+    def _GetConnection(self) -> Optional[sqlite3.Connection]:
+        """Get the calling thread's connection, opening it on first use."""
+        try:
+            return self._Local.Connection
+        except AttributeError:
+            try:
+                return self._CreateConnection()
+            except sqlite3.Error as Error:
+                self.Logger.error(f"Database connection failed: {Error}")
+                return None
+    
     def Connect(self) -> bool:
-        """Connect to the SQLite database."""
+        """Connect to the SQLite database (no-op if this thread is already connected)."""
+        if self.Connection is not None:
+            return True
+        
         try:
-            self.Connection = sqlite3.connect(self.DatabasePath)
-            self.Connection.row_factory = sqlite3.Row  # Enable column access by name
+            self.FtsAvailable = self.InitializeSchema(self.DatabasePath)
+            
+            Connection = self._GetConnection()
+            if Connection is None:
+                return False
             
-            # Test connection
-            Cursor = self.Connection.cursor()
-            Cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            Tables = Cursor.fetchall()
-            TableCount = len(Tables)
+            # Schema scan is only worth doing when someone will read the log line
+            if self.Logger.isEnabledFor(logging.DEBUG):
+                TableCount = Connection.execute(
+                    "SELECT COUNT(*) FROM sqlite_master WHERE type='table'"
+                ).fetchone()[0]
+                self.Logger.debug(f"Database connection successful: {TableCount} tables found")
             
-            self.Logger.info(f"Database connection successful: {TableCount} tables found")
+            # Prefetch statistics so the first status bar update is a cache hit
+            if self._StatsCache is None and self._StatsThread is None:
+                self._StatsThread = threading.Thread(target=self._RefreshStats, daemon=True)
+                self._StatsThread.start()
             return True
             
         except Exception as Error:
             self.Logger.error(f"Database connection failed: {Error}")
             return False
     
+    @classmethod
+    def InitializeSchema(cls, DatabasePath: str = DEFAULT_DATABASE_PATH) -> bool:
+        """
+        One-time database setup: WAL journal mode, filter indexes and FTS5 search schema.
+        Runs once per database file per process; later calls are a dictionary lookup.
+        
+        Args:
+            DatabasePath: Path to the SQLite database file
+            
+        Returns:
+            True if FTS5 full-text search is available
+        """
+        Key = str(Path(DatabasePath).resolve())
+        with cls._InitializeLock:
+            if Key in cls._InitializedDatabases:
+                return cls._InitializedDatabases[Key]
+            
+            Logger = logging.getLogger(cls.__name__)
+            FtsAvailable = False
+            Connection = None
+            try:
+                Path(DatabasePath).parent.mkdir(parents=True, exist_ok=True)
+                Connection = sqlite3.connect(DatabasePath)
+                Connection.execute("PRAGMA journal_mode=WAL")
+                
+                # Filter/sort indexes in one transaction; refresh planner stats when they change
+                CountIndexesSql = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'"
+                IndexesBefore = Connection.execute(CountIndexesSql).fetchone()[0]
+                Connection.executescript("BEGIN;\n" + ";\n".join(FILTER_INDEX_SQL) + ";\nCOMMIT;")
+                IndexesAfter = Connection.execute(CountIndexesSql).fetchone()[0]
+                HasStats = Connection.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+                ).fetchone()
+                if IndexesAfter != IndexesBefore or not HasStats:
+                    Connection.execute("ANALYZE")
+                    Connection.commit()
+                
+                Existing = Connection.execute(
+                    "SELECT sql FROM sqlite_master WHERE name = 'books_fts'"
+                ).fetchone()
+                if Existing and "trigram" not in Existing[0]:
+                    Connection.executescript(DROP_SEARCH_SCHEMA_SQL)
+                    Existing = None
+                Connection.executescript(SEARCH_SCHEMA_SQL)
+                if not Existing:
+                    # Populate the index from the existing books table
+                    Connection.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+                    Connection.commit()
+                    Logger.info("Built full-text search index for books")
+                
+                FtsAvailable = True
+                
+            except sqlite3.Error as Error:
+                Logger.warning(f"Schema setup incomplete, using LIKE search: {Error}")
+            finally:
+                if Connection is not None:
+                    Connection.close()
+            
+            cls._InitializedDatabases[Key] = FtsAvailable
+            return FtsAvailable
+    
+    @staticmethod
+    def BuildFtsQuery(SearchTerm: str) -> Optional[str]:
+        """
+        Build an FTS5 trigram query from a search term.
+        The whole term is one quoted phrase, so it matches as a substring of the
+        title or author, the same as LIKE '%term%' (including infix hits).
+        
+        Returns:
+            MATCH expression, or None if the term needs the LIKE fallback
+            (shorter than 3 characters, or containing LIKE wildcards)
+        """
+        if len(SearchTerm) < FTS_MIN_TERM_LENGTH or LIKE_WILDCARD_PATTERN.search(SearchTerm):
+            return None
+        Escaped = SearchTerm.replace('"', '""')
+        return f'"{Escaped}"'
+    
     def Close(self):
-        """Close the database connection properly."""
+        """Close all pooled database connections properly."""
+        self._FlushLastOpened()
         try:
-            if self.Connection:
-                self.Connection.close()
-                self.Connection = None
+            with self._ConnectionsLock:
+                Connections, self._Connections = self._Connections, []
+            for Connection in Connections:
+                Connection.close()
+            self._Local = threading.local()
+            if Connections:
                 self.Logger.info("Database connection closed successfully")
         except Exception as Error:
             self.Logger.error(f"Error closing database connection: {Error}")
     
-    def ExecuteQuery(self, Query: str, Parameters: Tuple = ()) -> List[sqlite3.Row]:
-        """Execute a SQL query with proper error handling."""
+    def ExecuteQuery(self, Query: str, Parameters: Tuple = (), AsDict: bool = False,
+                     RowFactory: Optional[Any] = None) -> List[Any]:
+        """
+        Execute a SQL query with proper error handling.
+        
+        Args:
+            Query: SQL statement
+            Parameters: Bound parameters
+            AsDict: Return SELECT rows as dicts keyed by column name
+            RowFactory: Optional row factory for this query's cursor only
+            
+        Returns:
+            List of row tuples (or dicts when AsDict is set); empty for non-SELECT
+        """
+        Logger = self.Logger
         try:
-            if not self.Connection:
-                self.Logger.error("No database connection available")
+            Connection = self._GetConnection()
+            if Connection is None:
+                Logger.error("No database connection available")
                 return []
             
-            Cursor = self.Connection.cursor()
+            Cursor = Connection.cursor()
+            if RowFactory is not None:
+                Cursor.row_factory = RowFactory
             Cursor.execute(Query, Parameters)
             
-            # For SELECT queries, return results
-            if Query.strip().upper().startswith('SELECT'):
-                Results = Cursor.fetchall()
-                return Results
+            # Queries producing rows (SELECT/WITH) have a description
+            Description = Cursor.description
+            if Description is not None:
+                if AsDict:
+                    # Column names resolved once per query, not once per row
+                    Columns = [Column[0] for Column in Description]
+                    return [dict(zip(Columns, Row)) for Row in Cursor.fetchall()]
+                return Cursor.fetchall()
             else:
                 # For INSERT/UPDATE/DELETE queries, commit changes
-                self.Connection.commit()
+                Connection.commit()
+                self._DataGeneration += 1
+                if METADATA_WRITE_PATTERN.match(Query):
+                    self._MetadataGeneration += 1
                 return []
                 
         except sqlite3.Error as Error:
-            self.Logger.error(f"Database error: {Error}")
-            self.Logger.error(f"Query execution failed: {Query} - {Error}")
+            Logger.error(f"Database error: {Error}")
+            Logger.error(f"Query execution failed: {Query} - {Error}")
             return []
         except Exception as Error:
-            self.Logger.error(f"Unexpected error executing query: {Error}")
+            Logger.error(f"Unexpected error executing query: {Error}")
             return []
     
-    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "") -> List[Dict[str, Any]]:
+    def ExecuteUpdateMany(self, Query: str, ParameterSets: Iterable[Tuple]) -> int:
+        """
+        Execute a write statement for many parameter sets in one transaction.
+        A single commit amortizes the journal sync across the whole batch.
+        
+        Args:
+            Query: INSERT/UPDATE/DELETE statement
+            ParameterSets: Iterable of parameter tuples
+            
+        Returns:
+            Number of rows affected (0 on failure)
+        """
+        try:
+            Connection = self._GetConnection()
+            if Connection is None:
+                self.Logger.error("No database connection available")
+                return 0
+            
+            with Connection:  # BEGIN ... COMMIT (ROLLBACK on error)
+                Cursor = Connection.executemany(Query, ParameterSets)
+            
+            self._DataGeneration += 1
+            if METADATA_WRITE_PATTERN.match(Query):
+                self._MetadataGeneration += 1
+            return Cursor.rowcount
+            
+        except sqlite3.Error as Error:
+            self.Logger.error(f"Batch execution failed: {Query} - {Error}")
+            return 0
+    
+    def ExecuteQueryOne(self, Query: str, Parameters: Tuple = ()) -> Optional[tuple]:
+        """Execute a SELECT and return only the first row (or None)."""
+        try:
+            Connection = self._GetConnection()
+            if Connection is None:
+                self.Logger.error("No database connection available")
+                return None
+            
+            return Connection.execute(Query, Parameters).fetchone()
+            
+        except sqlite3.Error as Error:
+            self.Logger.error(f"Query execution failed: {Query} - {Error}")
+            return None
+    
+    def ExecuteQueryIter(self, Query: str, Parameters: Tuple = ()) -> Iterator[tuple]:
+        """Execute a SELECT and yield rows one at a time for large result sets."""
+        Connection = self._GetConnection()
+        if Connection is None:
+            self.Logger.error("No database connection available")
+            return
+        
+        try:
+            yield from Connection.execute(Query, Parameters)
+        except sqlite3.Error as Error:
+            self.Logger.error(f"Query execution failed: {Query} - {Error}")
+    
+    def GetBooks(self, Category: str = "", Subject: str = "", SearchTerm: str = "",
+                 Criteria: Optional[Any] = None, IncludeThumbnails: bool = True) -> List[BookRow]:
         """
         NEW SCHEMA - Get books using JOINs for relational schema.
         Returns books with category/subject names and BLOB thumbnail data.
+        
+        Args:
+            Category: Single category name filter
+            Subject: Single subject name filter
+            SearchTerm: Title/author search text
+            Criteria: Optional SearchCriteria; its Categories/Subjects/Authors lists,
+                rating range, sort and Limit/Offset are applied in a single query
+            IncludeThumbnails: Select thumbnail BLOBs; when False ThumbnailData is None
+                (load it later with GetThumbnailBlob)
+            
+        Returns:
+            List of BookRow records
         """
         try:
-            # NEW SCHEMA: Use JOINs to get category and subject names
-            Query = """
-                SELECT b.id, b.title, b.author, b.FilePath, b.ThumbnailImage,
-                       c.category as Category, s.subject as Subject,
-                       b.last_opened, b.Rating, b.Notes
-                FROM books b
-                LEFT JOIN categories c ON b.category_id = c.id
-                LEFT JOIN subjects s ON b.subject_id = s.id
-                WHERE 1=1
-            """
-            Parameters = []
+            if Criteria is not None:
+                SearchTerm = Criteria.SearchTerm or ""
+                Categories = [Name for Name in Criteria.Categories if Name != "All Categories"]
+                Subjects = [Name for Name in Criteria.Subjects if Name != "All Subjects"]
+                Authors = list(Criteria.Authors)
+                MinRating, MaxRating = Criteria.MinRating, Criteria.MaxRating
+                SortBy, SortOrder = Criteria.SortBy, Criteria.SortOrder.upper()
+                Limit, Offset = Criteria.Limit, Criteria.Offset
+            else:
+                Categories = [Category] if Category and Category != "All Categories" else []
+                Subjects = [Subject] if Subject and Subject != "All Subjects" else []
+                Authors = []
+                MinRating = MaxRating = Limit = None
+                SortBy, SortOrder, Offset = "Title", "ASC", 0
             
-            if Category and Category != "All Categories":
-                Query += " AND c.category = ?"
-                Parameters.append(Category)
+            SearchMode, SearchParameters = SEARCH_NONE, ()
+            if SearchTerm:
+                FtsQuery = self.BuildFtsQuery(SearchTerm) if self.FtsAvailable else None
+                if FtsQuery:
+                    SearchMode, SearchParameters = SEARCH_FTS, (FtsQuery,)
+                else:
+                    # Fallback for terms too short for trigrams (e.g. "ja")
+                    SearchPattern = f"%{SearchTerm}%"
+                    SearchMode, SearchParameters = SEARCH_LIKE, (SearchPattern, SearchPattern)
             
-            if Subject and Subject != "All Subjects":
-                Query += " AND s.subject = ?"
-                Parameters.append(Subject)
+            # Paging is pushed into SQL; LIMIT -1 means no limit
+            Paged = Limit is not None or bool(Offset)
             
-            if SearchTerm:
-                Query += " AND (b.title LIKE ? OR b.author LIKE ?)"
-                SearchPattern = f"%{SearchTerm}%"
-                Parameters.extend([SearchPattern, SearchPattern])
-            
-            Query += " ORDER BY b.title"
-            
-            Rows = self.ExecuteQuery(Query, tuple(Parameters))
-            
-            # Convert rows to dictionaries with proper field names
-            Books = []
-            for Row in Rows:
-                BookDict = {
-                    'id': Row['id'],
-                    'Title': Row['title'],
-                    'Author': Row['author'] or 'Unknown Author',  
-                    'Category': Row['Category'] or 'General',
-                    'Subject': Row['Subject'] or 'General',
-                    'FilePath': Row['FilePath'] or '',
-                    'ThumbnailData': Row['ThumbnailImage'],  # BLOB data for thumbnail
-                    'LastOpened': Row['last_opened'],
-                    'Rating': Row['Rating'] or 0,
-                    'Notes': Row['Notes'] or ''
-                }
-                Books.append(BookDict)
+            # SQL and parameter order come precompiled for this filter shape
+            Query, BuildParameters = _CompileBookQuery(
+                SearchMode, len(Categories), len(Subjects), len(Authors),
+                MinRating is not None, MaxRating is not None, SortBy, SortOrder, Paged,
+                IncludeThumbnails
+            )
+            Parameters = BuildParameters(SearchParameters, Categories, Subjects, Authors,
+                                         (MinRating, MaxRating, -1 if Limit is None else Limit, Offset))
+            
+            # Rows are materialized as BookRow by a cursor-scoped row factory
+            Books = self.ExecuteQuery(Query, Parameters, RowFactory=_BookRowFactory)
             
             self.Logger.info(f"Retrieved {len(Books)} books using new relational schema")
             return Books
@@ -149,11 +613,27 @@ class DatabaseManager:
             self.Logger.error(f"Failed to get books: {Error}")
             return []
     
+    def _GetCachedMetadata(self, Key: tuple) -> Optional[List[str]]:
+        """Return a cached category/subject list if it is still current."""
+        Cached = self._MetadataCache.get(Key)
+        if Cached is not None and Cached[0] == self._MetadataGeneration:
+            return list(Cached[1])
+        return None
+    
+    def _StoreCachedMetadata(self, Key: tuple, Values: List[str]) -> None:
+        """Cache a category/subject list under the current generation."""
+        self._MetadataCache[Key] = (self._MetadataGeneration, list(Values))
+    
     def GetCategories(self) -> List[str]:
         """NEW SCHEMA - Get categories from categories table."""
         try:
+            Cached = self._GetCachedMetadata(('Categories',))
+            if Cached is not None:
+                return Cached
+            
             Rows = self.ExecuteQuery("SELECT category FROM categories ORDER BY category")
             Categories = [Row[0] for Row in Rows if Row[0]]
+            self._StoreCachedMetadata(('Categories',), Categories)
             self.Logger.info(f"Retrieved {len(Categories)} categories from categories table")
             return Categories
         except Exception as Error:
@@ -163,6 +643,11 @@ class DatabaseManager:
     def GetSubjects(self, Category: str = "") -> List[str]:
         """NEW SCHEMA - Get subjects using JOIN with categories table."""
         try:
+            CacheKey = ('Subjects', Category)
+            Cached = self._GetCachedMetadata(CacheKey)
+            if Cached is not None:
+                return Cached
+            
             if Category and Category != "All Categories":
                 # Get subjects for specific category
                 Query = """
@@ -180,49 +665,121 @@ class DatabaseManager:
             
             Rows = self.ExecuteQuery(Query, Parameters)
             Subjects = [Row[0] for Row in Rows if Row[0]]
+            self._StoreCachedMetadata(CacheKey, Subjects)
             self.Logger.info(f"Retrieved {len(Subjects)} subjects for category '{Category}'")
             return Subjects
         except Exception as Error:
             self.Logger.error(f"Failed to get subjects: {Error}")
             return []
     
-    def UpdateLastOpened(self, BookTitle: str):
-        """Update last opened timestamp for a book."""
+    def UpdateLastOpened(self, BookId: int):
+        """
+        Update last opened timestamp for a book.
+        The write is buffered and flushed in batches (see _FlushLastOpened).
+        
+        Args:
+            BookId: Database ID of the book
+        """
         try:
-            from datetime import datetime
-            Timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            OpenedAt = time.time()  # Formatted by SQLite at flush time
+            Now = time.monotonic()
+            
+            with self._PendingLock:
+                if not self._PendingLastOpened:
+                    self._PendingLastOpenedSince = Now
+                self._PendingLastOpened.append((OpenedAt, BookId))
+                FlushDue = (len(self._PendingLastOpened) >= LAST_OPENED_FLUSH_COUNT
+                            or Now - self._PendingLastOpenedSince >= LAST_OPENED_FLUSH_SECONDS)
             
-            # Update using book title
-            self.ExecuteQuery("UPDATE books SET last_opened = ? WHERE title = ?", (Timestamp, BookTitle))
-            self.Logger.info(f"Updated last_opened for book: {BookTitle}")
+            if FlushDue:
+                self._FlushLastOpened()
+            self.Logger.debug(f"Queued last_opened update for book ID: {BookId}")
             
         except Exception as Error:
             self.Logger.warning(f"Could not update last opened time: {Error}")
     
-    def GetDatabaseStats(self) -> Dict[str, int]:
-        """Get database statistics from the new schema."""
-        Stats = {}
+    def _FlushLastOpened(self) -> int:
+        """
+        Write all buffered last_opened updates in one executemany transaction.
+        Called when the buffer is full or stale, before statistics are read and on Close().
         
+        Returns:
+            Number of rows updated
+        """
+        with self._PendingLock:
+            Pending, self._PendingLastOpened = self._PendingLastOpened, []
+        if not Pending:
+            return 0
+        
+        Updated = self.ExecuteUpdateMany(LAST_OPENED_UPDATE_SQL, Pending)
+        self.Logger.info(f"Flushed {len(Pending)} last_opened updates ({Updated} rows)")
+        return Updated
+    
+    def BulkUpdateLastOpened(self, BookIds: List[int]) -> int:
+        """
+        Update last opened timestamp for many books in a single transaction.
+        
+        Args:
+            BookIds: Database IDs of the books
+            
+        Returns:
+            Number of books updated
+        """
+        OpenedAt = time.time()
+        Updated = self.ExecuteUpdateMany(
+            LAST_OPENED_UPDATE_SQL,
+            ((OpenedAt, BookId) for BookId in BookIds)
+        )
+        self.Logger.info(f"Updated last_opened for {Updated} books")
+        return Updated
+    
+    def _QueryDatabaseStats(self) -> Dict[str, Any]:
+        """Run the single-round-trip statistics query."""
+        Row = self.ExecuteQueryOne(DATABASE_STATS_SQL)
+        if not Row:
+            return {'Categories': 0, 'Subjects': 0, 'Books': 0, 'RecentBooks': []}
+        
+        return {
+            'Categories': Row[0],
+            'Subjects': Row[1],
+            'Books': Row[2],
+            'RecentBooks': json.loads(Row[3]) if Row[3] else []
+        }
+    
+    def _RefreshStats(self) -> None:
+        """Recompute statistics and cache them under the current data generation."""
         try:
-            # Get category count
-            CategoryRows = self.ExecuteQuery("SELECT COUNT(*) FROM categories")
-            Stats['Categories'] = CategoryRows[0][0] if CategoryRows else 0
+            Generation = self._DataGeneration
+            self._StatsCache = (Generation, self._QueryDatabaseStats())
+        except Exception as Error:
+            self.Logger.error(f"Failed to refresh database stats: {Error}")
+    
+    def GetDatabaseStats(self) -> Dict[str, Any]:
+        """
+        Get database statistics from the new schema.
+        Served from cache until a write changes the database; the first snapshot
+        is prefetched on a background thread when the connection is opened.
+        """
+        try:
+            # Recent-books list must reflect buffered opens
+            self._FlushLastOpened()
             
-            # Get subject count  
-            SubjectRows = self.ExecuteQuery("SELECT COUNT(*) FROM subjects")
-            Stats['Subjects'] = SubjectRows[0][0] if SubjectRows else 0
+            StatsThread = self._StatsThread
+            if StatsThread is not None and StatsThread.is_alive():
+                StatsThread.join()
             
-            # Get book count
-            BookRows = self.ExecuteQuery("SELECT COUNT(*) FROM books")
-            Stats['Books'] = BookRows[0][0] if BookRows else 0
+            Cached = self._StatsCache
+            if Cached is None or Cached[0] != self._DataGeneration:
+                self._RefreshStats()
+                Cached = self._StatsCache
             
+            Stats = dict(Cached[1])
             self.Logger.info(f"Database stats: {Stats['Books']} books, {Stats['Categories']} categories, {Stats['Subjects']} subjects")
+            return Stats
             
         except Exception as Error:
             self.Logger.error(f"Failed to get database stats: {Error}")
-            Stats = {'Categories': 0, 'Subjects': 0, 'Books': 0}
-        
-        return Stats
+            return {'Categories': 0, 'Subjects': 0, 'Books': 0, 'RecentBooks': []}
     
     def GetThumbnailBlob(self, BookId: int) -> Optional[bytes]:
         """
@@ -235,9 +792,9 @@ class DatabaseManager:
             BLOB data as bytes, or None if not found
         """
         try:
-            Rows = self.ExecuteQuery("SELECT ThumbnailImage FROM books WHERE id = ?", (BookId,))
-            if Rows and Rows[0][0]:
-                return Rows[0][0]  # Return BLOB data
+            Row = self.ExecuteQueryOne("SELECT ThumbnailImage FROM books WHERE id = ?", (BookId,))
+            if Row and Row[0]:
+                return Row[0]  # Return BLOB data
             return None
         except Exception as Error:
             self.Logger.error(f"Failed to get thumbnail for book ID {BookId}: {Error}")
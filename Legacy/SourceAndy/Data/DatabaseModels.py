@@ -32,18 +32,20 @@ class Book:
     
     def __post_init__(self):
         """Validate and clean data after initialization"""
-        # Ensure title is not empty
-        if not self.Title or not self.Title.strip():
+        # Ensure title is not empty; strip once and reuse the result
+        Title = self.Title.strip() if self.Title else ""
+        if not Title:
             raise ValueError("Book title cannot be empty")
+        self.Title = Title
         
         # Clean whitespace
-        self.Title = self.Title.strip()
-        if self.Category:
-            self.Category = self.Category.strip()
-        if self.Subject:
-            self.Subject = self.Subject.strip()
-        if self.Authors:
-            self.Authors = self.Authors.strip()
+        Category, Subject, Authors = self.Category, self.Subject, self.Authors
+        if Category:
+            self.Category = Category.strip()
+        if Subject:
+            self.Subject = Subject.strip()
+        if Authors:
+            self.Authors = Authors.strip()
     
     def GetDisplayTitle(self) -> str:
         """Get title for display purposes"""
@@ -9,40 +9,295 @@ Enhanced book display grid with proper imports and resize handling.
 """
 
 import logging
-import math
-from typing import List, Dict, Optional
+import threading
+from collections import deque
+from typing import List, Dict, Deque, Optional, Callable
 from pathlib import Path
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame, QLabel,
-    QPushButton, QGridLayout, QSizePolicy, QApplication
+    QPushButton, QSizePolicy
+)
+from PySide6.QtCore import Qt, Signal, QTimer, QSize, QObject, QRunnable, QThreadPool
+from PySide6.QtGui import (
+    QPixmap, QPixmapCache, QImage, QImageReader, QFont, QFontMetrics, QPainter, QBrush, QColor
 )
-from PySide6.QtCore import Qt, Signal, QTimer, QSize
-from PySide6.QtGui import QPixmap, QFont, QPainter, QBrush, QColor
 
 from Source.Core.BookService import BookService
 
+# Application root (Source/Interface/ -> root) for asset and cover lookups
+APP_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# Shared worker pool for cover decoding
+COVER_THREAD_POOL = QThreadPool.globalInstance()
+
+# Process-wide cache for scaled covers (limit is in KB: 64 MB)
+QPixmapCache.setCacheLimit(65536)
+
+# Card title sizes shared by the stylesheet and the elide metrics
+GRID_TITLE_FONT_PX = 12
+GRID_TITLE_PADDING_PX = 4
+LIST_TITLE_FONT_PX = 14
+LIST_TITLE_PADDING_PX = 8
+
+# BookGrid stylesheet, built once at import instead of on every _SetupUI call
+BOOK_GRID_STYLESHEET = f"""
+    QScrollArea {{
+        border: none;
+        background-color: transparent;
+    }}
+
+    QScrollBar:vertical {{
+        background-color: rgba(255, 255, 255, 0.1);
+        width: 16px;
+        border-radius: 8px;
+        margin: 0;
+    }}
+
+    QScrollBar::handle:vertical {{
+        background-color: rgba(255, 255, 255, 0.3);
+        border-radius: 8px;
+        min-height: 30px;
+        margin: 2px;
+    }}
+
+    QScrollBar::handle:vertical:hover {{
+        background-color: rgba(255, 255, 255, 0.5);
+    }}
+
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+        border: none;
+        background: none;
+    }}
+
+    /* Book cards: parsed once here instead of per card */
+    QFrame#BookCard_grid, QFrame#BookCard_list {{
+        background-color: rgba(255, 255, 255, 0.1);
+        border-radius: 10px;
+    }}
+
+    QFrame#BookCard_grid:hover, QFrame#BookCard_list:hover {{
+        background-color: rgba(255, 255, 255, 0.2);
+        border: 3px solid #FFC107;
+    }}
+
+    QLabel#Cover {{
+        border: 2px solid #4CAF50;
+        border-radius: 8px;
+        background-color: rgba(255, 255, 255, 0.9);
+        padding: 2px;
+    }}
+
+    QLabel#Title {{
+        color: #FFFFFF;
+        font-weight: bold;
+        background-color: rgba(0, 0, 0, 0.7);
+        border-radius: 4px;
+    }}
+
+    QFrame#BookCard_grid QLabel#Title {{
+        font-size: {GRID_TITLE_FONT_PX}px;
+        padding: {GRID_TITLE_PADDING_PX}px;
+    }}
+
+    QFrame#BookCard_list QLabel#Title {{
+        font-size: {LIST_TITLE_FONT_PX}px;
+        padding: {LIST_TITLE_PADDING_PX}px;
+    }}
+"""
+
+# Grid titles wrap onto two lines of ~148px; elide to that width less slack for word breaks
+GRID_TITLE_ELIDE_WIDTH = 2 * 148 - 24
+_GridTitleMetrics: Optional[QFontMetrics] = None
+
+
+def GetGridTitleMetrics() -> QFontMetrics:
+    """Font metrics for grid card titles (bold, per the BookGrid stylesheet), created once."""
+    global _GridTitleMetrics
+    if _GridTitleMetrics is None:
+        TitleFont = QFont()
+        TitleFont.setPixelSize(GRID_TITLE_FONT_PX)
+        TitleFont.setBold(True)
+        _GridTitleMetrics = QFontMetrics(TitleFont)
+    return _GridTitleMetrics
+
+
+class CoverDecodeSignals(QObject):
+    """Delivers a decoded cover from a worker thread to the GUI thread (request id, image)."""
+    Decoded = Signal(int, QImage)
+
+
+class CoverDecodeTask(QRunnable):
+    """
+    Decode and smooth-scale one cover off the GUI thread.
+    Works on QImage only (QPixmap must stay on the GUI thread); the receiving
+    slot converts the result to a QPixmap.
+    """
+    
+    def __init__(self, RequestId: int, Source, TargetSize: QSize,
+                 ThumbnailProvider: Optional[Callable[[], Optional[Path]]] = None,
+                 DevicePixelRatio: float = 1.0):
+        super().__init__()
+        self.RequestId = RequestId
+        self.Source = Source  # Thumbnail BLOB bytes, a cover file path, or a BLOB loader callable
+        self.TargetSize = TargetSize
+        self.ThumbnailProvider = ThumbnailProvider  # Returns (and primes) the pre-scaled cache file
+        self.DevicePixelRatio = DevicePixelRatio  # TargetSize is physical pixels at this scale
+        self.Signals = CoverDecodeSignals()
+    
+    def run(self) -> None:
+        # Pre-scaled cache file: already card-sized, so a plain read with no scaling
+        if self.ThumbnailProvider is not None:
+            ThumbPath = self.ThumbnailProvider()
+            if ThumbPath is not None:
+                Image = QImageReader(str(ThumbPath)).read()
+                if not Image.isNull():
+                    self.Signals.Decoded.emit(self.RequestId, Image)
+                    return
+        
+        if callable(self.Source):
+            # Row was queried without its BLOB: fetch it here, off the GUI thread
+            self.Source = self.Source()
+            if not self.Source:
+                # No thumbnail stored: a null image tells the receiver to keep the placeholder
+                self.Signals.Decoded.emit(self.RequestId, QImage())
+                return
+        
+        if isinstance(self.Source, (bytes, bytearray, memoryview)):
+            Image = QImage()
+            Image.loadFromData(bytes(self.Source))
+        else:
+            Image = self._ReadScaled(str(self.Source))
+        if not Image.isNull() and Image.size() != Image.size().scaled(self.TargetSize, Qt.KeepAspectRatio):
+            Image = Image.scaled(self.TargetSize, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # Tell Qt the bitmap is already at physical resolution (QPixmap.fromImage keeps it)
+        Image.setDevicePixelRatio(self.DevicePixelRatio)
+        self.Signals.Decoded.emit(self.RequestId, Image)
+    
+    def _ReadScaled(self, CoverPath: str) -> QImage:
+        """
+        Read a cover file at thumbnail size: the decoder (e.g. libjpeg) downscales
+        while decoding, so full-resolution pixels are never materialized
+        """
+        Reader = QImageReader(CoverPath)
+        OriginalSize = Reader.size()
+        if OriginalSize.isValid():
+            Reader.setScaledSize(OriginalSize.scaled(self.TargetSize, Qt.KeepAspectRatio))
+        return Reader.read()
+
+
+def CoverCacheKey(BookId: int, ViewMode: str, DevicePixelRatio: float = 1.0) -> str:
+    """QPixmapCache key for a book's cover at the size used by the given view mode and screen scale"""
+    return f"book:{BookId}:{ViewMode}@{DevicePixelRatio:g}"
+
+
+def CreateCoverTask(RequestId: int, BookData: dict, ViewMode: str,
+                    Service: Optional[BookService] = None,
+                    DevicePixelRatio: float = 1.0) -> Optional[CoverDecodeTask]:
+    """
+    Build the decode task for one book's cover, or None if the book has no cover.
+    
+    Args:
+        RequestId: Id echoed back by the task's Decoded signal
+        BookData: Book row (BLOB-free rows are fetched by ID on the worker)
+        ViewMode: "grid" or "list"; selects the target size
+        Service: Optional BookService for BLOB fetches and the on-disk thumbnail cache
+        DevicePixelRatio: Screen scale; covers decode at physical pixel size
+    """
+    # Try to load cover from BLOB data first, then fall back to file-based cover
+    Source = BookData.get('ThumbnailData')
+    BookId = BookData.get('id')
+    if not Source:
+        CoverPath = APP_ROOT / "Data" / "Covers" / f"{BookData.get('ID', 0)}.jpg"
+        if CoverPath.exists():
+            Source = CoverPath
+        elif Service is not None and BookId is not None:
+            # Row came from a BLOB-free query; the worker fetches the thumbnail by ID
+            Source = lambda: Service.GetThumbnailBlob(BookId)
+        else:
+            return None  # No cover found - keep placeholder
+    
+    # Scale to fit the label based on view mode, in physical pixels so HiDPI
+    # screens show the bitmap 1:1 instead of upscaling a logical-size one
+    LogicalSize = QSize(56, 56) if ViewMode == "list" else QSize(156, 196)
+    TargetSize = QSize(int(LogicalSize.width() * DevicePixelRatio),
+                       int(LogicalSize.height() * DevicePixelRatio))
+    
+    # BLOB covers go through the on-disk thumbnail cache (written on first decode);
+    # its files are logical-size, so scaled screens decode the BLOB directly
+    ThumbnailProvider = None
+    if (Service is not None and BookId is not None and not isinstance(Source, Path)
+            and DevicePixelRatio == 1.0):
+        # A None BLOB makes EnsureThumbnail fetch it itself on a cache miss
+        Data = None if callable(Source) else Source
+        ThumbnailProvider = lambda: Service.EnsureThumbnail(BookId, ViewMode, Data)
+    
+    return CoverDecodeTask(RequestId, Source, TargetSize, ThumbnailProvider, DevicePixelRatio)
+
+
+class BookLoadSignals(QObject):
+    """Delivers the loaded book list from a worker thread to the GUI thread (request id, books)."""
+    Loaded = Signal(int, list)
+
+
+class BookLoadTask(QRunnable):
+    """Load every book off the GUI thread, without cover BLOBs (cards fetch them by id)."""
+    
+    def __init__(self, RequestId: int, Service: BookService):
+        super().__init__()
+        self.RequestId = RequestId
+        self.Service = Service
+        self.Signals = BookLoadSignals()
+    
+    def run(self) -> None:
+        self.Signals.Loaded.emit(self.RequestId, self.Service.Query())
+
 
 class BookCard(QFrame):
     """
     Individual book card widget with enhanced styling.
     """
     
-    BookClicked = Signal(dict)
+    BookClicked = Signal(object)  # BookRow (a tuple subclass, so not Signal(dict))
     
-    def __init__(self, BookData: dict, ViewMode: str = "grid"):
-        super().__init__()
+    # One logger shared by every card instead of a getLogger lookup per card
+    Logger = logging.getLogger(__name__)
+    _Placeholders: Dict[str, QPixmap] = {}  # View mode -> placeholder, painted on first use
+    
+    def __init__(self, BookData: dict, ViewMode: str = "grid", Parent: Optional[QWidget] = None,
+                 BookService: Optional[BookService] = None):
+        super().__init__(Parent)
         
         self.BookData = BookData
         self.ViewMode = ViewMode
-        self.Logger = logging.getLogger(__name__)
+        self.BookService = BookService  # Optional: supplies the pre-scaled thumbnail cache
+        
+        # Incremented per cover load so results for a previous binding are dropped
+        self._CoverRequestId = 0
         
         # Set up the card
         self._SetupCard()
+        self.SetBookData(BookData)
+    
+    def SetBookData(self, BookData: dict) -> None:
+        """
+        Rebind the card to another book (used when recycling pooled cards).
+        The card keeps its widgets; only the title text and cover change.
+        """
+        self.BookData = BookData
+        Title = BookData.get('Title', 'Unknown Title')
+        if self.ViewMode == "list":
+            self.TitleLabel.setText(Title)
+        else:
+            # Elide by rendered width, not character count
+            self.TitleLabel.setText(
+                GetGridTitleMetrics().elidedText(Title, Qt.ElideRight, GRID_TITLE_ELIDE_WIDTH)
+            )
         self._LoadBookCover()
     
     def _SetupCard(self) -> None:
-        """Setup the book card layout and styling"""
+        """Setup the book card layout (styling comes from BookGrid's stylesheet via object names)"""
+        self.setObjectName("BookCard_list" if self.ViewMode == "list" else "BookCard_grid")
         self.setFrameStyle(QFrame.Box | QFrame.Raised)
         self.setLineWidth(2)
         
@@ -61,7 +316,9 @@ class BookCard(QFrame):
         
         # Cover image label
         self.CoverLabel = QLabel()
+        self.CoverLabel.setObjectName("Cover")
         self.CoverLabel.setAlignment(Qt.AlignCenter)
+        self.CoverLabel.setScaledContents(False)  # Covers arrive at physical size; never stretch
         
         if self.ViewMode == "list":
             # Small icon for list view
@@ -71,111 +328,74 @@ class BookCard(QFrame):
             # Large icon for grid view
             self.CoverLabel.setMinimumSize(160, 200)
             self.CoverLabel.setMaximumSize(160, 200)
-            
-        self.CoverLabel.setStyleSheet("""
-            QLabel {
-                border: 2px solid #4CAF50;
-                border-radius: 8px;
-                background-color: rgba(255, 255, 255, 0.9);
-                padding: 2px;
-            }
-        """)
         Layout.addWidget(self.CoverLabel)
         
-        # Title label
-        Title = self.BookData.get('Title', 'Unknown Title')
+        # Title label (text is set by SetBookData)
+        self.TitleLabel = QLabel()
+        self.TitleLabel.setObjectName("Title")
         if self.ViewMode == "list":
             # Full title for list view
-            self.TitleLabel = QLabel(Title)
             self.TitleLabel.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-            self.TitleLabel.setWordWrap(True)
-            self.TitleLabel.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    font-size: 14px;
-                    font-weight: bold;
-                    background-color: rgba(0, 0, 0, 0.7);
-                    border-radius: 4px;
-                    padding: 8px;
-                }
-            """)
         else:
             # Truncated title for grid view
-            self.TitleLabel = QLabel(Title[:25] + "..." if len(Title) > 25 else Title)
             self.TitleLabel.setAlignment(Qt.AlignCenter)
-            self.TitleLabel.setWordWrap(True)
-            self.TitleLabel.setStyleSheet("""
-                QLabel {
-                    color: #FFFFFF;
-                    font-size: 12px;
-                    font-weight: bold;
-                    background-color: rgba(0, 0, 0, 0.7);
-                    border-radius: 4px;
-                    padding: 4px;
-                }
-            """)
+        self.TitleLabel.setWordWrap(True)
         Layout.addWidget(self.TitleLabel)
-        
-        # Set hover effects
-        self.setStyleSheet("""
-            QFrame {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-            }
-            QFrame:hover {
-                background-color: rgba(255, 255, 255, 0.2);
-                border: 3px solid #FFC107;
-            }
-        """)
+    
+    def _CoverCacheKey(self) -> Optional[str]:
+        """QPixmapCache key for this book's cover at this card's size"""
+        BookId = self.BookData.get('id')
+        return None if BookId is None else CoverCacheKey(BookId, self.ViewMode, self.devicePixelRatioF())
     
     def _LoadBookCover(self) -> None:
-        """Load and display the book cover"""
+        """Show a cached cover, or a placeholder while the cover decodes on the worker pool"""
+        self._CoverRequestId += 1
         try:
-            # Try to load cover from BLOB data first
-            if 'ThumbnailData' in self.BookData and self.BookData['ThumbnailData']:
+            CacheKey = self._CoverCacheKey()
+            if CacheKey is not None:
                 Pixmap = QPixmap()
-                if Pixmap.loadFromData(self.BookData['ThumbnailData']):
-                    # Scale to fit the label based on view mode
-                    if self.ViewMode == "list":
-                        ScaledPixmap = Pixmap.scaled(
-                            56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                        )
-                    else:
-                        ScaledPixmap = Pixmap.scaled(
-                            156, 196, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                        )
-                    self.CoverLabel.setPixmap(ScaledPixmap)
+                if QPixmapCache.find(CacheKey, Pixmap):
+                    self.CoverLabel.setPixmap(Pixmap)
                     return
-                else:
-                    self.Logger.warning(f"Failed to load thumbnail BLOB for book {self.BookData.get('ID', 'Unknown')}")
-            
-            # Fallback to file-based cover
-            CoverPath = Path(f"Data/Covers/{self.BookData.get('ID', 0)}.jpg")
-            if CoverPath.exists():
-                Pixmap = QPixmap(str(CoverPath))
-                if Pixmap.isNull():
-                    self.Logger.warning(f"Failed to load file-based cover from {CoverPath} for book {self.BookData.get('ID', 'Unknown')}")
-                if self.ViewMode == "list":
-                    ScaledPixmap = Pixmap.scaled(
-                        56, 56, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                else:
-                    ScaledPixmap = Pixmap.scaled(
-                        156, 196, Qt.KeepAspectRatio, Qt.SmoothTransformation
-                    )
-                self.CoverLabel.setPixmap(ScaledPixmap)
-                return
             
-            # No cover found - use placeholder
             self._CreatePlaceholder()
             
+            Task = CreateCoverTask(self._CoverRequestId, self.BookData, self.ViewMode,
+                                   self.BookService, self.devicePixelRatioF())
+            if Task is None:
+                return  # No cover found - keep placeholder
+            Task.Signals.Decoded.connect(self._OnCoverDecoded)
+            COVER_THREAD_POOL.start(Task)
+            
         except Exception as Error:
             self.Logger.error(f"Failed to load cover for book {self.BookData.get('ID', 'Unknown')}: {Error}")
             self._CreatePlaceholder()
     
+    def _OnCoverDecoded(self, RequestId: int, Image: QImage) -> None:
+        """Apply a decoded cover on the GUI thread if the card still shows that book"""
+        if RequestId != self._CoverRequestId:
+            return  # Card was rebound to another book while decoding
+        if Image.isNull():
+            # Undecodable, or a BLOB-free row whose book has no thumbnail stored
+            self.Logger.debug(f"No cover decoded for book {self.BookData.get('id', 'Unknown')}")
+            return
+        Pixmap = QPixmap.fromImage(Image)
+        CacheKey = self._CoverCacheKey()
+        if CacheKey is not None:
+            QPixmapCache.insert(CacheKey, Pixmap)
+        self.CoverLabel.setPixmap(Pixmap)
+    
     def _CreatePlaceholder(self) -> None:
-        """Create a placeholder image for books without covers"""
-        if self.ViewMode == "list":
+        """Show the shared placeholder image for books without covers"""
+        Placeholder = BookCard._Placeholders.get(self.ViewMode)
+        if Placeholder is None:
+            Placeholder = BookCard._PaintPlaceholder(self.ViewMode)
+        self.CoverLabel.setPixmap(Placeholder)
+    
+    @classmethod
+    def _PaintPlaceholder(cls, ViewMode: str) -> QPixmap:
+        """Paint the placeholder for a view mode once; every card shares the pixmap"""
+        if ViewMode == "list":
             Placeholder = QPixmap(56, 56)
             FontSize = 8
             Text = "No\nCover"
@@ -194,7 +414,8 @@ class BookCard(QFrame):
         Painter.drawText(Placeholder.rect(), Qt.AlignCenter, Text)
         Painter.end()
         
-        self.CoverLabel.setPixmap(Placeholder)
+        cls._Placeholders[ViewMode] = Placeholder
+        return Placeholder
     
     def mousePressEvent(self, event):
         """Handle mouse click on book card"""
@@ -212,10 +433,21 @@ class BookGrid(QWidget):
     - Enhanced resize handling
     - Better grid calculations
     - Improved performance
+    - Virtualized display: cards exist only for rows in view and are recycled on scroll
     """
     
-    BookSelected = Signal(dict)
-    BookOpened = Signal(dict)
+    # Card placement inside the scrollable content widget
+    GRID_MARGIN = 10
+    COLUMN_SPACING = 15
+    ROW_SPACING = 0
+    OVERSCAN_ROWS = 2  # Extra rows kept above/below the viewport for smooth scrolling
+    
+    # Cover prefetch pacing: gap between dispatches, and retry delay while the slider is held
+    PREFETCH_INTERVAL_MS = 5
+    PREFETCH_PAUSE_MS = 200
+    
+    BookSelected = Signal(object)  # BookRow
+    BookOpened = Signal(object)  # BookRow
     SelectionChanged = Signal(int)
     
     def __init__(self, BookService: BookService):
@@ -226,8 +458,24 @@ class BookGrid(QWidget):
         
         # Current state
         self.CurrentBooks: List[Dict] = []
-        self.CurrentFilters: Dict = {}
-        self.BookCards: List[BookCard] = []
+        
+        # Virtualized cards: book index -> card in view, plus idle cards ready for reuse
+        self._ActiveCards: Dict[int, BookCard] = {}
+        self._CardPool: List[BookCard] = []
+        
+        # Bumped whenever the book list is replaced, so a late background load is dropped
+        self._LoadRequestId = 0
+        
+        # Idle-time cover prefetch into QPixmapCache: pending books, in-flight
+        # request id -> cache key, and bytes prefetched against the cache limit
+        self._PrefetchQueue: Deque[Dict] = deque()
+        self._PrefetchInFlight: Dict[int, str] = {}
+        self._PrefetchRequestId = 0
+        self._PrefetchBytes = 0
+        self._PrefetchTimer = QTimer(self)
+        self._PrefetchTimer.setSingleShot(True)
+        self._PrefetchTimer.setInterval(self.PREFETCH_INTERVAL_MS)
+        self._PrefetchTimer.timeout.connect(self._PrefetchNext)
         
         # Layout settings
         self.ViewMode = "grid"
@@ -235,9 +483,17 @@ class BookGrid(QWidget):
         self.CardWidth = 180
         self.CardHeight = 280
         
+        # One debounce timer for resizes: restarting it coalesces a drag into a single reflow
+        self._ResizeTimer = QTimer(self)
+        self._ResizeTimer.setSingleShot(True)
+        self._ResizeTimer.setInterval(100)  # 100ms delay
+        self._ResizeTimer.timeout.connect(self.HandleResize)
+        
         # Initialize UI
         self._SetupUI()
-        self._LoadAllBooks()
+        
+        # Let the window paint with the placeholder first, then populate
+        QTimer.singleShot(0, self._LoadAllBooks)
         
         self.Logger.info("Book grid initialized with fixes")
     
@@ -255,71 +511,120 @@ class BookGrid(QWidget):
         self.ScrollArea.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         MainLayout.addWidget(self.ScrollArea)
         
-        # Create scrollable content widget
+        # Create scrollable content widget; its height reserves room for every row,
+        # but cards are only placed (by absolute position) for the rows in view
         self.ContentWidget = QWidget()
         self.ScrollArea.setWidget(self.ContentWidget)
+        self.ScrollArea.verticalScrollBar().valueChanged.connect(self._UpdateVisibleCards)
 
         # Add a label for the placeholder image
         self.PlaceholderLabel = QLabel(self.ContentWidget)
         self.PlaceholderLabel.setAlignment(Qt.AlignCenter)
-        self.PlaceholderLabel.setPixmap(QPixmap("Assets/BowersWorld.png"))
+        self.PlaceholderLabel.setPixmap(QPixmap(str(APP_ROOT / "Assets" / "BowersWorld.png")))
         self.PlaceholderLabel.setVisible(False)
         
-        # Create grid layout for book cards
-        self.GridLayout = QGridLayout(self.ContentWidget)
-        self.GridLayout.setVerticalSpacing(0)
-        self.GridLayout.setHorizontalSpacing(15)
-        self.GridLayout.setContentsMargins(10, 10, 10, 10)
-        
-        # Apply styling
-        self.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            
-            QScrollBar:vertical {
-                background-color: rgba(255, 255, 255, 0.1);
-                width: 16px;
-                border-radius: 8px;
-                margin: 0;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: rgba(255, 255, 255, 0.3);
-                border-radius: 8px;
-                min-height: 30px;
-                margin: 2px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: rgba(255, 255, 255, 0.5);
-            }
-            
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-            }
-        """)
+        # Apply styling (one module-level string shared by every BookGrid)
+        self.setStyleSheet(BOOK_GRID_STYLESHEET)
     
     def _LoadAllBooks(self) -> None:
-        """Load all books from the database"""
+        """Load all books from the database on a worker thread"""
         try:
             if self.BookService:
-                self.CurrentBooks = self.BookService.GetAllBooks()
-                self._UpdateDisplay()
-                self.Logger.info(f"Loaded {len(self.CurrentBooks)} books")
+                self._LoadRequestId += 1
+                Task = BookLoadTask(self._LoadRequestId, self.BookService)
+                Task.Signals.Loaded.connect(self._OnBooksLoaded)
+                COVER_THREAD_POOL.start(Task)
             
         except Exception as Error:
             self.Logger.error(f"Failed to load books: {Error}")
     
+    def _OnBooksLoaded(self, RequestId: int, Books: list) -> None:
+        """Show books from a background load (queued to the GUI thread)"""
+        try:
+            if RequestId != self._LoadRequestId:
+                return  # Superseded by a newer load, filter or SetBooks
+            
+            self.CurrentBooks = Books
+            self._UpdateDisplay()
+            self._StartThumbnailPriming()
+            self._StartCoverPrefetch()
+            self.Logger.info(f"Loaded {len(self.CurrentBooks)} books")
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to show loaded books: {Error}")
+    
+    def _StartCoverPrefetch(self) -> None:
+        """Queue every loaded book for idle-time decoding into QPixmapCache"""
+        self._PrefetchQueue = deque(self.CurrentBooks)
+        self._PrefetchBytes = 0
+        self._PrefetchTimer.start(0)
+    
+    def _PrefetchNext(self) -> None:
+        """Dispatch one cover decode for the next uncached book, then re-arm"""
+        try:
+            if self.ScrollArea.verticalScrollBar().isSliderDown():
+                # Interactive scrolling gets the worker pool; try again shortly
+                self._PrefetchTimer.start(self.PREFETCH_PAUSE_MS)
+                return
+            
+            # Keep decodes for visible cards ahead of prefetch in the pool queue
+            if len(self._PrefetchInFlight) >= COVER_THREAD_POOL.maxThreadCount():
+                self._PrefetchTimer.start()
+                return
+            
+            # Stop at 3/4 of the cache budget so visible covers are not evicted
+            Budget = QPixmapCache.cacheLimit() * 1024 * 3 // 4
+            DevicePixelRatio = self.devicePixelRatioF()
+            while self._PrefetchQueue and self._PrefetchBytes < Budget:
+                BookData = self._PrefetchQueue.popleft()
+                BookId = BookData.get('id')
+                if BookId is None:
+                    continue
+                CacheKey = CoverCacheKey(BookId, self.ViewMode, DevicePixelRatio)
+                if QPixmapCache.find(CacheKey, QPixmap()):
+                    continue
+                
+                self._PrefetchRequestId += 1
+                Task = CreateCoverTask(self._PrefetchRequestId, BookData, self.ViewMode,
+                                       self.BookService, DevicePixelRatio)
+                if Task is None:
+                    continue
+                self._PrefetchInFlight[self._PrefetchRequestId] = CacheKey
+                Task.Signals.Decoded.connect(self._OnPrefetchDecoded)
+                COVER_THREAD_POOL.start(Task)
+                self._PrefetchTimer.start()
+                return
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to prefetch covers: {Error}")
+    
+    def _OnPrefetchDecoded(self, RequestId: int, Image: QImage) -> None:
+        """Store a prefetched cover in QPixmapCache (queued to the GUI thread)"""
+        CacheKey = self._PrefetchInFlight.pop(RequestId, None)
+        if CacheKey is None or Image.isNull():
+            return
+        Pixmap = QPixmap.fromImage(Image)
+        if QPixmapCache.insert(CacheKey, Pixmap):
+            self._PrefetchBytes += Pixmap.width() * Pixmap.height() * Pixmap.depth() // 8
+    
+    def _StartThumbnailPriming(self) -> None:
+        """Fill the on-disk thumbnail cache for the whole library in the background"""
+        if self.BookService.IsThumbnailCachePrimed(self.ViewMode):
+            return  # Already warm; no thread, no directory scan
+        threading.Thread(
+            target=self.BookService.PrimeThumbnailCache,
+            args=(list(self.CurrentBooks), self.ViewMode),
+            daemon=True
+        ).start()
+    
     def _UpdateDisplay(self) -> None:
         """Update the book grid display"""
         try:
-            # Clear existing cards
-            self._ClearGrid()
-
+            # Visible cards are rebound in place by _UpdateVisibleCards; only an
+            # empty result needs every card released
             if not self.CurrentBooks:
+                self._ClearGrid()
+                self.ContentWidget.setFixedHeight(self.PlaceholderLabel.sizeHint().height())
                 self.PlaceholderLabel.setVisible(True)
                 return
             else:
@@ -327,78 +632,108 @@ class BookGrid(QWidget):
             
             # Calculate columns based on available width
             self._CalculateColumns()
-            
-            # Add book cards to grid
-            Row, Col = 0, 0
-            for BookData in self.CurrentBooks:
-                Card = BookCard(BookData, self.ViewMode)
-                Card.BookClicked.connect(self._OnBookSelected)
-                
-                self.GridLayout.addWidget(Card, Row, Col)
-                self.BookCards.append(Card)
-                
-                if self.ViewMode == "list":
-                    # List view: single column
-                    Row += 1
-                else:
-                    # Grid view: multiple columns
-                    Col += 1
-                    if Col >= self.ColumnsCount:
-                        Col = 0
-                        Row += 1
-            
-            # Add stretch to push everything to the left
-            if self.ViewMode == "list":
-                self.GridLayout.setRowStretch(Row, 1)
-            else:
-                self.GridLayout.setColumnStretch(Col + 1, 1)
-                self.GridLayout.setRowStretch(Row + 1, 1)
-            
-            # Process events to update display
-            QApplication.processEvents()
+            self._ReflowGrid()
             
             self.Logger.debug(f"Display updated with {len(self.CurrentBooks)} books in {self.ColumnsCount} columns")
             
         except Exception as Error:
             self.Logger.error(f"Failed to update display: {Error}")
     
-    def _ClearGrid(self) -> None:
-        """Clear all widgets from the grid"""
-        try:
-            # Remove all book cards
-            for Card in self.BookCards:
-                self.GridLayout.removeWidget(Card)
-                Card.deleteLater()
-            
-            self.BookCards.clear()
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to clear grid: {Error}")
+    def _ReflowGrid(self) -> None:
+        """
+        Re-position cards for the current column count without rebinding them.
+        Cards stay attached to their book index, so a reflow is only move() calls.
+        """
+        if not self.CurrentBooks:
+            return
+        
+        # Reserve scroll space for all rows; only visible rows get cards
+        RowCount = -(-len(self.CurrentBooks) // self.ColumnsCount)  # Integer ceiling
+        self.ContentWidget.setFixedHeight(
+            2 * self.GRID_MARGIN + RowCount * (self.CardHeight + self.ROW_SPACING)
+        )
+        self._UpdateVisibleCards()
     
-    def _CalculateColumns(self) -> None:
-        """Calculate optimal number of columns based on available width"""
+    def _UpdateVisibleCards(self, *_) -> None:
+        """Bind pooled cards to the rows inside the viewport (plus overscan), releasing the rest"""
         try:
-            if self.ViewMode == "list":
-                # List view: always single column
-                self.ColumnsCount = 1
+            BookCount = len(self.CurrentBooks)
+            if not BookCount:
                 return
-                
-            AvailableWidth = self.ScrollArea.viewport().width()
             
-            # Account for margins and spacing
-            UsableWidth = AvailableWidth - 40  # 20px margin on each side
+            Columns = self.ColumnsCount
+            RowPitch = self.CardHeight + self.ROW_SPACING
+            Top = self.ScrollArea.verticalScrollBar().value() - self.GRID_MARGIN
+            Bottom = Top + self.ScrollArea.viewport().height()
             
-            # Calculate number of columns
-            ColumnsCount = max(1, UsableWidth // (self.CardWidth + 15))  # 15px spacing
+            FirstRow = max(0, Top // RowPitch - self.OVERSCAN_ROWS)
+            LastRow = Bottom // RowPitch + self.OVERSCAN_ROWS
+            FirstIndex = FirstRow * Columns
+            EndIndex = min(BookCount, (LastRow + 1) * Columns)
             
-            # Limit to reasonable range
-            self.ColumnsCount = min(max(ColumnsCount, 2), 8)
+            # Return cards that scrolled out of range to the pool
+            for Index in [Index for Index in self._ActiveCards if not FirstIndex <= Index < EndIndex]:
+                Card = self._ActiveCards.pop(Index)
+                Card.hide()
+                self._CardPool.append(Card)
             
-            self.Logger.debug(f"Calculated {self.ColumnsCount} columns for width {AvailableWidth}")
+            for Index in range(FirstIndex, EndIndex):
+                BookData = self.CurrentBooks[Index]
+                Card = self._ActiveCards.get(Index)
+                if Card is None:
+                    Card = self._AcquireCard(BookData)
+                    self._ActiveCards[Index] = Card
+                elif Card.BookData is not BookData:
+                    Card.SetBookData(BookData)
+                
+                Row, Col = divmod(Index, Columns)
+                Card.move(self.GRID_MARGIN + Col * (self.CardWidth + self.COLUMN_SPACING),
+                          self.GRID_MARGIN + Row * RowPitch)
+                Card.show()
             
         except Exception as Error:
-            self.Logger.error(f"Failed to calculate columns: {Error}")
-            self.ColumnsCount = 4  # Fallback
+            self.Logger.error(f"Failed to update visible cards: {Error}")
+    
+    def _AcquireCard(self, BookData: dict) -> BookCard:
+        """Reuse an idle card from the pool, or create one if the pool is empty"""
+        if self._CardPool:
+            Card = self._CardPool.pop()
+            Card.SetBookData(BookData)
+            return Card
+        
+        Card = BookCard(BookData, self.ViewMode, self.ContentWidget, self.BookService)
+        Card.BookClicked.connect(self._OnBookSelected)
+        return Card
+    
+    def _ClearGrid(self) -> None:
+        """Release all visible cards back to the pool"""
+        try:
+            Cards, self._ActiveCards = self._ActiveCards, {}
+            for Card in Cards.values():
+                Card.hide()
+            self._CardPool.extend(Cards.values())
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to clear grid: {Error}")
+    
+    def _DiscardCards(self) -> None:
+        """Delete every card, e.g. when the view mode changes the card layout"""
+        self._ClearGrid()
+        Cards, self._CardPool = self._CardPool, []
+        for Card in Cards:
+            # Detach now so the content widget stops tracking it; Qt frees it later
+            Card.setParent(None)
+            Card.deleteLater()
+    
+    def _CalculateColumns(self) -> None:
+        """Calculate optimal number of columns based on available width"""
+        # Runs on every resize tick: plain integer math, no exception frame or logging
+        if self.ViewMode == "list":
+            self.ColumnsCount = 1  # List view: always single column
+            return
+        
+        UsableWidth = self.ScrollArea.viewport().width() - 40  # 20px margin on each side
+        self.ColumnsCount = min(8, max(2, UsableWidth // (self.CardWidth + 15)))  # 15px spacing, 2-8 columns
     
     def _OnBookSelected(self, BookData: dict) -> None:
         """Handle book selection"""
@@ -410,30 +745,6 @@ class BookGrid(QWidget):
         except Exception as Error:
             self.Logger.error(f"Failed to handle book selection: {Error}")
     
-    def ApplyFilters(self, Filters: dict) -> None:
-        """Apply filters to the book display"""
-        try:
-            self.CurrentFilters = Filters.copy()
-            
-            if self.BookService:
-                # Get filtered books from service
-                Category = Filters.get('Category', '')
-                Subject = Filters.get('Subject', '')
-                SearchText = Filters.get('SearchText', '')
-                
-                if SearchText:
-                    FilteredBooks = self.BookService.SearchBooks(SearchText)
-                else:
-                    FilteredBooks = self.BookService.GetBooksByFilters(Category, Subject)
-                
-                self.CurrentBooks = FilteredBooks
-                self._UpdateDisplay()
-                
-                self.Logger.info(f"Applied filters: {len(FilteredBooks)} books match criteria")
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to apply filters: {Error}")
-    
     def HandleResize(self) -> None:
         """Handle window resize events"""
         try:
@@ -441,10 +752,12 @@ class BookGrid(QWidget):
             OldColumns = self.ColumnsCount
             self._CalculateColumns()
             
-            # Only update if column count changed
+            # Reflow if column count changed; otherwise just fill any newly exposed rows
             if OldColumns != self.ColumnsCount:
-                self._UpdateDisplay()
+                self._ReflowGrid()
                 self.Logger.debug(f"Resize handled: columns changed from {OldColumns} to {self.ColumnsCount}")
+            else:
+                self._UpdateVisibleCards()
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle resize: {Error}")
@@ -454,13 +767,7 @@ class BookGrid(QWidget):
         super().resizeEvent(event)
         
         # Use timer to avoid too many updates during resizing
-        if hasattr(self, '_ResizeTimer'):
-            self._ResizeTimer.stop()
-        
-        self._ResizeTimer = QTimer()
-        self._ResizeTimer.timeout.connect(self.HandleResize)
-        self._ResizeTimer.setSingleShot(True)
-        self._ResizeTimer.start(100)  # 100ms delay
+        self._ResizeTimer.start()
     
     def GetBookCount(self) -> int:
         """Get the current number of displayed books"""
@@ -469,6 +776,7 @@ class BookGrid(QWidget):
     def SetBooks(self, Books: List[Dict]) -> None:
         """Set books to display in the grid"""
         try:
+            self._LoadRequestId += 1
             self.CurrentBooks = Books
             self._UpdateDisplay()
             self.SelectionChanged.emit(len(Books))
@@ -494,7 +802,10 @@ class BookGrid(QWidget):
                     self.CardWidth = 600
                     self.CardHeight = 80
                 
+                # Pooled cards are laid out for the old mode
+                self._DiscardCards()
                 self._UpdateDisplay()
+                self._StartCoverPrefetch()  # Cache keys are per view mode
                 self.Logger.info(f"View mode set to: {Mode}")
             
         except Exception as Error:
@@ -503,6 +814,8 @@ class BookGrid(QWidget):
     def RefreshDisplay(self) -> None:
         """Refresh the entire display"""
         try:
+            # Covers may have changed on disk or in the database
+            QPixmapCache.clear()
             self._LoadAllBooks()
             self.Logger.info("Book grid display refreshed")
             
@@ -30,20 +30,227 @@ Architecture:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import weakref
+from pathlib import Path
+from contextlib import contextmanager
+from functools import partial
+from typing import List, Dict, Set, Any, Optional, Callable, Iterator, NamedTuple
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
     QComboBox, QPushButton, QFrame, QGroupBox, QSpinBox,
-    QCheckBox, QSlider, QTextEdit, QScrollArea
+    QCheckBox, QSlider, QTextEdit, QScrollArea, QToolButton
 )
-from PySide6.QtCore import Qt, Signal, QTimer
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QRunnable, QThreadPool
 from PySide6.QtGui import QFont, QPalette, QIcon
 
 from Source.Core.BookService import BookService
 from Source.Data.DatabaseModels import SearchCriteria
 
 
+# Application root (Source/Interface/ -> root) for asset lookups; stylesheet URLs are
+# absolute so Qt never probes the working directory for them
+APP_ROOT = Path(__file__).resolve().parent.parent.parent
+DOWN_ARROW_ICON = (APP_ROOT / "Assets" / "down_arrow.svg").as_posix()
+
+# Index-0 "no filter" entries of the category and subject combo boxes
+ALL_CATEGORIES = "All Categories"
+ALL_SUBJECTS = "All Subjects"
+
+# Filter panel stylesheet: one module-level string shared by every panel
+FILTER_PANEL_STYLESHEET = """
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #555555;
+        border-radius: 8px;
+        margin-top: 8px;
+        padding-top: 8px;
+        background-color: #3c3c3c;
+        color: #ffffff;
+    }
+
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 8px 0 8px;
+        color: #0078d4;
+        font-size: 10pt;
+    }
+
+    QLabel {
+        color: #ffffff;
+        font-size: 9pt;
+    }
+
+    QLineEdit {
+        background-color: #2b2b2b;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        padding: 6px;
+        color: #ffffff;
+        font-size: 9pt;
+    }
+
+    QLineEdit:focus {
+        border-color: #0078d4;
+    }
+
+    QComboBox {
+        background-color: #2b2b2b;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        padding: 6px;
+        color: #ffffff;
+        font-size: 9pt;
+    }
+
+    QComboBox:focus {
+        border-color: #0078d4;
+    }
+
+    QComboBox::drop-down {
+        border: none;
+        width: 20px;
+    }
+
+    QComboBox::down-arrow {
+        image: url("%s");
+        width: 12px;
+        height: 12px;
+    }
+
+    QComboBox QAbstractItemView {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        selection-background-color: #0078d4;
+        border: 1px solid #555555;
+    }
+
+    QToolButton {
+        background-color: transparent;
+        color: #0078d4;
+        border: none;
+        font-weight: bold;
+        font-size: 10pt;
+        text-align: left;
+    }
+
+    QPushButton {
+        background-color: #4a4a4a;
+        color: #ffffff;
+        border: 2px solid #555555;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: 500;
+        font-size: 9pt;
+    }
+
+    QPushButton:hover {
+        background-color: #5a5a5a;
+    }
+
+    QPushButton:pressed {
+        background-color: #3a3a3a;
+    }
+
+    QPushButton:disabled {
+        background-color: #555555;
+        color: #888888;
+    }
+
+    QSlider::groove:horizontal {
+        border: 1px solid #555555;
+        height: 6px;
+        background: #2b2b2b;
+        border-radius: 3px;
+    }
+
+    QSlider::handle:horizontal {
+        background: #0078d4;
+        border: 1px solid #0078d4;
+        width: 16px;
+        height: 16px;
+        border-radius: 8px;
+        margin: -5px 0;
+    }
+
+    QSlider::handle:horizontal:hover {
+        background: #106ebe;
+        border-color: #106ebe;
+    }
+
+    QCheckBox {
+        color: #ffffff;
+        font-size: 9pt;
+    }
+
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+        border: 2px solid #555555;
+        border-radius: 3px;
+        background-color: #2b2b2b;
+    }
+
+    QCheckBox::indicator:checked {
+        background-color: #0078d4;
+        border-color: #0078d4;
+    }
+""" % DOWN_ARROW_ICON
+
+_BOLD_FONTS: Dict[int, QFont] = {}
+
+
+def _BoldFont(PointSize: int) -> QFont:
+    """Shared bold Segoe UI font per point size (built once, on first use after QApplication)."""
+    Font = _BOLD_FONTS.get(PointSize)
+    if Font is None:
+        Font = _BOLD_FONTS[PointSize] = QFont("Segoe UI", PointSize, QFont.Bold)
+    return Font
+
+
+class FilterCriteria(NamedTuple):
+    """
+    Immutable snapshot of the panel's filters, as carried by FiltersChanged.
+    Hashable, so consumers can compare or memoize on it without copying;
+    unset fields keep their empty defaults, so any(Criteria) means "something is filtered".
+    """
+    SearchTerm: str = ""
+    Category: str = ""
+    Subject: str = ""
+    MinRating: int = 0
+    HasThumbnail: bool = False
+
+
+@contextmanager
+def _MuteSignals(*Widgets: Optional[QWidget]) -> Iterator[None]:
+    """Block every signal of the given widgets (None entries are skipped) for the block's duration."""
+    Previous = [(Widget, Widget.blockSignals(True)) for Widget in Widgets if Widget is not None]
+    try:
+        yield
+    finally:
+        for Widget, WasBlocked in Previous:
+            Widget.blockSignals(WasBlocked)
+
+
+class _FetchSignals(QObject):
+    """Delivers a fetch result from a worker thread to the GUI thread (token, items)."""
+    Fetched = Signal(object, list)
+
+
+class _FetchWorker(QRunnable):
+    """Run one BookService lookup off the GUI thread and emit the resulting list."""
+    
+    def __init__(self, Token: Any, Fetch: Callable[[], List[str]]):
+        super().__init__()
+        self.Token = Token
+        self.Fetch = Fetch
+        self.Signals = _FetchSignals()
+    
+    def run(self) -> None:
+        self.Signals.Fetched.emit(self.Token, self.Fetch())
+
+
 class FilterPanel(QWidget):
     """
     Filter panel widget for book library filtering and search.
@@ -56,12 +263,16 @@ class FilterPanel(QWidget):
     """
     
     # Signals for communication with main window
-    FiltersChanged = Signal(dict)  # Emitted when any filter changes
+    FiltersChanged = Signal(object)  # Emitted with a FilterCriteria when any filter changes
     SearchRequested = Signal(str)  # Emitted when search is performed
     CategoryChanged = Signal(str)  # Emitted when category selection changes
     SubjectChanged = Signal(str)  # Emitted when subject selection changes
     ViewModeChanged = Signal(str) # Emitted when the view mode changes
-    SubjectsUpdated = Signal() # Emitted when the subjects dropdown is updated
+    SubjectsUpdated = Signal(int) # Emitted with the subject count when the subjects dropdown is updated
+    
+    # Stylesheet shared by all panels, and the live panels to restyle on a theme switch
+    StyleSheet: str = FILTER_PANEL_STYLESHEET
+    _Instances: "weakref.WeakSet[FilterPanel]" = weakref.WeakSet()
     
     def __init__(self, BookService: BookService, parent=None):
         """
@@ -76,6 +287,7 @@ class FilterPanel(QWidget):
         # Core dependencies
         self.BookService = BookService
         self.Logger = logging.getLogger(self.__class__.__name__)
+        FilterPanel._Instances.add(self)
         
         # UI components
         self.SearchLineEdit: Optional[QLineEdit] = None
@@ -86,28 +298,60 @@ class FilterPanel(QWidget):
         self.RatingSlider: Optional[QSlider] = None
         self.RatingLabel: Optional[QLabel] = None
         self.ThumbnailCheckBox: Optional[QCheckBox] = None
+        self.FilterToggleButton: Optional[QToolButton] = None
+        self.FilterGroup: Optional[QGroupBox] = None  # Built on first expand
+        self._FilterSectionBuilt: bool = False
         
         # State management
         self.CurrentCategory: str = ""
         self.CurrentSubject: str = ""
         self.CurrentSearchTerm: str = ""
         self.IsUpdatingUI: bool = False
+        self._LastSearchText: str = ""  # Previous textChanged value, for paste detection
+        
+        # Criteria kept current field by field, and the criteria the view last got
+        # (None until the first emission, so it is never suppressed)
+        self._Criteria: Dict[str, Any] = {}
+        self._LastCriteria: Optional[FilterCriteria] = None
+        
+        # Dropdown data cached per panel; invalidated by RefreshData
+        self._CategoriesCache: Optional[List[str]] = None
+        self._SubjectsCache: Dict[str, List[str]] = {}
+        
+        # Latest outstanding background fetches; older results are dropped
+        self._CategoriesRequestId: int = 0
+        self._CategoriesFetchPending: bool = False
+        self._PendingSubjectCategory: Optional[str] = None
         
         # Timers for debounced search
         self.SearchTimer = QTimer()
         self.SearchTimer.setSingleShot(True)
         self.SearchTimer.timeout.connect(self.PerformSearch)
         
+        # Zero-delay commit timer: signals queued while handling one user action
+        # are emitted once, in order, after Qt finishes the burst
+        self._PendingSignals: Set[str] = set()
+        self._SubjectCount = 0  # Subjects in the dropdown, excluding ALL_SUBJECTS
+        self._CommitTimer = QTimer(self)
+        self._CommitTimer.setSingleShot(True)
+        self._CommitTimer.setInterval(0)
+        self._CommitTimer.timeout.connect(self._CommitPendingChanges)
+        
         # Initialize UI
         self.InitializeUI()
-        self.LoadInitialData()
         self.ConnectSignals()
         self.ApplyStyles()
         
+        # Paint first; warm the category cache on the next event-loop tick so
+        # expanding the filter section finds the list already loaded
+        QTimer.singleShot(0, self._FetchCategories)
+        
         self.Logger.info("FilterPanel initialized successfully")
     
     def InitializeUI(self) -> None:
         """Initialize the user interface components."""
+        # One repaint once the whole panel is built instead of one per added widget
+        self.setUpdatesEnabled(False)
         try:
             # Main layout
             MainLayout = QVBoxLayout(self)
@@ -121,18 +365,18 @@ class FilterPanel(QWidget):
             # Title
             TitleLabel = QLabel("--- Options ---")
             TitleLabel.setAlignment(Qt.AlignCenter)
-            TitleLabel.setFont(QFont("Segoe UI", 11, QFont.Bold))
+            TitleLabel.setFont(_BoldFont(11))
             MainLayout.addWidget(TitleLabel)
             
             # Search section
             SearchGroup = self.CreateSearchSection()
             MainLayout.addWidget(SearchGroup)
             
-            # Filter section
-            FilterGroup = self.CreateFilterSection()
-            MainLayout.addWidget(FilterGroup)
-            
-            
+            # Filter section: only a toggle until the user first expands it
+            self.FilterToggleButton = QToolButton()
+            self.FilterToggleButton.setText("Filters \u25b8")
+            self.FilterToggleButton.setCheckable(True)
+            MainLayout.addWidget(self.FilterToggleButton)
             
             # Add stretch to push everything to top
             MainLayout.addStretch()
@@ -141,111 +385,175 @@ class FilterPanel(QWidget):
             
         except Exception as Error:
             self.Logger.error(f"Failed to initialize UI: {Error}")
+        finally:
+            self.setUpdatesEnabled(True)
     
     def CreateSearchSection(self) -> QGroupBox:
         """Create the search input section."""
-        try:
-            SearchGroup = QGroupBox("Search")
-            SearchLayout = QVBoxLayout(SearchGroup)
-            SearchLayout.setSpacing(8)
-            
-            # Search label
-            SearchLabel = QLabel("Search:")
-            SearchLabel.setFont(QFont("Segoe UI", 9, QFont.Bold))
-            SearchLayout.addWidget(SearchLabel)
-            
-            # Search input
-            self.SearchLineEdit = QLineEdit()
-            self.SearchLineEdit.setPlaceholderText("Type Something Here")
-            self.SearchLineEdit.setMinimumHeight(32)
-            SearchLayout.addWidget(self.SearchLineEdit)
-            
-            # Search button
-            self.SearchButton = QPushButton("Search")
-            self.SearchButton.setMinimumHeight(32)
-            SearchLayout.addWidget(self.SearchButton)
-            
-            return SearchGroup
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to create search section: {Error}")
-            return QGroupBox()
+        SearchGroup = QGroupBox("Search")
+        SearchLayout = QVBoxLayout(SearchGroup)
+        SearchLayout.setSpacing(8)
+        
+        # Search label
+        SearchLabel = QLabel("Search:")
+        SearchLabel.setFont(_BoldFont(9))
+        SearchLayout.addWidget(SearchLabel)
+        
+        # Search input
+        self.SearchLineEdit = QLineEdit()
+        self.SearchLineEdit.setPlaceholderText("Type Something Here")
+        self.SearchLineEdit.setMinimumHeight(32)
+        SearchLayout.addWidget(self.SearchLineEdit)
+        
+        # Search button
+        self.SearchButton = QPushButton("Search")
+        self.SearchButton.setMinimumHeight(32)
+        SearchLayout.addWidget(self.SearchButton)
+        
+        return SearchGroup
     
     def CreateFilterSection(self) -> QGroupBox:
         """Create the category and subject filter section."""
+        FilterGroup = QGroupBox("Filters")
+        FilterLayout = QVBoxLayout(FilterGroup)
+        FilterLayout.setSpacing(12)
+        
+        # Category section
+        CategoryLabel = QLabel("Category:")
+        CategoryLabel.setFont(_BoldFont(9))
+        FilterLayout.addWidget(CategoryLabel)
+        
+        self.CategoryComboBox = QComboBox()
+        self.CategoryComboBox.setMinimumHeight(32)
+        self.CategoryComboBox.addItem(ALL_CATEGORIES)
+        FilterLayout.addWidget(self.CategoryComboBox)
+        
+        # Subject section
+        SubjectLabel = QLabel("Subject:")
+        SubjectLabel.setFont(_BoldFont(9))
+        FilterLayout.addWidget(SubjectLabel)
+        
+        self.SubjectComboBox = QComboBox()
+        self.SubjectComboBox.setMinimumHeight(32)
+        self.SubjectComboBox.addItem(ALL_SUBJECTS)
+        self.SubjectComboBox.setEnabled(False)  # Disabled until category selected
+        FilterLayout.addWidget(self.SubjectComboBox)
+        
+        return FilterGroup
+    
+    def CreateViewModeButtons(self) -> QHBoxLayout:
+        """Create the view mode buttons section."""
+        ViewModeLayout = QHBoxLayout()
+        ViewModeLayout.setSpacing(8)
+        
+        # Grid button
+        self.GridButton = QPushButton("Grid")
+        self.GridButton.setMinimumHeight(32)
+        ViewModeLayout.addWidget(self.GridButton)
+
+        # List button
+        self.ListButton = QPushButton("List")
+        self.ListButton.setMinimumHeight(32)
+        ViewModeLayout.addWidget(self.ListButton)
+        
+        return ViewModeLayout
+    
+    def OnFilterSectionToggled(self, Expanded: bool) -> None:
+        """Show or hide the filter section, building it on first expand."""
         try:
-            FilterGroup = QGroupBox("Filters")
-            FilterLayout = QVBoxLayout(FilterGroup)
-            FilterLayout.setSpacing(12)
-            
-            # Category section
-            CategoryLabel = QLabel("Category:")
-            CategoryLabel.setFont(QFont("Segoe UI", 9, QFont.Bold))
-            FilterLayout.addWidget(CategoryLabel)
-            
-            self.CategoryComboBox = QComboBox()
-            self.CategoryComboBox.setMinimumHeight(32)
-            self.CategoryComboBox.addItem("All Categories")
-            FilterLayout.addWidget(self.CategoryComboBox)
-            
-            # Subject section
-            SubjectLabel = QLabel("Subject:")
-            SubjectLabel.setFont(QFont("Segoe UI", 9, QFont.Bold))
-            FilterLayout.addWidget(SubjectLabel)
-            
-            self.SubjectComboBox = QComboBox()
-            self.SubjectComboBox.setMinimumHeight(32)
-            self.SubjectComboBox.addItem("All Subjects")
-            self.SubjectComboBox.setEnabled(False)  # Disabled until category selected
-            FilterLayout.addWidget(self.SubjectComboBox)
-            
-            return FilterGroup
+            if Expanded:
+                self._EnsureFilterSection()
+            if self.FilterGroup:
+                self.FilterGroup.setVisible(Expanded)
+            self.FilterToggleButton.setText("Filters \u25be" if Expanded else "Filters \u25b8")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to create filter section: {Error}")
-            return QGroupBox()
+            self.Logger.error(f"Failed to toggle filter section: {Error}")
     
-    def CreateViewModeButtons(self) -> QHBoxLayout:
-        """Create the view mode buttons section."""
+    def _EnsureFilterSection(self) -> None:
+        """Build the filter group, connect its combo boxes and load categories (once)."""
+        if self._FilterSectionBuilt:
+            return
+        
+        # The panel is already on screen: build the group without intermediate repaints
+        self.setUpdatesEnabled(False)
+        try:
+            self.FilterGroup = self.CreateFilterSection()
+            MainLayout = self.layout()
+            MainLayout.insertWidget(MainLayout.indexOf(self.FilterToggleButton) + 1, self.FilterGroup)
+        finally:
+            self.setUpdatesEnabled(True)
+        self._FilterSectionBuilt = True
+        
+        if self.CategoryComboBox:
+            self.CategoryComboBox.currentIndexChanged.connect(self.OnCategoryChanged)
+        
+        if self.SubjectComboBox:
+            self.SubjectComboBox.currentIndexChanged.connect(self.OnSubjectChanged)
+        
+        self.LoadInitialData()
+    
+    def LoadInitialData(self) -> None:
+        """Load initial data for dropdowns (categories are fetched on the thread pool)."""
         try:
-            ViewModeLayout = QHBoxLayout()
-            ViewModeLayout.setSpacing(8)
+            if not self._FilterSectionBuilt:
+                return  # Categories load when the filter section is first expanded
             
-            # Grid button
-            self.GridButton = QPushButton("Grid")
-            self.GridButton.setMinimumHeight(32)
-            ViewModeLayout.addWidget(self.GridButton)
-
-            # List button
-            self.ListButton = QPushButton("List")
-            self.ListButton.setMinimumHeight(32)
-            ViewModeLayout.addWidget(self.ListButton)
+            if self._CategoriesCache is not None:
+                self._ShowCategories(self._CategoriesCache)
+                return
             
-            return ViewModeLayout
+            self._FetchCategories()  # Shown on arrival
             
         except Exception as Error:
-            self.Logger.error(f"Failed to create view mode buttons: {Error}")
-            return QHBoxLayout()
+            self.Logger.error(f"Failed to load initial data: {Error}")
     
-    def LoadInitialData(self) -> None:
-        """Load initial data for dropdowns."""
+    def _FetchCategories(self) -> None:
+        """Fetch categories on the thread pool unless cached or already in flight."""
+        if self._CategoriesCache is not None or self._CategoriesFetchPending:
+            return
+        
+        self._CategoriesFetchPending = True
+        self._CategoriesRequestId += 1
+        Worker = _FetchWorker(self._CategoriesRequestId, self.BookService.GetCategories)
+        Worker.Signals.Fetched.connect(self._OnCategoriesFetched)
+        QThreadPool.globalInstance().start(Worker)
+    
+    def _OnCategoriesFetched(self, RequestId: int, Categories: List[str]) -> None:
+        """Cache categories from a background fetch (unless superseded); show them if the section exists."""
+        if RequestId != self._CategoriesRequestId:
+            return
+        self._CategoriesFetchPending = False
+        self._CategoriesCache = Categories
+        if self._FilterSectionBuilt:
+            self._ShowCategories(Categories)
+    
+    def _ShowCategories(self, Categories: List[str]) -> None:
+        """Fill the category dropdown."""
         try:
             self.IsUpdatingUI = True
             
-            # Load categories
-            Categories = self.BookService.GetCategories()
             if self.CategoryComboBox:
-                self.CategoryComboBox.clear()
-                self.CategoryComboBox.addItem("All Categories")
-                for Category in Categories:
-                    self.CategoryComboBox.addItem(Category)
+                self._FillComboBox(self.CategoryComboBox, [ALL_CATEGORIES, *Categories])
+                
+                # Re-select a category set (e.g. by SetFilterCriteria) before the list arrived
+                Index = self.CategoryComboBox.findText(self.CurrentCategory) if self.CurrentCategory else -1
+                if Index > 0:
+                    with _MuteSignals(self.CategoryComboBox, self.SubjectComboBox):
+                        self.CategoryComboBox.setCurrentIndex(Index)
+                        Subject = self.CurrentSubject
+                        self.UpdateSubjects(self.CurrentCategory)
+                        self.CurrentSubject = Subject
+                        SubjectIndex = self.SubjectComboBox.findText(Subject) if Subject else -1
+                        if SubjectIndex > 0:
+                            self.SubjectComboBox.setCurrentIndex(SubjectIndex)
             
             self.IsUpdatingUI = False
             
             self.Logger.info(f"Loaded {len(Categories)} categories")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to load initial data: {Error}")
+            self.Logger.error(f"Failed to show categories: {Error}")
             self.IsUpdatingUI = False
     
     def ConnectSignals(self) -> None:
@@ -253,18 +561,16 @@ class FilterPanel(QWidget):
         try:
             # Search signals
             if self.SearchLineEdit:
-                self.SearchLineEdit.textChanged.connect(self.OnSearchTextChanged)
+                # textEdited fires for user input only, never for programmatic setText/clear
+                self.SearchLineEdit.textEdited.connect(self.OnSearchTextChanged)
                 self.SearchLineEdit.returnPressed.connect(self.OnSearchPressed)
             
             if self.SearchButton:
                 self.SearchButton.clicked.connect(self.OnSearchPressed)
             
-            # Filter signals
-            if self.CategoryComboBox:
-                self.CategoryComboBox.currentTextChanged.connect(self.OnCategoryChanged)
-            
-            if self.SubjectComboBox:
-                self.SubjectComboBox.currentTextChanged.connect(self.OnSubjectChanged)
+            # Filter signals (the combo boxes connect when the section is built)
+            if self.FilterToggleButton:
+                self.FilterToggleButton.toggled.connect(self.OnFilterSectionToggled)
             
             # Advanced filter signals
             if self.RatingSlider:
@@ -274,10 +580,10 @@ class FilterPanel(QWidget):
                 self.ThumbnailCheckBox.stateChanged.connect(self.OnThumbnailFilterChanged)
 
             if self.GridButton:
-                self.GridButton.clicked.connect(lambda: self.ViewModeChanged.emit("grid"))
+                self.GridButton.clicked.connect(partial(self.ViewModeChanged.emit, "grid"))
 
             if self.ListButton:
-                self.ListButton.clicked.connect(lambda: self.ViewModeChanged.emit("list"))
+                self.ListButton.clicked.connect(partial(self.ViewModeChanged.emit, "list"))
             
             self.Logger.debug("UI signals connected successfully")
             
@@ -285,252 +591,110 @@ class FilterPanel(QWidget):
             self.Logger.error(f"Failed to connect signals: {Error}")
     
     def ApplyStyles(self) -> None:
-        """Apply custom styles to the filter panel."""
-        try:
-            self.setStyleSheet("""
-                QGroupBox {
-                    font-weight: bold;
-                    border: 2px solid #555555;
-                    border-radius: 8px;
-                    margin-top: 8px;
-                    padding-top: 8px;
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                }
-                
-                QGroupBox::title {
-                    subcontrol-origin: margin;
-                    left: 10px;
-                    padding: 0 8px 0 8px;
-                    color: #0078d4;
-                    font-size: 10pt;
-                }
-                
-                QLabel {
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QLineEdit {
-                    background-color: #2b2b2b;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 6px;
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QLineEdit:focus {
-                    border-color: #0078d4;
-                }
-                
-                QComboBox {
-                    background-color: #2b2b2b;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 6px;
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QComboBox:focus {
-                    border-color: #0078d4;
-                }
-                
-                QComboBox::drop-down {
-                    border: none;
-                    width: 20px;
-                }
-                
-                QComboBox::down-arrow {
-                    image: url(down_arrow.png);
-                    width: 12px;
-                    height: 12px;
-                }
-                
-                QComboBox QAbstractItemView {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    selection-background-color: #0078d4;
-                    border: 1px solid #555555;
-                }
-                
-                QPushButton {
-                    background-color: #4a4a4a;
-                    color: #ffffff;
-                    border: 2px solid #555555;
-                    border-radius: 6px;
-                    padding: 8px 16px;
-                    font-weight: 500;
-                    font-size: 9pt;
-                }
-                
-                QPushButton:hover {
-                    background-color: #5a5a5a;
-                }
-                
-                QPushButton:pressed {
-                    background-color: #3a3a3a;
-                }
-                
-                QPushButton:disabled {
-                    background-color: #555555;
-                    color: #888888;
-                }
-                
-                QSlider::groove:horizontal {
-                    border: 1px solid #555555;
-                    height: 6px;
-                    background: #2b2b2b;
-                    border-radius: 3px;
-                }
-                
-                QSlider::handle:horizontal {
-                    background: #0078d4;
-                    border: 1px solid #0078d4;
-                    width: 16px;
-                    height: 16px;
-                    border-radius: 8px;
-                    margin: -5px 0;
-                }
-                
-                QSlider::handle:horizontal:hover {
-                    background: #106ebe;
-                    border-color: #106ebe;
-                }
-                
-                QCheckBox {
-                    color: #ffffff;
-                    font-size: 9pt;
-                }
-                
-                QCheckBox::indicator {
-                    width: 16px;
-                    height: 16px;
-                    border: 2px solid #555555;
-                    border-radius: 3px;
-                    background-color: #2b2b2b;
-                }
-                
-                QCheckBox::indicator:checked {
-                    background-color: #0078d4;
-                    border-color: #0078d4;
-                }
-            """)
-            
-            self.Logger.debug("Styles applied successfully")
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to apply styles: {Error}")
+        """Apply custom styles to the filter panel (skipped when already current)."""
+        # Every setStyleSheet repolishes all child widgets, so only set a changed sheet
+        if self.styleSheet() == FilterPanel.StyleSheet:
+            return
+        self.setStyleSheet(FilterPanel.StyleSheet)
+        
+        self.Logger.debug("Styles applied successfully")
+    
+    @classmethod
+    def SetPanelStyleSheet(cls, StyleSheet: str) -> None:
+        """Switch every live filter panel (and future ones) to a new stylesheet, e.g. on theme change."""
+        cls.StyleSheet = StyleSheet
+        for Panel in list(cls._Instances):
+            Panel.ApplyStyles()
     
     def OnSearchTextChanged(self, Text: str) -> None:
         """Handle search text changes with debouncing."""
-        try:
-            if self.IsUpdatingUI:
-                return
-            
-            # Debounce search to avoid excessive queries
-            self.SearchTimer.stop()
-            self.SearchTimer.start(500)  # 500ms delay
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle search text change: {Error}")
+        PreviousText, self._LastSearchText = self._LastSearchText, Text
+        
+        # Debounce search to avoid excessive queries. Short prefixes are the
+        # broadest (slowest) queries and are typed fast, so they wait longest;
+        # a paste is a finished term and fires almost at once.
+        if len(Text) - len(PreviousText) > 3:
+            Delay = 150
+        elif len(Text) <= 2:
+            Delay = 700
+        elif len(Text) <= 5:
+            Delay = 400
+        else:
+            Delay = 200
+        self.SearchTimer.start(Delay)
     
     def OnSearchPressed(self) -> None:
         """Handle search button click or Enter press."""
-        try:
-            self.SearchTimer.stop()
-            self.PerformSearch()
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle search press: {Error}")
+        self.SearchTimer.stop()
+        self.PerformSearch()
     
     def PerformSearch(self) -> None:
         """Perform the actual search operation."""
-        try:
-            if not self.SearchLineEdit:
-                return
-            
-            SearchTerm = self.SearchLineEdit.text().strip()
-            self.CurrentSearchTerm = SearchTerm
-            
-            if SearchTerm:
-                self.Logger.debug(f"Performing search: '{SearchTerm}'")
-                self.SearchRequested.emit(SearchTerm)
-            else:
-                # Empty search - apply current filters
-                self.EmitFiltersChanged()
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to perform search: {Error}")
+        if not self.SearchLineEdit:
+            return
+        
+        SearchTerm = self.SearchLineEdit.text().strip()
+        self.CurrentSearchTerm = SearchTerm
+        self._SetCriterion('SearchTerm', SearchTerm)
+        
+        if SearchTerm:
+            self.Logger.debug(f"Performing search: '{SearchTerm}'")
+            # The main window shows search-only results for this signal
+            self._LastCriteria = FilterCriteria(SearchTerm=SearchTerm)
+            self.SearchRequested.emit(SearchTerm)
+        else:
+            # Empty search - apply current filters
+            self._QueueSignals('FiltersChanged')
     
-    def OnCategoryChanged(self, Category: str) -> None:
-        """Handle category selection change."""
-        try:
-            if self.IsUpdatingUI:
-                return
-            
-            self.CurrentCategory = Category if Category != "All Categories" else ""
-            self.Logger.debug(f"Category changed to: '{Category}'")
-            
-            # Update subjects for selected category
-            self.UpdateSubjects(self.CurrentCategory)
-            
-            # Clear search and subject when category changes
-            self.ClearSearch()
-            if self.SubjectComboBox:
-                self.SubjectComboBox.setCurrentIndex(0)
-            
-            # Emit category change signal
-            self.CategoryChanged.emit(self.CurrentCategory)
-            
-            # Emit filters changed
-            self.EmitFiltersChanged()
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle category change: {Error}")
+    def OnCategoryChanged(self, Index: int) -> None:
+        """Handle category selection change (index 0 is "All Categories")."""
+        if self.IsUpdatingUI:
+            return
+        
+        self.CurrentCategory = self.CategoryComboBox.itemText(Index) if Index > 0 else ""
+        self._SetCriterion('Category', self.CurrentCategory)
+        self.Logger.debug(f"Category changed to: '{self.CurrentCategory}'")
+        
+        # Update subjects for selected category
+        self.UpdateSubjects(self.CurrentCategory)
+        
+        # Clear search and subject when category changes
+        self.ClearSearch()
+        if self.SubjectComboBox:
+            self.SubjectComboBox.setCurrentIndex(0)
+        
+        # Category, subject and filter signals go out together once the burst settles
+        self._QueueSignals('CategoryChanged', 'FiltersChanged')
     
-    def OnSubjectChanged(self, Subject: str) -> None:
-        """Handle subject selection change."""
-        try:
-            if self.IsUpdatingUI:
-                return
-            
-            self.CurrentSubject = Subject if Subject != "All Subjects" else ""
-            self.Logger.debug(f"Subject changed to: '{Subject}'")
-            
-            # Clear search when filter changes
-            self.ClearSearch()
-            
-            # Emit subject change signal
-            self.SubjectChanged.emit(self.CurrentSubject)
-            
-            # Emit filters changed
-            self.EmitFiltersChanged()
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle subject change: {Error}")
+    def OnSubjectChanged(self, Index: int) -> None:
+        """Handle subject selection change (index 0 is "All Subjects")."""
+        if self.IsUpdatingUI:
+            return
+        
+        self.CurrentSubject = self.SubjectComboBox.itemText(Index) if Index > 0 else ""
+        self._SetCriterion('Subject', self.CurrentSubject)
+        self.Logger.debug(f"Subject changed to: '{self.CurrentSubject}'")
+        
+        # Clear search when filter changes
+        self.ClearSearch()
+        
+        # Subject and filter signals go out together once the burst settles
+        self._QueueSignals('SubjectChanged', 'FiltersChanged')
     
     def OnRatingChanged(self, Rating: int) -> None:
-        """Handle rating slider change."""
-        try:
-            if self.RatingLabel:
-                self.RatingLabel.setText(str(Rating))
-            
-            if not self.IsUpdatingUI:
-                self.EmitFiltersChanged()
-                
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle rating change: {Error}")
+        """Handle rating slider change (uses the value Qt passes; no widget read)."""
+        if self.RatingLabel:
+            self.RatingLabel.setText(str(Rating))
+        self._SetCriterion('MinRating', Rating if Rating > 0 else None)
+        
+        if not self.IsUpdatingUI:
+            self._QueueSignals('FiltersChanged')
     
     def OnThumbnailFilterChanged(self, State: int) -> None:
-        """Handle thumbnail filter checkbox change."""
-        try:
-            if not self.IsUpdatingUI:
-                self.EmitFiltersChanged()
-                
-        except Exception as Error:
-            self.Logger.error(f"Failed to handle thumbnail filter change: {Error}")
+        """Handle thumbnail filter checkbox change (State is the int Qt passes, no widget read)."""
+        self._SetCriterion('HasThumbnail', True if State == Qt.CheckState.Checked.value else None)
+        if not self.IsUpdatingUI:
+            self._QueueSignals('FiltersChanged')
     
     def UpdateSubjects(self, Category: str) -> None:
         """Update subjects dropdown based on selected category."""
@@ -538,144 +702,252 @@ class FilterPanel(QWidget):
             if not self.SubjectComboBox:
                 return
             
-            self.IsUpdatingUI = True
+            # Reset subject selection
+            self.CurrentSubject = ""
+            self._SetCriterion('Subject', None)
+            self._PendingSubjectCategory = None
             
-            # Clear current subjects
-            self.SubjectComboBox.clear()
-            self.SubjectComboBox.addItem("All Subjects")
+            if Category and Category not in self._SubjectsCache:
+                # Fetch on the thread pool; the dropdown stays disabled until it arrives
+                self._PendingSubjectCategory = Category
+                self.IsUpdatingUI = True
+                self._FillComboBox(self.SubjectComboBox, [ALL_SUBJECTS])
+                self.SubjectComboBox.setEnabled(False)
+                self.IsUpdatingUI = False
+                
+                Worker = _FetchWorker(Category, lambda: self.BookService.GetSubjectsForCategory(Category))
+                Worker.Signals.Fetched.connect(self._OnSubjectsFetched)
+                QThreadPool.globalInstance().start(Worker)
+                return
+            
+            self._ShowSubjects(Category, self._SubjectsCache.get(Category, []))
+            
+        except Exception as Error:
+            self.Logger.error(f"Failed to update subjects: {Error}")
+            self.IsUpdatingUI = False
+    
+    def _OnSubjectsFetched(self, Category: str, Subjects: List[str]) -> None:
+        """Show subjects from a background fetch if that category is still the pending one."""
+        if Category != self._PendingSubjectCategory:
+            return  # Stale: the user has moved on to another category
+        self._PendingSubjectCategory = None
+        self._SubjectsCache[Category] = Subjects
+        self._ShowSubjects(Category, Subjects)
+        
+        # Restore a subject chosen (e.g. by SetFilterCriteria) while the fetch was running
+        if self.CurrentSubject and self.SubjectComboBox:
+            Index = self.SubjectComboBox.findText(self.CurrentSubject)
+            if Index >= 0:
+                self.IsUpdatingUI = True
+                self.SubjectComboBox.setCurrentIndex(Index)
+                self.IsUpdatingUI = False
+    
+    def _ShowSubjects(self, Category: str, Subjects: List[str]) -> None:
+        """Fill the subject dropdown for a category ("" disables it)."""
+        try:
+            self.IsUpdatingUI = True
             
             if Category:
-                # Load subjects for category
-                Subjects = self.BookService.GetSubjectsForCategory(Category)
-                for Subject in Subjects:
-                    self.SubjectComboBox.addItem(Subject)
+                self._FillComboBox(self.SubjectComboBox, [ALL_SUBJECTS, *Subjects])
+                self._SubjectCount = len(Subjects)
                 
                 self.SubjectComboBox.setEnabled(True)
                 self.Logger.debug(f"Loaded {len(Subjects)} subjects for category '{Category}'")
             else:
                 # No category selected
+                self._FillComboBox(self.SubjectComboBox, [ALL_SUBJECTS])
+                self._SubjectCount = 0
                 self.SubjectComboBox.setEnabled(False)
             
-            # Reset subject selection
-            self.CurrentSubject = ""
-            
             self.IsUpdatingUI = False
-            self.SubjectsUpdated.emit()
+            self._QueueSignals('SubjectsUpdated')
             
         except Exception as Error:
-            self.Logger.error(f"Failed to update subjects: {Error}")
+            self.Logger.error(f"Failed to show subjects: {Error}")
             self.IsUpdatingUI = False
     
+    @staticmethod
+    def _FillComboBox(ComboBox: QComboBox, Items: List[str]) -> None:
+        """Replace a combo box's items in one batch, with one repaint and no per-item signals."""
+        ComboBox.setUpdatesEnabled(False)
+        ComboBox.blockSignals(True)
+        try:
+            ComboBox.clear()
+            ComboBox.addItems(Items)
+        finally:
+            ComboBox.blockSignals(False)
+            ComboBox.setUpdatesEnabled(True)
+    
     def ClearSearch(self) -> None:
         """Clear the search field when filters change."""
-        try:
-            if self.SearchLineEdit and self.SearchLineEdit.text():
-                self.IsUpdatingUI = True
-                self.SearchLineEdit.clear()
-                self.CurrentSearchTerm = ""
-                self.IsUpdatingUI = False
-                
-        except Exception as Error:
-            self.Logger.error(f"Failed to clear search: {Error}")
+        # _LastSearchText mirrors the box (textEdited plus every programmatic set), so
+        # the common empty-search case returns without calling into Qt. CurrentSearchTerm
+        # alone is not enough: it stays empty while a typed term waits on the debounce.
+        if not self._LastSearchText or not self.SearchLineEdit:
+            return
+        
+        self.SearchTimer.stop()  # Drop a search typed before the filter change
+        self.SearchLineEdit.clear()
+        self.CurrentSearchTerm = ""
+        self._LastSearchText = ""
+        self._SetCriterion('SearchTerm', None)
     
-    def EmitFiltersChanged(self) -> None:
-        """Emit filters changed signal with current criteria."""
-        try:
-            Criteria = self.GetCurrentCriteria()
-            self.FiltersChanged.emit(Criteria)
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to emit filters changed: {Error}")
+    def _QueueSignals(self, *SignalNames: str) -> None:
+        """Queue signals for the next commit; repeats within one burst collapse to one."""
+        self._PendingSignals.update(SignalNames)
+        self._CommitTimer.start()
     
-    def GetCurrentCriteria(self) -> Dict[str, Any]:
-        """Get current filter criteria as dictionary."""
+    def _CommitPendingChanges(self) -> None:
+        """Emit each queued signal once, in dependency order, with the settled state."""
         try:
-            Criteria = {}
-            
-            # Search term
-            if self.CurrentSearchTerm:
-                Criteria['SearchTerm'] = self.CurrentSearchTerm
-            
-            # Category and subject
-            if self.CurrentCategory:
-                Criteria['Category'] = self.CurrentCategory
-            
-            if self.CurrentSubject:
-                Criteria['Subject'] = self.CurrentSubject
-            
-            # Rating filter
-            if self.RatingSlider and self.RatingSlider.value() > 0:
-                Criteria['MinRating'] = self.RatingSlider.value()
-            
-            # Thumbnail filter
-            if self.ThumbnailCheckBox and self.ThumbnailCheckBox.isChecked():
-                Criteria['HasThumbnail'] = True
-            
-            return Criteria
+            Pending, self._PendingSignals = self._PendingSignals, set()
+            
+            if 'CategoryChanged' in Pending:
+                self.CategoryChanged.emit(self.CurrentCategory)
+            if 'SubjectsUpdated' in Pending:
+                self.SubjectsUpdated.emit(self._SubjectCount)
+            if 'SubjectChanged' in Pending:
+                self.SubjectChanged.emit(self.CurrentSubject)
+            if 'FiltersChanged' in Pending:
+                self.EmitFiltersChanged()
             
         except Exception as Error:
-            self.Logger.error(f"Failed to get current criteria: {Error}")
-            return {}
+            self.Logger.error(f"Failed to commit filter changes: {Error}")
+    
+    def EmitFiltersChanged(self) -> None:
+        """Emit filters changed signal with current criteria, unless the view already has them."""
+        Criteria = FilterCriteria(**self._Criteria)
+        if Criteria == self._LastCriteria:
+            return
+        
+        self._LastCriteria = Criteria
+        self.FiltersChanged.emit(Criteria)
+    
+    def _SetCriterion(self, Key: str, Value: Any) -> None:
+        """Update one criteria field; empty values remove it."""
+        if Value:
+            self._Criteria[Key] = Value
+        else:
+            self._Criteria.pop(Key, None)
+    
+    def GetCurrentCriteria(self) -> FilterCriteria:
+        """Get current filter criteria as an immutable FilterCriteria."""
+        return FilterCriteria(**self._Criteria)
     
     def RefreshData(self) -> None:
         """Refresh filter data from database."""
         try:
             self.Logger.info("Refreshing filter panel data")
             
-            # Clear cache in book service
+            # Clear cache in book service and the panel's dropdown caches
             self.BookService.ClearCache()
+            self._CategoriesCache = None
+            self._SubjectsCache = {}
+            # An in-flight fetch is stale: bumping the id makes _OnCategoriesFetched drop it,
+            # even if the section is collapsed and LoadInitialData starts no new fetch
+            self._CategoriesFetchPending = False
+            self._CategoriesRequestId += 1
             
             # Reload categories
             self.LoadInitialData()
             
-            # Reset to initial state
-            self.OnResetClicked()
+            # Reset to initial state; the data changed, so the view reloads even if
+            # the (empty) criteria match what it last received
+            self.ResetFilters()
+            self._LastCriteria = None
+            self.EmitFiltersChanged()
+            self._QueueSignals('SubjectsUpdated')  # The subject dropdown was emptied
             
         except Exception as Error:
             self.Logger.error(f"Failed to refresh data: {Error}")
     
+    def ResetFilters(self) -> None:
+        """Return every filter widget to its default with signals blocked (emits nothing)."""
+        self.SearchTimer.stop()
+        self._PendingSubjectCategory = None
+        
+        with _MuteSignals(self.SearchLineEdit, self.CategoryComboBox, self.SubjectComboBox,
+                          self.RatingSlider, self.ThumbnailCheckBox):
+            if self.SearchLineEdit:
+                self.SearchLineEdit.clear()
+            if self.CategoryComboBox:
+                self.CategoryComboBox.setCurrentIndex(0)
+            if self.SubjectComboBox:
+                self._FillComboBox(self.SubjectComboBox, [ALL_SUBJECTS])
+                self.SubjectComboBox.setEnabled(False)
+            self._SubjectCount = 0
+            if self.RatingSlider:
+                self.RatingSlider.setValue(0)
+            if self.RatingLabel:
+                self.RatingLabel.setText("0")
+            if self.ThumbnailCheckBox:
+                self.ThumbnailCheckBox.setChecked(False)
+        
+        self.CurrentSearchTerm = ""
+        self._LastSearchText = ""
+        self.CurrentCategory = ""
+        self.CurrentSubject = ""
+        self._Criteria = {}
+    
     def SetFilterCriteria(self, Criteria: Dict[str, Any]) -> None:
-        """Set filter criteria programmatically."""
+        """Set filter criteria programmatically, emitting a single FiltersChanged."""
         try:
             self.IsUpdatingUI = True
             
-            # Set search term
-            SearchTerm = Criteria.get('SearchTerm', '')
-            if self.SearchLineEdit:
-                self.SearchLineEdit.setText(SearchTerm)
-            self.CurrentSearchTerm = SearchTerm
-            
-            # Set category
-            Category = Criteria.get('Category', '')
-            if self.CategoryComboBox and Category:
-                Index = self.CategoryComboBox.findText(Category)
-                if Index >= 0:
-                    self.CategoryComboBox.setCurrentIndex(Index)
-            self.CurrentCategory = Category
-            
-            # Update subjects and set subject
-            if Category:
-                self.UpdateSubjects(Category)
-            
-            Subject = Criteria.get('Subject', '')
-            if self.SubjectComboBox and Subject:
-                Index = self.SubjectComboBox.findText(Subject)
-                if Index >= 0:
-                    self.SubjectComboBox.setCurrentIndex(Index)
-            self.CurrentSubject = Subject
-            
-            # Set rating
-            MinRating = Criteria.get('MinRating', 0)
-            if self.RatingSlider:
-                self.RatingSlider.setValue(MinRating)
-            
-            # Set thumbnail filter
-            HasThumbnail = Criteria.get('HasThumbnail', False)
-            if self.ThumbnailCheckBox:
-                self.ThumbnailCheckBox.setChecked(HasThumbnail)
+            # Blocked signals keep external slots from re-querying on every setter
+            with _MuteSignals(self.SearchLineEdit, self.CategoryComboBox, self.SubjectComboBox,
+                              self.RatingSlider, self.ThumbnailCheckBox):
+                # Set search term
+                SearchTerm = Criteria.get('SearchTerm', '')
+                if self.SearchLineEdit:
+                    self.SearchLineEdit.setText(SearchTerm)
+                self.CurrentSearchTerm = SearchTerm
+                self._LastSearchText = SearchTerm
+                
+                # Set category (expanding the filter section builds its combo boxes)
+                Category = Criteria.get('Category', '')
+                if Category and self.FilterToggleButton:
+                    self.FilterToggleButton.setChecked(True)
+                if self.CategoryComboBox and Category:
+                    Index = self.CategoryComboBox.findText(Category)
+                    if Index >= 0:
+                        self.CategoryComboBox.setCurrentIndex(Index)
+                self.CurrentCategory = Category
+                
+                # Update subjects and set subject
+                if Category:
+                    self.UpdateSubjects(Category)
+                
+                Subject = Criteria.get('Subject', '')
+                if self.SubjectComboBox and Subject:
+                    Index = self.SubjectComboBox.findText(Subject)
+                    if Index >= 0:
+                        self.SubjectComboBox.setCurrentIndex(Index)
+                self.CurrentSubject = Subject
+                
+                # Set rating
+                MinRating = Criteria.get('MinRating', 0)
+                if self.RatingSlider:
+                    self.RatingSlider.setValue(MinRating)
+                if self.RatingLabel:
+                    self.RatingLabel.setText(str(MinRating))
+                
+                # Set thumbnail filter
+                HasThumbnail = Criteria.get('HasThumbnail', False)
+                if self.ThumbnailCheckBox:
+                    self.ThumbnailCheckBox.setChecked(HasThumbnail)
+            
+            # Rebuild the incremental criteria from the values just applied
+            self._Criteria = {}
+            self._SetCriterion('SearchTerm', SearchTerm)
+            self._SetCriterion('Category', Category)
+            self._SetCriterion('Subject', Subject)
+            self._SetCriterion('MinRating', MinRating)
+            self._SetCriterion('HasThumbnail', HasThumbnail)
             
             self.IsUpdatingUI = False
             
+            self.EmitFiltersChanged()
             self.Logger.debug(f"Set filter criteria: {Criteria}")
             
         except Exception as Error:
@@ -0,0 +1,37 @@
+# File: IconCache.py
+# Path: Source/Interface/IconCache.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-15
+# Last Modified: 2026-10-15  09:00AM
+"""
+Description: Shared QIcon Cache for Anderson's Library
+Decodes each icon file once and hands the same QIcon to every caller.
+"""
+
+from typing import Dict
+
+from PySide6.QtGui import QIcon
+
+
+_ICON_CACHE: Dict[str, QIcon] = {}
+
+
+def GetIcon(IconPath: str) -> QIcon:
+    """
+    Get a cached QIcon for the given file path.
+
+    Args:
+        IconPath: Path to the icon image file
+
+    Returns:
+        QIcon instance shared by all callers requesting the same path
+    """
+    Icon = _ICON_CACHE.get(IconPath)
+    if Icon is None:
+        Icon = _ICON_CACHE.setdefault(IconPath, QIcon(IconPath))
+    return Icon
+
+
+def ClearIconCache() -> None:
+    """Drop all cached icons (e.g. after assets change on disk)."""
+    _ICON_CACHE.clear()
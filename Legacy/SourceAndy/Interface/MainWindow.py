@@ -28,36 +28,193 @@ Dependencies:
 
 import sys
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, 
     QFrame, QStatusBar, QMessageBox, QSplitter, QMenuBar, QMenu,
     QProgressBar, QLabel, QToolBar, QPushButton
 )
-from PySide6.QtCore import Qt, QTimer, Signal  # ✅ FIXED: Signal not pyqtSignal
-from PySide6.QtGui import QFont, QIcon, QAction, QPixmap
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QObject, QRunnable, QThreadPool  # ✅ FIXED: Signal not pyqtSignal
+from PySide6.QtGui import QFont, QIcon, QAction, QPixmap, QPixmapCache
 
-from Source.Core.DatabaseManager import DatabaseManager
+from Source.Core.DatabaseManager import DatabaseManager, DEFAULT_DATABASE_PATH
 from Source.Core.BookService import BookService
-from Source.Interface.FilterPanel import FilterPanel
+from Source.Interface.FilterPanel import FilterPanel, FilterCriteria
 from Source.Interface.BookGrid import BookGrid
 from Source.Utils.AboutDialog import AboutDialog
 
 
+UI_FONT_FAMILY = "Segoe UI"
+UI_FONT_POINT_SIZE = 9
+
+# Dark theme for the main window; child widgets inherit it, so it is parsed once per window
+MAIN_WINDOW_STYLESHEET = """
+    QMainWindow {
+        background-color: qlineargradient(
+            spread:repeat, x1:1, y1:0, x2:1, y2:1, 
+            stop:0.00480769 rgba(3, 50, 76, 255), 
+            stop:0.293269 rgba(6, 82, 125, 255), 
+            stop:0.514423 rgba(8, 117, 178, 255), 
+            stop:0.745192 rgba(7, 108, 164, 255), 
+            stop:1 rgba(3, 51, 77, 255)
+        );
+        color: #ffffff;
+    }
+    
+    QMenuBar {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: none;
+        padding: 4px;
+    }
+    
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 6px 12px;
+        border-radius: 4px;
+    }
+    
+    QMenuBar::item:selected {
+        background-color: #0078d4;
+    }
+    
+    QMenu {
+        background-color: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #555555;
+        padding: 4px;
+    }
+    
+    QMenu::item {
+        padding: 6px 20px;
+        border-radius: 4px;
+    }
+    
+    QMenu::item:selected {
+        background-color: #0078d4;
+    }
+    
+    QToolBar {
+        background-color: #3c3c3c;
+        border: none;
+        spacing: 4px;
+        padding: 4px;
+    }
+    
+    QPushButton {
+        background-color: #0078d4;
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: 500;
+    }
+    
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    
+    QStatusBar {
+        background-color: #FF0000;
+        color: #ffffff;
+        border-top: 1px solid #555555;
+    }
+    
+    QProgressBar {
+        border: 1px solid #555555;
+        border-radius: 4px;
+        text-align: center;
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #0078d4;
+        border-radius: 3px;
+    }
+    
+    QSplitter::handle {
+        background-color: #555555;
+        width: 2px;
+    }
+    
+    QSplitter::handle:hover {
+        background-color: #0078d4;
+    }
+    QToolTip { 
+        color: #ffffff; 
+        background-color: #3c3c3c; 
+        border: 1px solid #555555; 
+        font-size: 16px; 
+    }
+"""
+
+# Status bar counts: categories, subjects in the dropdown, eBooks shown
+DATABASE_STATS_TEMPLATE = (
+    '<span style="color: #FFFFFF;">{0}</span> <span style="color: #FFFF00;">Categories</span>&nbsp;&nbsp;'
+    '<span style="color: #FFFFFF;">{1}</span> <span style="color: #FFFF00;">Subjects</span>&nbsp;&nbsp;'
+    '<span style="color: #FFFFFF;">{2}</span> <span style="color: #FFFF00;">Total eBooks</span>'
+)
+
+
+class BookQuerySignals(QObject):
+    """Delivers query results from a worker thread to the GUI thread (request id, books/error, criteria)."""
+    Ready = Signal(int, list, object)
+    Failed = Signal(int, str)
+
+
+class BookQueryTask(QRunnable):
+    """Run a BookService query off the GUI thread (empty criteria = all books)."""
+    
+    def __init__(self, RequestId: int, Service: BookService, Criteria: FilterCriteria):
+        super().__init__()
+        self.RequestId = RequestId
+        self.Service = Service
+        self.Criteria = Criteria
+        self.Signals = BookQuerySignals()
+    
+    def run(self) -> None:
+        # DatabaseManager hands this thread its own SQLite connection
+        try:
+            Books = self.Service.Query(self.Criteria.Category, self.Criteria.Subject,
+                                       self.Criteria.SearchTerm)
+        except Exception as Error:
+            self.Signals.Failed.emit(self.RequestId, str(Error))
+            return
+        self.Signals.Ready.emit(self.RequestId, Books, self.Criteria)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for Anderson's Library.
     
     Coordinates all UI components and provides the primary user interface.
     Handles application lifecycle, event routing, and user interactions.
+    
+    Event filters: never install one on this window or on QApplication; every
+    Qt event (mouse moves, paints) would become a Python call. Install it on the
+    narrowest child that needs it (e.g. BookGrid.ScrollArea.viewport()), return
+    False at once for event types outside a small frozenset, and install/remove
+    it in showEvent/hideEvent when it only matters while something is visible.
     """
     
     # ✅ FIXED: Using Signal instead of pyqtSignal
-    BookSelected = Signal(dict)  # Emitted when a book is selected
-    FiltersChanged = Signal(dict)  # Emitted when filters change
+    BookSelected = Signal(object)  # Emitted with the BookRow when a book is selected
+    FiltersChanged = Signal(object)  # Emitted with a FilterCriteria when filters change
     StatusUpdated = Signal(str)  # Emitted when status should update
     
+    FILTER_DEBOUNCE_MS = 150  # Quiet period before a burst of filter changes runs one query
+    FILTER_CACHE_SIZE = 32    # Most recent query results kept for repeat filter combinations
+    
+    _UiFont: Optional[QFont] = None  # Created on first ApplyTheme (needs a QApplication)
+    
     def __init__(self):
         """Initialize the main window and all components."""
         super().__init__()
@@ -77,11 +234,33 @@ class MainWindow(QMainWindow):
         self.StatusBar: Optional[QStatusBar] = None
         self.ProgressBar: Optional[QProgressBar] = None
         self.StatusLabel: Optional[QLabel] = None
+        self._AboutDialog: Optional[AboutDialog] = None  # Built on first Help > About
+        self._LastStats: Tuple[int, int, int] = (-1, -1, -1)  # Counts shown in DatabaseStatsLabel
+        self._CachedStats: Optional[Dict[str, Any]] = None  # Database counts until the next refresh
+        self._SubjectsInDropdown = 0  # Reported by FilterPanel.SubjectsUpdated
         
         # State management
         self.CurrentBooks: List[Dict[str, Any]] = []
         self.IsLoading: bool = False
-        self.LastFilterCriteria: Dict[str, Any] = {}
+        self.LastFilterCriteria: FilterCriteria = FilterCriteria()
+        
+        # One debounce timer for filter/search/reset requests: a burst of changes
+        # restarts it and only the latest request is applied
+        self._PendingCriteria: FilterCriteria = FilterCriteria()
+        self._FilterTimer = QTimer(self)
+        self._FilterTimer.setSingleShot(True)
+        self._FilterTimer.setInterval(self.FILTER_DEBOUNCE_MS)
+        self._FilterTimer.timeout.connect(self._ApplyPendingFilters)
+        
+        # Queries run one at a time on a private pool; results from superseded
+        # requests are dropped by id when they arrive
+        self._QueryPool = QThreadPool(self)
+        self._QueryPool.setMaxThreadCount(1)
+        self._QueryRequestId = 0
+        
+        # Query key -> book list, least recently used first; cleared on library refresh
+        self._FilterCache: "OrderedDict[Tuple[str, str, str], list]" = OrderedDict()
+        self._FilterCacheFloor = 0  # Results of requests up to this id predate the last clear
         
         # Initialize application
         self.InitializeComponents()
@@ -96,7 +275,7 @@ class MainWindow(QMainWindow):
         """Initialize core application components."""
         try:
             # Initialize database manager
-            self.DatabaseManager = DatabaseManager("Data/Databases/MyLibrary.db")
+            self.DatabaseManager = DatabaseManager(DEFAULT_DATABASE_PATH)
             
             # Connect to database
             if not self.DatabaseManager.Connect():
@@ -183,36 +362,52 @@ class MainWindow(QMainWindow):
             ExitAction.triggered.connect(self.close)
             FileMenu.addAction(ExitAction)
             
-            # View menu
-            ViewMenu = MenuBar.addMenu("&View")
-            
-            GridViewAction = QAction("&Grid View", self)
-            GridViewAction.triggered.connect(lambda: self.SetViewMode("grid"))
-            ViewMenu.addAction(GridViewAction)
-            
-            ListViewAction = QAction("&List View", self)
-            ListViewAction.triggered.connect(lambda: self.SetViewMode("list"))
-            ViewMenu.addAction(ListViewAction)
-            
-            # Tools menu
-            ToolsMenu = MenuBar.addMenu("&Tools")
-            
-            StatsAction = QAction("Database &Statistics", self)
-            StatsAction.triggered.connect(self.ShowDatabaseStats)
-            ToolsMenu.addAction(StatsAction)
-            
-            # Help menu
-            HelpMenu = MenuBar.addMenu("&Help")
-            
-            AboutAction = QAction("&About", self)
-            AboutAction.triggered.connect(self.ShowAbout)
-            HelpMenu.addAction(AboutAction)
+            # View, Tools and Help hold no shortcuts, so their actions wait until first opened
+            self._AddLazyMenu(MenuBar, "&View", self._PopulateViewMenu)
+            self._AddLazyMenu(MenuBar, "&Tools", self._PopulateToolsMenu)
+            self._AddLazyMenu(MenuBar, "&Help", self._PopulateHelpMenu)
             
             self.Logger.debug("Menu bar created successfully")
             
         except Exception as Error:
             self.Logger.error(f"Failed to create menu bar: {Error}")
     
+    def _AddLazyMenu(self, MenuBar: QMenuBar, Title: str, Populate) -> QMenu:
+        """Add a top-level menu whose actions are built by Populate(Menu) the first time it opens."""
+        Menu = MenuBar.addMenu(Title)
+        
+        def PopulateOnce() -> None:
+            Menu.aboutToShow.disconnect(PopulateOnce)
+            try:
+                Populate(Menu)
+            except Exception as Error:
+                self.Logger.error(f"Failed to build menu {Title}: {Error}")
+        
+        Menu.aboutToShow.connect(PopulateOnce)
+        return Menu
+    
+    def _PopulateViewMenu(self, ViewMenu: QMenu) -> None:
+        """Build the View menu actions."""
+        GridViewAction = QAction("&Grid View", self)
+        GridViewAction.triggered.connect(partial(self.SetViewMode, "grid"))
+        ViewMenu.addAction(GridViewAction)
+        
+        ListViewAction = QAction("&List View", self)
+        ListViewAction.triggered.connect(partial(self.SetViewMode, "list"))
+        ViewMenu.addAction(ListViewAction)
+    
+    def _PopulateToolsMenu(self, ToolsMenu: QMenu) -> None:
+        """Build the Tools menu actions."""
+        StatsAction = QAction("Database &Statistics", self)
+        StatsAction.triggered.connect(self.ShowDatabaseStats)
+        ToolsMenu.addAction(StatsAction)
+    
+    def _PopulateHelpMenu(self, HelpMenu: QMenu) -> None:
+        """Build the Help menu actions."""
+        AboutAction = QAction("&About", self)
+        AboutAction.triggered.connect(self.ShowAbout)
+        HelpMenu.addAction(AboutAction)
+    
     
     
     def CreateStatusBar(self) -> None:
@@ -246,16 +441,20 @@ class MainWindow(QMainWindow):
                 self.Logger.warning("Components not available for signal connection")
                 return
             
+            # High-frequency signals are queued so the emitter returns at once; the
+            # filter debounce and the status label take only the latest value
+            QueuedConnection = Qt.ConnectionType.QueuedConnection
+            
             # Filter panel signals
-            self.FilterPanel.FiltersChanged.connect(self.OnFiltersChanged)
+            self.FilterPanel.FiltersChanged.connect(self.OnFiltersChanged, QueuedConnection)
             self.FilterPanel.SearchRequested.connect(self.OnSearchRequested)
             self.FilterPanel.ViewModeChanged.connect(self.SetViewMode)
-            self.FilterPanel.SubjectsUpdated.connect(self.UpdateDatabaseStats)
+            self.FilterPanel.SubjectsUpdated.connect(self._OnSubjectsUpdated)
             
             # Book grid signals
             self.BookGrid.BookSelected.connect(self.OnBookSelected)
             self.BookGrid.BookOpened.connect(self.OnBookOpened)
-            self.BookGrid.SelectionChanged.connect(self.OnSelectionChanged)
+            self.BookGrid.SelectionChanged.connect(self.OnSelectionChanged, QueuedConnection)
             
             # Internal signals
             self.StatusUpdated.connect(self.UpdateStatusBar)
@@ -270,115 +469,13 @@ class MainWindow(QMainWindow):
     def ApplyTheme(self) -> None:
         """Apply the application theme and styling."""
         try:
-            # Set application font
-            Font = QFont("Segoe UI", 9)
-            self.setFont(Font)
+            # Set application font (built once, shared by every window)
+            if MainWindow._UiFont is None:
+                MainWindow._UiFont = QFont(UI_FONT_FAMILY, UI_FONT_POINT_SIZE)
+            self.setFont(MainWindow._UiFont)
             
             # Apply modern dark theme
-            self.setStyleSheet("""
-                QMainWindow {
-                    background-color: qlineargradient(
-                        spread:repeat, x1:1, y1:0, x2:1, y2:1, 
-                        stop:0.00480769 rgba(3, 50, 76, 255), 
-                        stop:0.293269 rgba(6, 82, 125, 255), 
-                        stop:0.514423 rgba(8, 117, 178, 255), 
-                        stop:0.745192 rgba(7, 108, 164, 255), 
-                        stop:1 rgba(3, 51, 77, 255)
-                    );
-                    color: #ffffff;
-                }
-                
-                QMenuBar {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: none;
-                    padding: 4px;
-                }
-                
-                QMenuBar::item {
-                    background-color: transparent;
-                    padding: 6px 12px;
-                    border-radius: 4px;
-                }
-                
-                QMenuBar::item:selected {
-                    background-color: #0078d4;
-                }
-                
-                QMenu {
-                    background-color: #3c3c3c;
-                    color: #ffffff;
-                    border: 1px solid #555555;
-                    padding: 4px;
-                }
-                
-                QMenu::item {
-                    padding: 6px 20px;
-                    border-radius: 4px;
-                }
-                
-                QMenu::item:selected {
-                    background-color: #0078d4;
-                }
-                
-                QToolBar {
-                    background-color: #3c3c3c;
-                    border: none;
-                    spacing: 4px;
-                    padding: 4px;
-                }
-                
-                QPushButton {
-                    background-color: #0078d4;
-                    color: #ffffff;
-                    border: none;
-                    padding: 8px 16px;
-                    border-radius: 4px;
-                    font-weight: 500;
-                }
-                
-                QPushButton:hover {
-                    background-color: #106ebe;
-                }
-                
-                QPushButton:pressed {
-                    background-color: #005a9e;
-                }
-                
-                QStatusBar {
-                    background-color: #FF0000;
-                    color: #ffffff;
-                    border-top: 1px solid #555555;
-                }
-                
-                QProgressBar {
-                    border: 1px solid #555555;
-                    border-radius: 4px;
-                    text-align: center;
-                    background-color: #2b2b2b;
-                    color: #ffffff;
-                }
-                
-                QProgressBar::chunk {
-                    background-color: #0078d4;
-                    border-radius: 3px;
-                }
-                
-                QSplitter::handle {
-                    background-color: #555555;
-                    width: 2px;
-                }
-                
-                QSplitter::handle:hover {
-                    background-color: #0078d4;
-                }
-                QToolTip { 
-                    color: #ffffff; 
-                    background-color: #3c3c3c; 
-                    border: 1px solid #555555; 
-                    font-size: 16px; 
-                }
-            """)
+            self.setStyleSheet(MAIN_WINDOW_STYLESHEET)
             
             self.Logger.debug("Theme applied successfully")
             
@@ -388,9 +485,8 @@ class MainWindow(QMainWindow):
     def LoadInitialData(self) -> None:
         """Load initial data when application starts."""
         try:
-            # Force re-parsing of this method
-            if self.BookGrid:
-                self.BookGrid.SetBooks([])
+            # BookGrid starts empty and fills itself from its own background load,
+            # so the grid is populated in one pass
             self.UpdateDatabaseStats()
             
         except Exception as Error:
@@ -399,94 +495,122 @@ class MainWindow(QMainWindow):
             self.UpdateStatusBar("Failed to load library")
     
     def LoadAllBooks(self) -> None:
-        """Load all books and display them."""
-        try:
-            if not self.BookService:
-                self.Logger.error("BookService not available")
-                return
-            
-            # Get all books
-            self.CurrentBooks = self.BookService.GetAllBooks()
-            
-            # Update book grid
-            if self.BookGrid:
-                self.BookGrid.SetBooks(self.CurrentBooks)
-            
-            # Update status
-            BookCount = len(self.CurrentBooks)
-            self.UpdateStatusBar(f"Showing all books: {BookCount} books")
-            self.UpdateDatabaseStats()
-            
-            self.HideProgress()
-            self.Logger.info(f"Loaded {BookCount} books successfully")
-            
-        except Exception as Error:
-            self.Logger.error(f"Failed to load books: {Error}")
-            self.HideProgress()
-            self.UpdateStatusBar("Failed to load books")
-            self.ShowError(f"Failed to load books: {Error}")
+        """Show all books: the unfiltered query on the same path as every filter."""
+        self.ApplyFilters(FilterCriteria())
     
-    def OnFiltersChanged(self, Criteria: Dict[str, Any]) -> None:
+    @Slot(object)
+    def OnFiltersChanged(self, Criteria: FilterCriteria) -> None:
         """Handle filter changes from filter panel."""
         try:
             self.Logger.debug(f"Filters changed: {Criteria}")
             self.LastFilterCriteria = Criteria
             
             self.ShowProgress("Filtering books...")
-            QTimer.singleShot(50, lambda: self.ApplyFilters(Criteria))
+            self._ScheduleFilters(Criteria)
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle filter change: {Error}")
             self.HideProgress()
     
-    def ApplyFilters(self, Criteria: Dict[str, Any]) -> None:
-        """Apply filters and update book display."""
+    def _ScheduleFilters(self, Criteria: FilterCriteria) -> None:
+        """Queue a filter request on the debounce timer (replaces any pending one)."""
+        self._PendingCriteria = Criteria
+        self._FilterTimer.start()
+    
+    @Slot()
+    def _ApplyPendingFilters(self) -> None:
+        """Apply the latest queued filter request."""
+        self.ApplyFilters(self._PendingCriteria)
+    
+    def ApplyFilters(self, Criteria: FilterCriteria) -> None:
+        """Run the filter query on the query worker; _OnBooksReady displays the result."""
         try:
             if not self.BookService:
                 return
             
-            # Extract filter criteria
-            Category = Criteria.get('Category', '')
-            Subject = Criteria.get('Subject', '')
-            SearchTerm = Criteria.get('SearchTerm', '')
+            # Category, subject and search combine in one query; covers load per card
+            self._StartQuery(Criteria)
             
-            # Get filtered books
-            if SearchTerm:
-                FilteredBooks = self.BookService.SearchBooks(SearchTerm)
-            elif Category or Subject:
-                FilteredBooks = self.BookService.GetBooksByFilters(Category, Subject)
-            else:
-                FilteredBooks = self.BookService.GetAllBooks()
+        except Exception as Error:
+            self.Logger.error(f"Failed to apply filters: {Error}")
+            self.HideProgress()
+            self.UpdateStatusBar("Filter operation failed")
+    
+    @staticmethod
+    def _QueryKey(Criteria: FilterCriteria) -> Tuple[str, str, str]:
+        """Cache key for a query: the fields BookService filters on."""
+        return (Criteria.SearchTerm, Criteria.Category, Criteria.Subject)
+    
+    def _StartQuery(self, Criteria: FilterCriteria) -> None:
+        """Queue a book query on the worker pool, superseding any query still in flight."""
+        self._QueryRequestId += 1
+        
+        Key = self._QueryKey(Criteria)
+        if Key in self._FilterCache:
+            self._FilterCache.move_to_end(Key)
+            self._OnBooksReady(self._QueryRequestId, self._FilterCache[Key], Criteria)
+            return
+        
+        Task = BookQueryTask(self._QueryRequestId, self.BookService, Criteria)
+        Task.Signals.Ready.connect(self._OnBooksReady, Qt.ConnectionType.QueuedConnection)
+        Task.Signals.Failed.connect(self._OnBooksFailed, Qt.ConnectionType.QueuedConnection)
+        self._QueryPool.start(Task)
+    
+    @Slot(int, list, object)
+    def _OnBooksReady(self, RequestId: int, Books: list, Criteria: FilterCriteria) -> None:
+        """Show the result of a background query (queued to the GUI thread)."""
+        try:
+            # Cache even superseded results; the grid only reads the list, so it is shared
+            if RequestId > self._FilterCacheFloor:
+                Key = self._QueryKey(Criteria)
+                self._FilterCache[Key] = Books
+                self._FilterCache.move_to_end(Key)
+                if len(self._FilterCache) > self.FILTER_CACHE_SIZE:
+                    self._FilterCache.popitem(last=False)
+            
+            if RequestId != self._QueryRequestId:
+                return  # Superseded by a newer filter, search or reset
             
             # Update current books
-            self.CurrentBooks = FilteredBooks
+            self.CurrentBooks = Books
             
             # Update book grid
             if self.BookGrid:
                 self.BookGrid.SetBooks(self.CurrentBooks)
             
             # Update status
-            self.UpdateFilterStatus(Criteria, len(FilteredBooks))
+            BookCount = len(Books)
+            self.UpdateFilterStatus(Criteria, BookCount)
             self.HideProgress()
             self.UpdateDatabaseStats()
             
-            self.Logger.debug(f"Applied filters, showing {len(FilteredBooks)} books")
+            self.Logger.debug(f"Query {RequestId} done, showing {BookCount} books")
             
         except Exception as Error:
-            self.Logger.error(f"Failed to apply filters: {Error}")
+            self.Logger.error(f"Failed to show query results: {Error}")
             self.HideProgress()
             self.UpdateStatusBar("Filter operation failed")
     
+    @Slot(int, str)
+    def _OnBooksFailed(self, RequestId: int, Message: str) -> None:
+        """Report a background query that raised (queued to the GUI thread)."""
+        if RequestId != self._QueryRequestId:
+            return
+        
+        self.Logger.error(f"Failed to load books: {Message}")
+        self.HideProgress()
+        self.UpdateStatusBar("Failed to load books")
+    
+    @Slot(str)
     def OnSearchRequested(self, SearchTerm: str) -> None:
         """Handle search request from filter panel."""
         try:
             if not SearchTerm.strip():
-                self.LoadAllBooks()
+                self._ScheduleFilters(FilterCriteria())  # Cleared search shows everything
                 return
             
             self.ShowProgress(f"Searching for '{SearchTerm}'...")
-            Criteria = {'SearchTerm': SearchTerm}
-            QTimer.singleShot(50, lambda: self.ApplyFilters(Criteria))
+            self._ScheduleFilters(FilterCriteria(SearchTerm=SearchTerm))
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle search request: {Error}")
@@ -496,13 +620,14 @@ class MainWindow(QMainWindow):
         """Handle reset request from filter panel."""
         try:
             self.ShowProgress("Resetting filters...")
-            self.LastFilterCriteria = {}
-            QTimer.singleShot(50, self.LoadAllBooks)
+            self.LastFilterCriteria = FilterCriteria()
+            self._ScheduleFilters(self.LastFilterCriteria)
             
         except Exception as Error:
             self.Logger.error(f"Failed to handle reset request: {Error}")
             self.HideProgress()
     
+    @Slot(object)
     def OnBookSelected(self, Book: Dict[str, Any]) -> None:
         """Handle book selection from book grid."""
         try:
@@ -512,6 +637,7 @@ class MainWindow(QMainWindow):
         except Exception as Error:
             self.Logger.error(f"Failed to handle book selection: {Error}")
     
+    @Slot(object)
     def OnBookOpened(self, Book: Dict[str, Any]) -> None:
         """Handle book opening from book grid."""
         try:
@@ -519,7 +645,8 @@ class MainWindow(QMainWindow):
             self.Logger.info(f"Opening book: {BookTitle}")
             
             if self.BookService:
-                Success = self.BookService.OpenBook(BookTitle)
+                # Open by primary key; a title search can resolve to a different book
+                Success = self.BookService.OpenBook(Book.get('id'))
                 if Success:
                     self.UpdateStatusBar(f"Opened: {BookTitle}")
                 else:
@@ -529,6 +656,7 @@ class MainWindow(QMainWindow):
             self.Logger.error(f"Failed to handle book opening: {Error}")
             self.ShowError(f"Failed to open book: {Error}")
     
+    @Slot(int)
     def OnSelectionChanged(self, Count: int) -> None:
         """Handle selection change in book grid."""
         try:
@@ -542,26 +670,31 @@ class MainWindow(QMainWindow):
         except Exception as Error:
             self.Logger.error(f"Failed to handle selection change: {Error}")
     
+    @Slot()
     def RefreshLibrary(self) -> None:
         """Refresh the entire library display."""
         try:
             self.Logger.info("Refreshing library")
             
             # Clear caches
+            self._FilterCache.clear()
+            self._FilterCacheFloor = self._QueryRequestId
+            self._CachedStats = None
             if self.BookService:
                 self.BookService.ClearCache()
+            QPixmapCache.clear()  # Decoded covers are keyed by book id and may be stale too
             
-            # Refresh filter panel
+            # Refresh filter panel; its reset emits one FiltersChanged that reloads the books
             if self.FilterPanel:
                 self.FilterPanel.RefreshData()
-            
-            # Reload books
-            self.LoadAllBooks()
+            else:
+                self.LoadAllBooks()
             
         except Exception as Error:
             self.Logger.error(f"Failed to refresh library: {Error}")
             self.ShowError(f"Failed to refresh library: {Error}")
     
+    @Slot(str)
     def SetViewMode(self, Mode: str) -> None:
         """Set the view mode for book display."""
         try:
@@ -572,13 +705,14 @@ class MainWindow(QMainWindow):
         except Exception as Error:
             self.Logger.error(f"Failed to set view mode: {Error}")
     
+    @Slot()
     def ShowDatabaseStats(self) -> None:
         """Show database statistics dialog."""
         try:
             if not self.BookService:
                 return
             
-            Stats = self.BookService.GetDatabaseStats()
+            Stats = self._GetStats()
             Message = f"""Database Statistics:
             
 Books: {Stats.get('Books', 0)}
@@ -592,30 +726,32 @@ Current Display: {len(self.CurrentBooks)} books"""
         except Exception as Error:
             self.Logger.error(f"Failed to show database stats: {Error}")
     
+    @Slot()
     def ShowAbout(self) -> None:
         """Show about dialog."""
         try:
-            about_dialog = AboutDialog(self)
-            about_dialog.exec()
+            if self._AboutDialog is None:
+                self._AboutDialog = AboutDialog(self)
+            self._AboutDialog.exec()
             
         except Exception as Error:
             self.Logger.error(f"Failed to show about dialog: {Error}")
     
-    def UpdateFilterStatus(self, Criteria: Dict[str, Any], ResultCount: int) -> None:
+    def UpdateFilterStatus(self, Criteria: FilterCriteria, ResultCount: int) -> None:
         """Update status bar with filter information."""
         try:
-            if not Criteria:
+            if not any(Criteria):
                 self.UpdateStatusBar(f"Showing all books: {ResultCount} books")
                 return
             
             FilterParts = []
             
-            if Criteria.get('SearchTerm'):
-                FilterParts.append(f"Search: '{Criteria['SearchTerm']}'")
-            if Criteria.get('Category'):
-                FilterParts.append(f"Category: {Criteria['Category']}")
-            if Criteria.get('Subject'):
-                FilterParts.append(f"Subject: {Criteria['Subject']}")
+            if Criteria.SearchTerm:
+                FilterParts.append(f"Search: '{Criteria.SearchTerm}'")
+            if Criteria.Category:
+                FilterParts.append(f"Category: {Criteria.Category}")
+            if Criteria.Subject:
+                FilterParts.append(f"Subject: {Criteria.Subject}")
             
             if FilterParts:
                 FilterText = " | ".join(FilterParts)
@@ -626,21 +762,32 @@ Current Display: {len(self.CurrentBooks)} books"""
         except Exception as Error:
             self.Logger.error(f"Failed to update filter status: {Error}")
     
+    @Slot(int)
+    def _OnSubjectsUpdated(self, Count: int) -> None:
+        """Record the subject dropdown size and refresh the stats label."""
+        self._SubjectsInDropdown = Count
+        self.UpdateDatabaseStats()
+    
+    def _GetStats(self) -> Dict[str, Any]:
+        """Database counts, fetched once and reused until RefreshLibrary invalidates them."""
+        if self._CachedStats is None:
+            self._CachedStats = self.BookService.GetDatabaseStats()
+        return self._CachedStats
+    
+    @Slot()
     def UpdateDatabaseStats(self) -> None:
         """Update database statistics in status bar."""
         try:
             if not self.BookService or not hasattr(self, 'DatabaseStatsLabel'):
                 return
             
-            Stats = self.BookService.GetDatabaseStats()
+            Stats = self._GetStats()
             
             TotalBooksCount = Stats.get('Books', 0) # Total books in DB
             DisplayedBooksCount = len(self.CurrentBooks) # Books currently displayed
 
-            # Get current subjects in dropdown from FilterPanel
-            SubjectsInDropdown = 0
-            if self.FilterPanel and self.FilterPanel.SubjectComboBox:
-                SubjectsInDropdown = self.FilterPanel.SubjectComboBox.count() - 1 # Exclude "All Subjects"
+            # Subjects in the FilterPanel dropdown, as last reported by SubjectsUpdated
+            SubjectsInDropdown = self._SubjectsInDropdown
 
             # Determine which total to display
             if DisplayedBooksCount > 0:
@@ -648,8 +795,12 @@ Current Display: {len(self.CurrentBooks)} books"""
             else:
                 DisplayTotal = TotalBooksCount
 
-            StatsText = f"<span style=\"color: #FFFFFF;\">{Stats.get('Categories', 0)}</span> <span style=\"color: #FFFF00;\">Categories</span>&nbsp;&nbsp;<span style=\"color: #FFFFFF;\">{SubjectsInDropdown}</span> <span style=\"color: #FFFF00;\">Subjects</span>&nbsp;&nbsp;<span style=\"color: #FFFFFF;\">{DisplayTotal}</span> <span style=\"color: #FFFF00;\">Total eBooks</span>"
-            self.DatabaseStatsLabel.setText(StatsText)
+            # Rich-text setText re-runs Qt's HTML layout, so only touch the label on change
+            Counts = (Stats.get('Categories', 0), SubjectsInDropdown, DisplayTotal)
+            if Counts == self._LastStats:
+                return
+            self._LastStats = Counts
+            self.DatabaseStatsLabel.setText(DATABASE_STATS_TEMPLATE.format(*Counts))
             
         except Exception as Error:
             self.Logger.error(f"Failed to update database stats: {Error}")
@@ -666,6 +817,7 @@ Current Display: {len(self.CurrentBooks)} books"""
         except Exception as Error:
             self.Logger.error(f"Failed to show progress: {Error}")
     
+    @Slot()
     def HideProgress(self) -> None:
         """Hide progress indication."""
         try:
@@ -676,6 +828,7 @@ Current Display: {len(self.CurrentBooks)} books"""
         except Exception as Error:
             self.Logger.error(f"Failed to hide progress: {Error}")
     
+    @Slot(str)
     def UpdateStatusBar(self, Message: str) -> None:
         """Update status bar message."""
         try:
@@ -707,6 +860,18 @@ Current Display: {len(self.CurrentBooks)} books"""
         try:
             self.Logger.info("Application closing")
             
+            # Cancel background thumbnail rendering; its worker processes would outlive the window
+            if self.BookService:
+                self.BookService.StopThumbnailPriming()
+            
+            # Let running queries finish before their connections' manager closes:
+            # book queries use the private pool; grid loads, cover fetches and
+            # filter-panel lookups use the global one
+            self._QueryRequestId += 1
+            for Pool in (self._QueryPool, QThreadPool.globalInstance()):
+                Pool.clear()
+                Pool.waitForDone()
+            
             # Close database connection
             if self.DatabaseManager:
                 self.DatabaseManager.Close()
@@ -11,15 +11,22 @@ Purpose: Package initialization for Source/Interface module. Provides clean
 import interfaces and package-level configuration.
 """
 
+from Source.Utils.LazyExports import MakeLazyExports
+
 # Package version and metadata
 __version__ = "2.0.0"
 __author__ = "Herb Bowers - Project Himalaya"
 __email__ = "HimalayaProject1@gmail.com"
 
-# Package-level imports can be added here as needed
-# Example:
-# from .module_name import ClassName
+# Widgets are imported on first access, so importing a single Interface module
+# (e.g. FilterPanel) does not pull in MainWindow and BookGrid with it.
+_LAZY_IMPORTS = {
+    "MainWindow": ("Source.Interface.MainWindow", "MainWindow"),
+    "FilterPanel": ("Source.Interface.FilterPanel", "FilterPanel"),
+    "FilterCriteria": ("Source.Interface.FilterPanel", "FilterCriteria"),
+    "BookGrid": ("Source.Interface.BookGrid", "BookGrid"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
-__all__ = [
-    # Add public interface exports here
-]
+__getattr__, __dir__ = MakeLazyExports(__name__, _LAZY_IMPORTS)
@@ -10,47 +10,39 @@ Follows the exact pattern from Legacy/Andy.py to prevent system lockups.
 
 import sys
 import logging
+import logging.handlers
 import os
+import queue
+import atexit
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
-# Ensure application's working directory is set correctly
-os.chdir(Path(__file__).parent)
+# Application root - all paths are resolved against it (no process-wide chdir)
+APP_ROOT = Path(__file__).resolve().parent
 
 # Ensure Source directory is in Python path
-SourcePath = Path(__file__).parent / "Source"
+SourcePath = APP_ROOT / "Source"
 if str(SourcePath) not in sys.path:
     sys.path.insert(0, str(SourcePath))
 
-try:
-    from PySide6.QtWidgets import QApplication, QMessageBox
-    from PySide6.QtCore import Qt
-    from PySide6.QtGui import QFont, QIcon
-except ImportError as ImportError:
-    print("❌ PySide6 is not installed!")
-    print("💡 Please install it with: pip install PySide6")
-    sys.exit(1)
-
-# Import our modules using original pattern
-try:
-    from Source.Interface.MainWindow import MainWindow
-    from Source.Core.DatabaseManager import DatabaseManager
-    from Source.Core.BookService import BookService
-except ImportError as Error:
-    print(f"❌ Failed to import application modules: {Error}")
-    print("💡 Make sure all Source files are in place")
-    sys.exit(1)
+# NOTE: PySide6 and the application modules are imported lazily inside
+# RunApplicationOriginalPattern() so --help/--version never pay the Qt import cost.
 
 
 def PrintStartupBanner() -> None:
     """Print the professional startup banner"""
-    print("🏔️ Anderson's Library - Professional Edition")
-    print("=" * 50)
-    print("📚 Digital Library Management System")
-    print("🎯 Project Himalaya - BowersWorld.com")
-    print("⚡ Modular Architecture - Design Standard v1.8")
-    print("🔧 Using Original CustomWindow Pattern")
-    print("=" * 50)
+    Rule = "=" * 50
+    sys.stdout.write(
+        "🏔️ Anderson's Library - Professional Edition\n"
+        f"{Rule}\n"
+        "📚 Digital Library Management System\n"
+        "🎯 Project Himalaya - BowersWorld.com\n"
+        "⚡ Modular Architecture - Design Standard v1.8\n"
+        "🔧 Using Original CustomWindow Pattern\n"
+        f"{Rule}\n"
+    )
+    sys.stdout.flush()
 
 
 def ValidateEnvironment() -> bool:
@@ -71,62 +63,114 @@ def ValidateEnvironment() -> bool:
         "Source/Interface/MainWindow.py",
     ]
     
+    DatabasePath = "Assets/my_library.db"
+    
+    # Group required files by directory so each directory is listed only once
+    FilesByDirectory = defaultdict(set)
+    for FilePath in RequiredFiles + [DatabasePath]:
+        FilesByDirectory[str(Path(FilePath).parent)].add(Path(FilePath).name)
+    
+    DirectoryContents = {}
+    for Directory in FilesByDirectory:
+        try:
+            with os.scandir(APP_ROOT / Directory) as Entries:
+                DirectoryContents[Directory] = {Entry.name for Entry in Entries}
+        except OSError:
+            DirectoryContents[Directory] = set()
+    
+    def FileExists(FilePath) -> bool:
+        FilePath = Path(FilePath)
+        return FilePath.name in DirectoryContents[str(FilePath.parent)]
+    
     MissingFiles = []
     PresentFiles = []
     
     for FilePath in RequiredFiles:
-        if Path(FilePath).exists():
+        if FileExists(FilePath):
             print(f" ✅ {FilePath}")
             PresentFiles.append(FilePath)
         else:
             print(f" ❌ {FilePath}")
             MissingFiles.append(FilePath)
     
-    print(f"📊 Files: {len(PresentFiles)} present, {len(MissingFiles)} missing")
-    
-    # Check database
-    print("🗄️ Testing database connection...")
-    DatabasePath = Path("Assets/my_library.db")
-    if DatabasePath.exists():
-        print(f" ✅ Found database: {DatabasePath}")
+    # Summary block is emitted in a single write
+    Summary = [
+        f"📊 Files: {len(PresentFiles)} present, {len(MissingFiles)} missing",
+        "🗄️ Testing database connection...",
+    ]
+    if FileExists(DatabasePath):
+        Summary.append(f" ✅ Found database: {DatabasePath}")
     else:
-        print(f" ⚠️ Database not found: {DatabasePath}")
-        print(" 💡 Application will attempt to create/find database")
-    
-    # Check PySide6 and CustomWindow compatibility
-    print("🐍 Testing Python imports...")
-    try:
-        from PySide6.QtWidgets import QApplication
-        print(" ✅ PySide6 available")
-    except ImportError as Error:
-        print(f" ❌ Import error: {Error}")
-        return False
+        Summary.append(f" ⚠️ Database not found: {DatabasePath}")
+        Summary.append(" 💡 Application will attempt to create/find database")
     
-    print("=" * 50)
+    Summary.append("=" * 50)
     
     if MissingFiles:
-        print(f"❌ Missing {len(MissingFiles)} required files!")
-        return False
+        Summary.append(f"❌ Missing {len(MissingFiles)} required files!")
+    else:
+        Summary.append("✅ ENVIRONMENT VALIDATION PASSED")
     
-    print("✅ ENVIRONMENT VALIDATION PASSED")
-    return True
+    sys.stdout.write("\n".join(Summary) + "\n")
+    sys.stdout.flush()
+    return not MissingFiles
 
 
 def InitializeLogging() -> None:
-    """Initialize application logging"""
+    """
+    Initialize application logging.
+    
+    Log calls only enqueue records; a QueueListener thread performs the actual
+    file and console writes so the GUI thread never blocks on I/O.
+    """
     # Create logs directory if it doesn't exist
-    LogsDir = Path("Logs")
+    LogsDir = APP_ROOT / "Logs"
     LogsDir.mkdir(exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='[%(asctime)s] %(name)s - %(levelname)s: %(message)s',
-        handlers=[
-            logging.FileHandler(LogsDir / "anderson_library.log"),
-            logging.StreamHandler(sys.stdout)
-        ]
+    Formatter = logging.Formatter('[%(asctime)s] %(name)s - %(levelname)s: %(message)s')
+    
+    FileHandler = logging.FileHandler(LogsDir / "anderson_library.log")
+    FileHandler.setFormatter(Formatter)
+    StreamHandler = logging.StreamHandler(sys.stdout)
+    StreamHandler.setFormatter(Formatter)
+    
+    # Batch disk writes; errors are flushed immediately
+    BufferedFileHandler = logging.handlers.MemoryHandler(
+        capacity=256, flushLevel=logging.ERROR, target=FileHandler
     )
+    
+    LogQueue = queue.Queue(-1)
+    RootLogger = logging.getLogger()
+    RootLogger.setLevel(logging.INFO)
+    RootLogger.addHandler(logging.handlers.QueueHandler(LogQueue))
+    
+    Listener = logging.handlers.QueueListener(
+        LogQueue, BufferedFileHandler, StreamHandler, respect_handler_level=True
+    )
+    Listener.start()
+    
+    # Stop the listener first (drains the queue), then flush buffered file output
+    atexit.register(BufferedFileHandler.close)
+    atexit.register(Listener.stop)
+
+
+def InstallExceptionHook() -> None:
+    """
+    Log any exception that escapes a Qt slot or the main thread.
+    
+    UI event handlers carry no try/except of their own (it costs on every
+    keystroke and slider tick); this single hook reports what they raise.
+    """
+    HookLogger = logging.getLogger("UncaughtException")
+    
+    def LogUncaughtException(ExceptionType, ExceptionValue, ExceptionTraceback) -> None:
+        if issubclass(ExceptionType, KeyboardInterrupt):
+            sys.__excepthook__(ExceptionType, ExceptionValue, ExceptionTraceback)
+            return
+        HookLogger.error("Uncaught exception",
+                         exc_info=(ExceptionType, ExceptionValue, ExceptionTraceback))
+    
+    sys.excepthook = LogUncaughtException
 
 
 def RunApplicationOriginalPattern() -> int:
@@ -148,19 +192,41 @@ def RunApplicationOriginalPattern() -> int:
         
         # Initialize logging
         InitializeLogging()
+        InstallExceptionHook()
         Logger = logging.getLogger("AndersonLibrary")
         
         print("🚀 Starting Anderson's Library...")
         print("=" * 50)
         
+        # Deferred imports - only paid when the GUI is actually started
+        try:
+            from PySide6.QtWidgets import QApplication, QMessageBox
+        except ImportError:
+            print("❌ PySide6 is not installed!")
+            print("💡 Please install it with: pip install PySide6")
+            return 1
+        
+        # Import our modules using original pattern
+        try:
+            from Source import MainWindow
+            from Source.Interface.IconCache import GetIcon
+        except ImportError as Error:
+            print(f"❌ Failed to import application modules: {Error}")
+            print("💡 Make sure all Source files are in place")
+            return 1
+        
+        # One-time database setup (WAL, indexes, full-text search) before Qt starts
+        from Source.Core.DatabaseManager import DatabaseManager, DEFAULT_DATABASE_PATH
+        DatabaseManager.InitializeSchema(DEFAULT_DATABASE_PATH)
+        
         # Create QApplication (like original Andy.py)
         App = QApplication(sys.argv)
         App.setApplicationName("Anderson's Library")
         App.setApplicationVersion("2.0")
         App.setOrganizationName("Project Himalaya")
         App.setOrganizationDomain("BowersWorld.com")
-        AppIconPath = Path(__file__).parent / "Assets" / "icon.png"
-        AppIcon = QIcon(str(AppIconPath))
+        AppIconPath = APP_ROOT / "Assets" / "icon.png"
+        AppIcon = GetIcon(str(AppIconPath))
         if AppIcon.isNull():
             Logger.warning(f"Failed to load application icon from {AppIconPath}")
         App.setWindowIcon(AppIcon)
@@ -206,29 +272,32 @@ def RunApplicationOriginalPattern() -> int:
 
 def ShowQuickHelp() -> None:
     """Show quick help information"""
-    print("\n🆘 Anderson's Library - Quick Help")
-    print("=" * 40)
-    print("📋 Common Issues:")
-    print("• Missing PySide6: pip install PySide6")
-    print("• Missing CustomWindow: cp Legacy/CustomWindow.py Source/Interface/")
-    print("• Missing files: Check Source/ directory structure")
-    print("• Database issues: Ensure Assets/my_library.db exists")
-    print("• Import errors: Verify all __init__.py files exist")
-    print("\n📁 Required Directory Structure:")
-    print("Source/")
-    print("├── Core/")
-    print("├── Data/") 
-    print("├── Interface/")
-    print("│   ├── CustomWindow.py  ← Critical!")
-    print("│   ├── MainWindow.py")
-    print("│   ├── FilterPanel.py")
-    print("│   └── BookGrid.py")
-    print("└── Utils/")
-    print("\n🔧 Original Pattern:")
-    print("• main_window = MainWindow()          # Content widget")
-    print("• window = CustomWindow(..., main_window)  # Wrapper")
-    print("• window.showMaximized()             # Display")
-    print("\n🔗 Contact: HimalayaProject1@gmail.com")
+    sys.stdout.write(
+        "\n🆘 Anderson's Library - Quick Help\n"
+        f"{'=' * 40}\n"
+        "📋 Common Issues:\n"
+        "• Missing PySide6: pip install PySide6\n"
+        "• Missing CustomWindow: cp Legacy/CustomWindow.py Source/Interface/\n"
+        "• Missing files: Check Source/ directory structure\n"
+        "• Database issues: Ensure Assets/my_library.db exists\n"
+        "• Import errors: Verify all __init__.py files exist\n"
+        "\n📁 Required Directory Structure:\n"
+        "Source/\n"
+        "├── Core/\n"
+        "├── Data/\n"
+        "├── Interface/\n"
+        "│   ├── CustomWindow.py  ← Critical!\n"
+        "│   ├── MainWindow.py\n"
+        "│   ├── FilterPanel.py\n"
+        "│   └── BookGrid.py\n"
+        "└── Utils/\n"
+        "\n🔧 Original Pattern:\n"
+        "• main_window = MainWindow()          # Content widget\n"
+        "• window = CustomWindow(..., main_window)  # Wrapper\n"
+        "• window.showMaximized()             # Display\n"
+        "\n🔗 Contact: HimalayaProject1@gmail.com\n"
+    )
+    sys.stdout.flush()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,41 @@
+# File: LazyExports.py
+# Path: Source/Utils/LazyExports.py
+# Standard: AIDEV-PascalCase-1.8
+# Created: 2026-10-15
+# Last Modified: 2026-10-15  09:00AM
+"""
+Description: Lazy Package Exports for Anderson's Library
+Builds the PEP 562 module __getattr__/__dir__ pair that package __init__ files
+use to import their public names on first access instead of at import time.
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def MakeLazyExports(PackageName: str,
+                    LazyImports: Dict[str, Tuple[str, str]]) -> Tuple[Callable, Callable]:
+    """
+    Create the module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        PackageName: The package's __name__
+        LazyImports: Exported name -> (module to import, attribute in that module)
+
+    Returns:
+        (__getattr__, __dir__) to assign at package level
+    """
+    def __getattr__(Name: str):
+        """Resolve a lazily exported name and cache it on the package module."""
+        if Name not in LazyImports:
+            raise AttributeError(f"module {PackageName!r} has no attribute {Name!r}")
+        ModuleName, AttributeName = LazyImports[Name]
+        Value = getattr(importlib.import_module(ModuleName), AttributeName)
+        setattr(sys.modules[PackageName], Name, Value)
+        return Value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[PackageName])) | set(LazyImports))
+
+    return __getattr__, __dir__
@@ -11,15 +11,23 @@ Purpose: Package initialization for Source module. Provides clean
 import interfaces and package-level configuration.
 """
 
+from Source.Utils.LazyExports import MakeLazyExports
+
 # Package version and metadata
 __version__ = "2.0.0"
 __author__ = "Herb Bowers - Project Himalaya"
 __email__ = "HimalayaProject1@gmail.com"
 
-# Package-level imports can be added here as needed
-# Example:
-# from .module_name import ClassName
+# Top-level shortcuts to the main window and core services, resolved on first
+# access: "import Source" alone loads neither Qt nor the database layer.
+_LAZY_IMPORTS = {
+    "MainWindow": ("Source.Interface.MainWindow", "MainWindow"),
+    "FilterPanel": ("Source.Interface.FilterPanel", "FilterPanel"),
+    "BookGrid": ("Source.Interface.BookGrid", "BookGrid"),
+    "DatabaseManager": ("Source.Core.DatabaseManager", "DatabaseManager"),
+    "BookService": ("Source.Core.BookService", "BookService"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
-__all__ = [
-    # Add public interface exports here
-]
+__getattr__, __dir__ = MakeLazyExports(__name__, _LAZY_IMPORTS)
@@ -23,12 +23,20 @@ from datetime import datetime
 import sqlite3
 
 from fastapi import FastAPI, HTTPException, Query, Path as FastAPIPath, Request
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field, validator
 import uvicorn
 
+# orjson serializes responses in C; fall back to the stdlib encoder if it is not installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultJSONResponse
+except ImportError:
+    orjson = None
+    DefaultJSONResponse = JSONResponse
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -94,7 +102,7 @@ if SourcePath not in sys.path:
 
 # Import our custom modules
 try:
-    from Core.DatabaseManager import DatabaseManager
+    from Core.DatabaseManager import DatabaseManager, GetDatabaseManager
     Logger.info("✅ DatabaseManager imported successfully")
 except ImportError as Error:
     Logger.error(f"❌ Failed to import DatabaseManager: {Error}")
@@ -175,7 +183,8 @@ App = FastAPI(
     description="REST API for Anderson's Book Library - Design Standard v2.0",
     version="2.0.0",
     docs_url="/api/docs",  # Swagger UI
-    redoc_url="/api/redoc"  # ReDoc
+    redoc_url="/api/redoc",  # ReDoc
+    default_response_class=DefaultJSONResponse
 )
 
 # Configure CORS for web development
@@ -188,10 +197,11 @@ App.add_middleware(
 )
 
 # Database dependency with robust path handling
+DATABASE_PATH = str(PROJECT_PATHS['database_path'])
+
 def GetDatabase() -> DatabaseManager:
-    """Dependency to get database manager instance."""
-    DatabasePath = str(PROJECT_PATHS['database_path'])
-    return DatabaseManager(DatabasePath)
+    """Dependency to get the shared database manager instance."""
+    return GetDatabaseManager(DATABASE_PATH)
 
 # ==================== UTILITY FUNCTIONS ====================
 
@@ -228,6 +238,24 @@ def CreatePaginatedResponse(Books: List[BookResponse], Total: int, Page: int, Li
         message=Message
     )
 
+def CreatePaginatedJsonResponse(BooksJson: bytes, Total: int, Page: int, Limit: int, Message: str = None) -> Response:
+    """
+    Create a BooksListResponse-shaped JSON response around a pre-serialized books array
+    The array comes straight from SQLite (GetBooksJson) and is not re-parsed
+    """
+    EnvelopeData = {
+        "total": Total,
+        "page": Page,
+        "limit": Limit,
+        "has_more": (Page * Limit) < Total,
+        "message": Message
+    }
+    Envelope = orjson.dumps(EnvelopeData) if orjson else json.dumps(EnvelopeData).encode('utf-8')
+    return Response(
+        content=b'{"books":' + BooksJson + b',' + Envelope[1:],
+        media_type="application/json"
+    )
+
 # ==================== API ENDPOINTS ====================
 
 # Root endpoint - Commented out to allow StaticFiles to serve index.html
@@ -310,45 +338,41 @@ async def GetBooks(
         # Calculate offset for pagination
         Offset = (page - 1) * limit
         
-        # FIXED: Use search/filter functionality if parameters provided
-        if search or category or subject:
-            # Use search functionality
-            BooksData = DatabaseManager.SearchBooks(
+        # Books are serialized to JSON inside SQLite; only the envelope is built here
+        BooksJson = DatabaseManager.GetBooksJson(
+            SearchQuery=search,
+            Category=category,
+            Subject=subject,
+            Limit=limit,
+            Offset=Offset
+        )
+        
+        if search:
+            TotalBooks = DatabaseManager.GetSearchResultCount(
                 SearchQuery=search,
                 Category=category,
-                Subject=subject,
-                Limit=limit,
-                Offset=Offset
+                Subject=subject
             )
-            
-            # Get total count for pagination
-            TotalBooks = DatabaseManager.GetSearchResultCount(
-                SearchQuery=search,
+        elif category or subject:
+            TotalBooks = DatabaseManager.GetFilteredBookCount(
                 Category=category,
                 Subject=subject
             )
-            
-            # Build descriptive message
-            FilterParts = []
-            if search:
-                FilterParts.append(f"Search: '{search}'")
-            if category:
-                FilterParts.append(f"Category: {category}")
-            if subject:
-                FilterParts.append(f"Subject: {subject}")
-            
-            Message = f"Filtered by {', '.join(FilterParts)}" if FilterParts else None
-            
         else:
-            # Get all books with pagination
-            BooksData = DatabaseManager.GetBooksWithPagination(limit, Offset)
             TotalBooks = DatabaseManager.GetBookCount()
-            Message = None
         
-        # Convert to response models
-        Books = [ConvertBookToResponse(BookRow) for BookRow in BooksData]
+        # Build descriptive message
+        FilterParts = []
+        if search:
+            FilterParts.append(f"Search: '{search}'")
+        if category:
+            FilterParts.append(f"Category: {category}")
+        if subject:
+            FilterParts.append(f"Subject: {subject}")
         
-        return CreatePaginatedResponse(Books, TotalBooks, page, limit, Message)
+        Message = f"Filtered by {', '.join(FilterParts)}" if FilterParts else None
+        
+        return CreatePaginatedJsonResponse(BooksJson, TotalBooks, page, limit, Message)
         
     except Exception as Error:
         Logger.error(f"Error getting books: {Error}")
@@ -370,8 +394,8 @@ async def SearchBooks(SearchRequest: BookSearchRequest):
         # Calculate offset
         Offset = (SearchRequest.page - 1) * SearchRequest.limit
         
-        # Perform search
-        BooksData = DatabaseManager.SearchBooks(
+        # Perform search (rows serialized to JSON inside SQLite)
+        BooksJson = DatabaseManager.GetBooksJson(
             SearchQuery=SearchRequest.query,
             Category=SearchRequest.filters.get('category'),
             Subject=SearchRequest.filters.get('subject'),
@@ -386,11 +410,8 @@ async def SearchBooks(SearchRequest: BookSearchRequest):
             Subject=SearchRequest.filters.get('subject')
         )
         
-        # Convert to response models
-        Books = [ConvertBookToResponse(BookRow) for BookRow in BooksData]
-        
         Message = f"Search results for '{SearchRequest.query}'"
-        return CreatePaginatedResponse(Books, TotalCount, SearchRequest.page, SearchRequest.limit, Message)
+        return CreatePaginatedJsonResponse(BooksJson, TotalCount, SearchRequest.page, SearchRequest.limit, Message)
         
     except Exception as Error:
         Logger.error(f"Error searching books: {Error}")
@@ -419,7 +440,7 @@ async def FilterBooks(
         
         # Apply filters
         Logger.info(f"Filtering books: Category='{category}', Subject='{subject}', Limit={limit}, Offset={Offset}")
-        BooksData = DatabaseManager.GetBooksByFilters(
+        BooksJson = DatabaseManager.GetBooksJson(
             Category=category,
             Subject=subject,
             Limit=limit,
@@ -432,9 +453,6 @@ async def FilterBooks(
             Subject=subject
         )
         
-        # Convert to response models
-        Books = [ConvertBookToResponse(BookRow) for BookRow in BooksData]
-        
         # Create descriptive message
         FilterParts = []
         if category:
@@ -444,7 +462,7 @@ async def FilterBooks(
         
         Message = f"Filtered by {', '.join(FilterParts)}" if FilterParts else "All books"
         
-        return CreatePaginatedResponse(Books, TotalCount, page, limit, Message)
+        return CreatePaginatedJsonResponse(BooksJson, TotalCount, page, limit, Message)
         
     except Exception as Error:
         Logger.error(f"Error filtering books: {Error}")
@@ -505,13 +523,11 @@ async def GetBookThumbnail(book_id: int = FastAPIPath(..., description="Book ID"
         elif ThumbnailData.startswith(b'\xff\xd8'):
             MediaType = "image/jpeg"
         
-        return StreamingResponse(
-            io.BytesIO(ThumbnailData),
+        # Thumbnails are small: send the bytes directly (Content-Length is set by Response)
+        return Response(
+            content=ThumbnailData,
             media_type=MediaType,
-            headers={
-                "Cache-Control": "max-age=3600",  # Cache for 1 hour
-                "Content-Length": str(len(ThumbnailData))
-            }
+            headers={"Cache-Control": "max-age=3600"}  # Cache for 1 hour
         )
         
     except HTTPException:
@@ -816,6 +832,7 @@ async def StartupEvent():
 async def ShutdownEvent():
     """Application shutdown tasks"""
     Logger.info("🛑 Anderson's Library API v2.0 shutting down...")
+    GetDatabase().Disconnect()
 
 # ==================== DEVELOPMENT SERVER ====================
 
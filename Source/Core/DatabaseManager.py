@@ -16,11 +16,219 @@ Maintains exact desktop functionality while optimizing for web performance
 import sqlite3
 import logging
 import os
+import re
+import threading
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 import json
 
+# Module-level logger and default database path (resolved once at import)
+_LOG = logging.getLogger("DatabaseManager")
+_DEFAULT_DB_PATH = Path(__file__).resolve().parent.parent.parent / "Data" / "Databases" / "MyLibraryWeb.db"
+
+# Page cache size in MiB (negative cache_size is KiB); override with ANDYWEB_SQLITE_CACHE_MB
+_DEFAULT_CACHE_SIZE_MB = 64
+
+
+def _ReadCacheSizeMb() -> int:
+    """Read ANDYWEB_SQLITE_CACHE_MB, falling back to the default on a bad value."""
+    RawValue = os.environ.get("ANDYWEB_SQLITE_CACHE_MB")
+    if RawValue is None:
+        return _DEFAULT_CACHE_SIZE_MB
+    try:
+        CacheSizeMb = int(RawValue)
+    except ValueError:
+        CacheSizeMb = 0
+    if CacheSizeMb <= 0:
+        _LOG.warning(f"Ignoring invalid ANDYWEB_SQLITE_CACHE_MB={RawValue!r}; using {_DEFAULT_CACHE_SIZE_MB} MB")
+        return _DEFAULT_CACHE_SIZE_MB
+    return CacheSizeMb
+
+
+_CACHE_SIZE_MB = _ReadCacheSizeMb()
+
+# Per-connection tuning for a read-heavy, thumbnail-serving workload
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",               # Faster writes, safe under WAL
+    "PRAGMA temp_store=MEMORY",                # Memory temp tables
+    f"PRAGMA cache_size=-{_CACHE_SIZE_MB * 1024}",  # Page cache in KiB
+    "PRAGMA mmap_size=268435456",              # 256 MiB memory mapping
+)
+
+# Full-text index over Title/Author, kept in sync with Books by triggers.
+# The trigram tokenizer (SQLite 3.34+) matches any substring of 3+ characters,
+# so a MATCH finds the same books as LIKE '%term%' ("script" finds "JavaScript").
+_SEARCH_SCHEMA_SQL = """
+    CREATE VIRTUAL TABLE IF NOT EXISTS BooksFts USING fts5(
+        Title, Author,
+        content='Books', content_rowid='Id',
+        tokenize='trigram'
+    );
+    CREATE TRIGGER IF NOT EXISTS BooksFtsInsert AFTER INSERT ON Books BEGIN
+        INSERT INTO BooksFts(rowid, Title, Author) VALUES (new.Id, new.Title, new.Author);
+    END;
+    CREATE TRIGGER IF NOT EXISTS BooksFtsDelete AFTER DELETE ON Books BEGIN
+        INSERT INTO BooksFts(BooksFts, rowid, Title, Author) VALUES ('delete', old.Id, old.Title, old.Author);
+    END;
+    CREATE TRIGGER IF NOT EXISTS BooksFtsUpdate AFTER UPDATE OF Title, Author ON Books BEGIN
+        INSERT INTO BooksFts(BooksFts, rowid, Title, Author) VALUES ('delete', old.Id, old.Title, old.Author);
+        INSERT INTO BooksFts(rowid, Title, Author) VALUES (new.Id, new.Title, new.Author);
+    END;
+"""
+
+# Drops an index built with the earlier word tokenizer so it is rebuilt as trigrams
+_DROP_SEARCH_SCHEMA_SQL = """
+    DROP TRIGGER IF EXISTS BooksFtsInsert;
+    DROP TRIGGER IF EXISTS BooksFtsDelete;
+    DROP TRIGGER IF EXISTS BooksFtsUpdate;
+    DROP TABLE IF EXISTS BooksFts;
+"""
+
+# Trigrams need 3+ characters; LIKE wildcards in the string keep their LIKE meaning
+_FTS_MIN_QUERY_LENGTH = 3
+_LIKE_WILDCARD_PATTERN = re.compile(r"[%_]")
+
+# Book columns returned by list/search/filter queries
+_BOOK_COLUMNS = """B.Id, B.Title, B.Author, C.Category, S.Subject, 
+               B.PageCount, B.FileSize, B.CreatedDate, B.ModifiedDate"""
+
+# Filtered side of the join is INNER so SQLite can drive the query from it
+_FILTER_JOINS = {
+    (False, False): """
+            LEFT JOIN Categories C ON B.CategoryId = C.Id
+            LEFT JOIN Subjects S ON B.SubjectId = S.Id
+            """,
+    (True, False): """
+            INNER JOIN Categories C ON B.CategoryId = C.Id
+            LEFT JOIN Subjects S ON B.SubjectId = S.Id
+            """,
+    (False, True): """
+            LEFT JOIN Categories C ON B.CategoryId = C.Id
+            INNER JOIN Subjects S ON B.SubjectId = S.Id
+            """,
+    (True, True): """
+            INNER JOIN Categories C ON B.CategoryId = C.Id
+            INNER JOIN Subjects S ON B.SubjectId = S.Id
+            """,
+}
+
+
+def _BuildWhereClause(HasSearch: bool, HasCategory: bool, HasSubject: bool, UseFts: bool = False) -> str:
+    """
+    Build the WHERE clause for one filter shape (parameter order: search, category, subject)
+    FTS search parameters: MATCH expression, category pattern, subject pattern
+    LIKE search parameters: the same pattern four times
+    """
+    WhereConditions = []
+    if HasSearch and UseFts:
+        # Each branch is index-driven: FTS rowids, then category/subject ids via IdxBooks*
+        WhereConditions.append(
+            "(B.Id IN (SELECT rowid FROM BooksFts WHERE BooksFts MATCH ?)"
+            " OR B.CategoryId IN (SELECT Id FROM Categories WHERE Category LIKE ?)"
+            " OR B.SubjectId IN (SELECT Id FROM Subjects WHERE Subject LIKE ?))"
+        )
+    elif HasSearch:
+        WhereConditions.append(
+            "(B.Title LIKE ? OR B.Author LIKE ? OR C.Category LIKE ? OR S.Subject LIKE ?)"
+        )
+    if HasCategory:
+        WhereConditions.append("C.Category = ?")
+    if HasSubject:
+        WhereConditions.append("S.Subject = ?")
+    return ("WHERE " + " AND ".join(WhereConditions)) if WhereConditions else ""
+
+
+@lru_cache(maxsize=None)
+def _GetSearchSql(HasCategory: bool, HasSubject: bool, CountOnly: bool, UseFts: bool = False) -> str:
+    """SQL for SearchBooks / GetSearchResultCount, built once per filter shape"""
+    WhereClause = _BuildWhereClause(True, HasCategory, HasSubject, UseFts)
+    if CountOnly:
+        return f"""SELECT COUNT(*) as ResultCount 
+                   FROM Books B 
+                   LEFT JOIN Categories C ON B.CategoryId = C.Id 
+                   LEFT JOIN Subjects S ON B.SubjectId = S.Id 
+                   {WhereClause}"""
+    return f"""
+        SELECT {_BOOK_COLUMNS}
+        FROM Books B
+        LEFT JOIN Categories C ON B.CategoryId = C.Id
+        LEFT JOIN Subjects S ON B.SubjectId = S.Id
+        {WhereClause}
+        ORDER BY 
+            CASE 
+                WHEN B.Title LIKE ? THEN 1 
+                WHEN B.Author LIKE ? THEN 2 
+                ELSE 3 
+            END,
+            B.Title ASC
+        LIMIT ? OFFSET ?
+        """
+
+
+@lru_cache(maxsize=None)
+def _GetFilterSql(HasCategory: bool, HasSubject: bool, CountOnly: bool) -> str:
+    """SQL for GetBooksByFilters / GetFilteredBookCount, built once per filter shape"""
+    JoinClause = _FILTER_JOINS[(HasCategory, HasSubject)]
+    WhereClause = _BuildWhereClause(False, HasCategory, HasSubject)
+    if CountOnly:
+        return f"""SELECT COUNT(*) as FilteredCount 
+                   FROM Books B
+                   {JoinClause}
+                   {WhereClause}"""
+    return f"""
+        SELECT {_BOOK_COLUMNS}
+        FROM Books B
+        {JoinClause}
+        {WhereClause}
+        ORDER BY B.Title ASC
+        LIMIT ? OFFSET ?
+        """
+
+
+@lru_cache(maxsize=None)
+def _GetBooksJsonSql(InnerSql: str) -> str:
+    """Wrap a book list query so SQLite returns the whole page as one JSON array"""
+    return f"""
+        SELECT json_group_array(json_object(
+            'id', Id,
+            'title', COALESCE(NULLIF(Title, ''), 'Unknown Title'),
+            'author', Author,
+            'category', Category,
+            'subject', Subject,
+            'page_count', PageCount,
+            'file_size', FileSize,
+            'created_date', CreatedDate,
+            'modified_date', ModifiedDate
+        ))
+        FROM ({InnerSql})
+        """
+
+
+# Library statistics in a single statement (counts, file size and page aggregates)
+_LIBRARY_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM Books),
+        (SELECT COUNT(*) FROM Categories),
+        (SELECT COUNT(*) FROM Subjects),
+        (SELECT COUNT(DISTINCT Author) FROM Books WHERE Author IS NOT NULL AND Author != ''),
+        COALESCE(SUM(CASE WHEN FileSize > 0 THEN FileSize END), 0),
+        COALESCE(AVG(CASE WHEN FileSize > 0 THEN FileSize END), 0),
+        COALESCE(SUM(CASE WHEN PageCount > 0 THEN PageCount END), 0),
+        COALESCE(AVG(CASE WHEN PageCount > 0 THEN PageCount END), 0)
+    FROM Books
+"""
+
+
+# Filter/sort indexes: ordered scans for "WHERE <filter> ORDER BY Title" and name lookups
+_FILTER_INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS IdxBooksCategoryTitle ON Books (CategoryId, Title)",
+    "CREATE INDEX IF NOT EXISTS IdxBooksSubjectTitle ON Books (SubjectId, Title)",
+    "CREATE INDEX IF NOT EXISTS IdxCategoriesCategory ON Categories (Category)",
+    "CREATE INDEX IF NOT EXISTS IdxSubjectsSubject ON Subjects (Subject)",
+)
+
 class DatabaseManager:
     """
     Enhanced Database Manager for Anderson's Library
@@ -28,55 +236,106 @@ class DatabaseManager:
     Uses raw SQL with PascalCase naming per Design Standard v2.0
     """
     
-    def __init__(self, DatabasePath: str):
+    # Serializes writes from all pooled connections (SQLite allows one writer at a time)
+    _WriteLock = threading.Lock()
+    
+    def __init__(self, DatabasePath: Optional[str] = None):
         """
         Initialize database manager with connection pooling and optimization
         
         Args:
-            DatabasePath: Path to SQLite database file
+            DatabasePath: Path to SQLite database file (defaults to MyLibraryWeb.db)
         """
-        self.DatabasePath = DatabasePath
-        self.Connection: Optional[sqlite3.Connection] = None
-        self.Logger = logging.getLogger(self.__class__.__name__)
+        self.DatabasePath = _DEFAULT_DB_PATH if DatabasePath is None else Path(DatabasePath)
+        self.Logger = _LOG
+        
+        # Connection pool: one connection per server thread, tracked for Disconnect()
+        self._Local = threading.local()
+        self._Connections: List[sqlite3.Connection] = []
+        self._ConnectionsLock = threading.Lock()
+        self._Connected = False
         
         # Connection configuration for web performance
         self.ConnectionConfig = {
             'timeout': 30.0,
-            'check_same_thread': False,  # Allow multi-threaded access
+            'check_same_thread': False,  # Disconnect() may run on another thread
             'isolation_level': None,     # Autocommit mode for better performance
+            'cached_statements': 256,    # Reuse prepared statements across calls
         }
         
+        # FTS5 may be missing from the SQLite build (set by EnsureSearchIndex)
+        self.FtsAvailable = False
+        
+        # Category/subject/author lookups, valid while the database is unchanged
+        self._MetadataCache: Dict[tuple, List[sqlite3.Row]] = {}
+        self._WriteCount = 0
+        
         self.Logger.debug(f"DatabaseManager v2.0 initialized for: {DatabasePath}")
 
+    @property
+    def Connection(self) -> Optional[sqlite3.Connection]:
+        """
+        Connection owned by the calling thread, opened on first use
+        None until Connect() has succeeded (and again after Disconnect())
+        """
+        Connection = getattr(self._Local, 'Connection', None)
+        if Connection is None and self._Connected:
+            try:
+                Connection = self._CreateConnection()
+            except sqlite3.Error as Error:
+                self.Logger.error(f"Database connection failed: {Error}")
+        return Connection
+
+    def _CreateConnection(self) -> sqlite3.Connection:
+        """Open and tune a new connection for the calling thread"""
+        Connection = sqlite3.connect(self.DatabasePath, **self.ConnectionConfig)
+        # Default tuple rows; ExecuteQuery opts into sqlite3.Row per cursor for by-name callers
+        
+        for Pragma in _CONNECTION_PRAGMAS:
+            Connection.execute(Pragma)
+        
+        self._Local.Connection = Connection
+        with self._ConnectionsLock:
+            self._Connections.append(Connection)
+        return Connection
+
     def Connect(self) -> bool:
         """
         Establish database connection with optimization for web applications
-        Includes connection pooling and performance tuning
+        Opens the calling thread's connection and runs one-time database setup;
+        other threads open their own pooled connection on first use
+        Safe to call repeatedly: an open connection is reused
         """
+        if self._Connected:
+            return True
+        
         try:
             if not os.path.exists(self.DatabasePath):
                 self.Logger.error(f"Database file not found: {self.DatabasePath}")
                 return False
             
-            # Create connection with performance optimizations
-            self.Connection = sqlite3.connect(
-                self.DatabasePath, 
-                **self.ConnectionConfig
-            )
+            Connection = getattr(self._Local, 'Connection', None) or self._CreateConnection()
+            
+            # page_size only takes effect before the first table is created
+            if Connection.execute("PRAGMA page_count").fetchone()[0] == 0:
+                Connection.execute("PRAGMA page_size=4096")
             
-            # Configure for better web performance
-            self.Connection.row_factory = sqlite3.Row  # Enable column access by name
-            self.Connection.execute("PRAGMA journal_mode=WAL")     # Better concurrency
-            self.Connection.execute("PRAGMA synchronous=NORMAL")   # Faster writes
-            self.Connection.execute("PRAGMA cache_size=10000")     # Larger cache
-            self.Connection.execute("PRAGMA temp_store=MEMORY")    # Memory temp tables
-            self.Connection.execute("PRAGMA mmap_size=268435456")  # Memory mapping
+            # WAL (persistent per database file) lets pooled readers run alongside a writer;
+            # it can fail on network filesystems, so fall back to the default journal
+            try:
+                Connection.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error as Error:
+                self.Logger.warning(f"WAL journal mode unavailable: {Error}")
             
-            # Test connection
-            TestResult = self.Connection.execute("SELECT COUNT(*) FROM Books").fetchone()
-            BookCount = TestResult[0] if TestResult else 0
+            self._Connected = True
+            self.EnsureIndexes()
+            self.EnsureSearchIndex()
             
-            self.Logger.debug(f"✅ Database connected successfully - {BookCount} books available")
+            # Book count is only worth a table scan when someone will read the log line
+            if self.Logger.isEnabledFor(logging.DEBUG):
+                TestResult = Connection.execute("SELECT COUNT(*) FROM Books").fetchone()
+                BookCount = TestResult[0] if TestResult else 0
+                self.Logger.debug(f"✅ Database connected successfully - {BookCount} books available")
             return True
             
         except sqlite3.Error as Error:
@@ -86,36 +345,111 @@ class DatabaseManager:
             self.Logger.error(f"Unexpected error connecting to database: {Error}")
             return False
 
+    def EnsureIndexes(self) -> None:
+        """
+        Create the filter/sort indexes in one transaction (idempotent)
+        Runs ANALYZE when an index was added or planner statistics are missing
+        """
+        try:
+            CountIndexesSql = "SELECT COUNT(*) FROM sqlite_master WHERE type = 'index'"
+            IndexesBefore = self.Connection.execute(CountIndexesSql).fetchone()[0]
+            self.Connection.executescript("BEGIN;\n" + ";\n".join(_FILTER_INDEX_SQL) + ";\nCOMMIT;")
+            IndexesAfter = self.Connection.execute(CountIndexesSql).fetchone()[0]
+            HasStats = self.Connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ).fetchone()
+            if IndexesAfter != IndexesBefore or not HasStats:
+                self.Connection.execute("ANALYZE")
+                self.Logger.info("Filter indexes created and planner statistics updated")
+        except sqlite3.Error as Error:
+            self.Logger.warning(f"Could not create filter indexes: {Error}")
+
+    def EnsureSearchIndex(self) -> None:
+        """
+        Create the BooksFts full-text index and its sync triggers (idempotent)
+        The index is populated from Books only when it is first created
+        """
+        try:
+            Existing = self.Connection.execute(
+                "SELECT sql FROM sqlite_master WHERE name = 'BooksFts'"
+            ).fetchone()
+            if Existing and "trigram" not in Existing[0]:
+                self.Connection.executescript(_DROP_SEARCH_SCHEMA_SQL)
+                Existing = None
+            self.Connection.executescript(_SEARCH_SCHEMA_SQL)
+            if not Existing:
+                self.Connection.execute("INSERT INTO BooksFts(BooksFts) VALUES ('rebuild')")
+                self.Logger.info("Built full-text search index for books")
+            self.FtsAvailable = True
+        except sqlite3.Error as Error:
+            self.FtsAvailable = False
+            self.Logger.warning(f"Full-text search unavailable, using LIKE search: {Error}")
+
+    @staticmethod
+    def BuildFtsQuery(SearchQuery: str) -> Optional[str]:
+        """
+        Build an FTS5 trigram query from a search string
+        The whole string is one quoted phrase, so it matches as a substring of
+        Title or Author, the same as LIKE '%string%' (including infix hits)
+        
+        Returns:
+            MATCH expression, or None if the string needs the LIKE fallback
+            (shorter than 3 characters, or containing LIKE wildcards)
+        """
+        if len(SearchQuery) < _FTS_MIN_QUERY_LENGTH or _LIKE_WILDCARD_PATTERN.search(SearchQuery):
+            return None
+        Escaped = SearchQuery.replace('"', '""')
+        return f'"{Escaped}"'
+
+    def _GetSearchParameters(self, SearchQuery: str) -> Tuple[List[Any], bool]:
+        """
+        Leading search parameters and whether the FTS form of the query applies
+        """
+        SearchPattern = f"%{SearchQuery}%"
+        FtsQuery = self.BuildFtsQuery(SearchQuery) if self.FtsAvailable else None
+        if FtsQuery:
+            return [FtsQuery, SearchPattern, SearchPattern], True
+        return [SearchPattern] * 4, False
+
     def Disconnect(self) -> None:
-        """Close database connection gracefully"""
-        if self.Connection:
+        """Close all pooled database connections gracefully"""
+        self._Connected = False
+        with self._ConnectionsLock:
+            Connections, self._Connections = self._Connections, []
+        self._Local = threading.local()
+        
+        for Connection in Connections:
             try:
-                self.Connection.close()
-                self.Logger.info("Database connection closed")
+                Connection.close()
             except Exception as Error:
                 self.Logger.error(f"Error closing database connection: {Error}")
-            finally:
-                self.Connection = None
+        if Connections:
+            self.Logger.info("Database connection closed")
 
-    def ExecuteQuery(self, Query: str, Parameters: Tuple = ()) -> List[sqlite3.Row]:
+    def ExecuteQuery(self, Query: str, Parameters: Tuple = (),
+                     RowFactory: Optional[Any] = sqlite3.Row) -> List[sqlite3.Row]:
         """
         Execute SELECT query with parameters and error handling
         
         Args:
             Query: SQL query string with PascalCase column names
             Parameters: Query parameters for safe execution
+            RowFactory: Row factory for this query's cursor; None returns plain tuples
+                (cheaper for hot paths that read columns by position)
             
         Returns:
             List of database rows or empty list on error
         """
-        if not self.Connection:
+        Connection = self.Connection
+        if not Connection:
             self.Logger.error("No database connection available")
             return []
         
         try:
-            Cursor = self.Connection.execute(Query, Parameters)
-            Results = Cursor.fetchall()
-            return Results
+            Cursor = Connection.cursor()
+            if RowFactory is not None:
+                Cursor.row_factory = RowFactory
+            return Cursor.execute(Query, Parameters).fetchall()
             
         except sqlite3.Error as Error:
             self.Logger.error(f"Query execution failed: {Error}")
@@ -134,13 +468,16 @@ class DatabaseManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.Connection:
+        Connection = self.Connection
+        if not Connection:
             self.Logger.error("No database connection available")
             return False
         
         try:
-            self.Connection.execute(Query, Parameters)
-            self.Connection.commit()
+            with self._WriteLock:
+                Connection.execute(Query, Parameters)
+                Connection.commit()
+            self.InvalidateMetaCache()
             return True
             
         except sqlite3.Error as Error:
@@ -149,6 +486,36 @@ class DatabaseManager:
             self.Logger.error(f"Parameters: {Parameters}")
             return False
 
+    # ==================== METADATA CACHE ====================
+
+    def InvalidateMetaCache(self) -> None:
+        """Drop cached category/subject/author lookups (called by every write path)"""
+        self._WriteCount += 1
+        self._MetadataCache.clear()
+
+    def _CachedMetadataQuery(self, Key: tuple, Query: str, Parameters: Tuple = ()) -> List[sqlite3.Row]:
+        """
+        Run a metadata query once and serve repeats from memory
+        PRAGMA data_version changes whenever another connection commits,
+        so edits made outside this process also invalidate the cache
+        data_version is per connection, so each pooled thread tracks the value it last saw
+        """
+        Connection = self.Connection
+        if not Connection:
+            return self.ExecuteQuery(Query, Parameters)
+        
+        Version = (Connection.execute("PRAGMA data_version").fetchone()[0], self._WriteCount)
+        if Version != getattr(self._Local, 'MetadataVersion', None):
+            self._MetadataCache.clear()
+            self._Local.MetadataVersion = Version
+        
+        Results = self._MetadataCache.get(Key)
+        if Results is None:
+            Results = self.ExecuteQuery(Query, Parameters)
+            if Results:
+                self._MetadataCache[Key] = Results
+        return list(Results)
+
     # ==================== BOOK RETRIEVAL METHODS ====================
 
     def GetAllBooks(self) -> List[sqlite3.Row]:
@@ -202,8 +569,8 @@ class DatabaseManager:
         Get total number of books for pagination and statistics
         """
         Query = "SELECT COUNT(*) as BookCount FROM Books"
-        Results = self.ExecuteQuery(Query)
-        return Results[0]['BookCount'] if Results else 0
+        Results = self.ExecuteQuery(Query, RowFactory=None)
+        return Results[0][0] if Results else 0
 
     # ==================== SEARCH FUNCTIONALITY ====================
 
@@ -214,45 +581,19 @@ class DatabaseManager:
         Google-type instant search with filters
         Maintains exact desktop search functionality
         """
-        # Build base query with search
-        WhereConditions = [
-            "(B.Title LIKE ? OR B.Author LIKE ? OR C.Category LIKE ? OR S.Subject LIKE ?)"
-        ]
-        Parameters = [f"%{SearchQuery}%"] * 4
+        SearchPattern = f"%{SearchQuery}%"
+        Parameters, UseFts = self._GetSearchParameters(SearchQuery)
         
         # Add optional filters
         if Category:
-            WhereConditions.append("C.Category = ?")
             Parameters.append(Category)
-            
         if Subject:
-            WhereConditions.append("S.Subject = ?")
             Parameters.append(Subject)
-            
-        # Combine conditions
-        WhereClause = " AND ".join(WhereConditions)
-        
-        Query = f"""
-        SELECT B.Id, B.Title, B.Author, C.Category, S.Subject, 
-               B.PageCount, B.FileSize, B.CreatedDate, B.ModifiedDate
-        FROM Books B
-        LEFT JOIN Categories C ON B.CategoryId = C.Id
-        LEFT JOIN Subjects S ON B.SubjectId = S.Id
-        WHERE {WhereClause}
-        ORDER BY 
-            CASE 
-                WHEN B.Title LIKE ? THEN 1 
-                WHEN B.Author LIKE ? THEN 2 
-                ELSE 3 
-            END,
-            B.Title ASC
-        LIMIT ? OFFSET ?
-        """
         
         # Add parameters for ORDER BY and pagination
-        SearchPattern = f"%{SearchQuery}%"
         Parameters.extend([SearchPattern, SearchPattern, Limit, Offset])
         
+        Query = _GetSearchSql(bool(Category), bool(Subject), False, UseFts)
         return self.ExecuteQuery(Query, tuple(Parameters))
 
     def GetSearchResultCount(self, SearchQuery: str, Category: Optional[str] = None,
@@ -260,28 +601,46 @@ class DatabaseManager:
         """
         Get total count of search results for pagination
         """
-        WhereConditions = [
-            "(B.Title LIKE ? OR B.Author LIKE ? OR C.Category LIKE ? OR S.Subject LIKE ?)"
-        ]
-        Parameters = [f"%{SearchQuery}%"] * 4
+        Parameters, UseFts = self._GetSearchParameters(SearchQuery)
         
         if Category:
-            WhereConditions.append("C.Category = ?")
             Parameters.append(Category)
-            
         if Subject:
-            WhereConditions.append("S.Subject = ?")
             Parameters.append(Subject)
-            
-        WhereClause = " AND ".join(WhereConditions)
-        Query = f"""SELECT COUNT(*) as ResultCount 
-                   FROM Books B 
-                   LEFT JOIN Categories C ON B.CategoryId = C.Id 
-                   LEFT JOIN Subjects S ON B.SubjectId = S.Id 
-                   WHERE {WhereClause}"""
         
-        Results = self.ExecuteQuery(Query, tuple(Parameters))
-        return Results[0]['ResultCount'] if Results else 0
+        Query = _GetSearchSql(bool(Category), bool(Subject), True, UseFts)
+        
+        Results = self.ExecuteQuery(Query, tuple(Parameters), RowFactory=None)
+        return Results[0][0] if Results else 0
+
+    def GetBooksJson(self, SearchQuery: Optional[str] = None, Category: Optional[str] = None,
+                     Subject: Optional[str] = None, Limit: int = 50, Offset: int = 0) -> bytes:
+        """
+        Get one page of books as a UTF-8 JSON array built inside SQLite
+        Same rows and order as SearchBooks (with a search term) or GetBooksByFilters,
+        serialized with the API's field names so the web tier can send it unchanged
+        
+        Returns:
+            JSON array bytes (b"[]" on error)
+        """
+        Parameters = []
+        if SearchQuery:
+            SearchPattern = f"%{SearchQuery}%"
+            Parameters, UseFts = self._GetSearchParameters(SearchQuery)
+            InnerSql = _GetSearchSql(bool(Category), bool(Subject), False, UseFts)
+        else:
+            InnerSql = _GetFilterSql(bool(Category), bool(Subject), False)
+        
+        if Category:
+            Parameters.append(Category)
+        if Subject:
+            Parameters.append(Subject)
+        if SearchQuery:
+            Parameters.extend([SearchPattern, SearchPattern])
+        Parameters.extend([Limit, Offset])
+        
+        Results = self.ExecuteQuery(_GetBooksJsonSql(InnerSql), tuple(Parameters), RowFactory=None)
+        return Results[0][0].encode('utf-8') if Results else b"[]"
 
     # ==================== FILTER FUNCTIONALITY ====================
 
@@ -293,59 +652,17 @@ class DatabaseManager:
         """
         self.Logger.info(f"GetBooksByFilters called with Category='{Category}', Subject='{Subject}', MinRating={MinRating}")
         
-        WhereConditions = []
         Parameters = []
         
         if Category:
-            WhereConditions.append("C.Category = ?")
             Parameters.append(Category)
             self.Logger.info(f"Added category filter: C.Category = '{Category}'")
             
         if Subject:
-            WhereConditions.append("S.Subject = ?")
             Parameters.append(Subject)
             self.Logger.info(f"Added subject filter: S.Subject = '{Subject}'")
-            
-        # Build query with proper JOIN types based on filters
-        if Category and Subject:
-            # Both filters - use INNER JOIN for both
-            JoinClause = """
-            INNER JOIN Categories C ON B.CategoryId = C.Id
-            INNER JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        elif Category:
-            # Category filter only - use INNER JOIN for Categories
-            JoinClause = """
-            INNER JOIN Categories C ON B.CategoryId = C.Id
-            LEFT JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        elif Subject:
-            # Subject filter only - use INNER JOIN for Subjects
-            JoinClause = """
-            LEFT JOIN Categories C ON B.CategoryId = C.Id
-            INNER JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        else:
-            # No filters - use LEFT JOIN for both
-            JoinClause = """
-            LEFT JOIN Categories C ON B.CategoryId = C.Id
-            LEFT JOIN Subjects S ON B.SubjectId = S.Id
-            """
         
-        if WhereConditions:
-            WhereClause = "WHERE " + " AND ".join(WhereConditions)
-        else:
-            WhereClause = ""
-        
-        Query = f"""
-        SELECT B.Id, B.Title, B.Author, C.Category, S.Subject, 
-               B.PageCount, B.FileSize, B.CreatedDate, B.ModifiedDate
-        FROM Books B
-        {JoinClause}
-        {WhereClause}
-        ORDER BY B.Title ASC
-        LIMIT ? OFFSET ?
-        """
+        Query = _GetFilterSql(bool(Category), bool(Subject), False)
         
         Parameters.extend([Limit, Offset])
         
@@ -362,55 +679,17 @@ class DatabaseManager:
         """
         Get count of filtered books for pagination
         """
-        WhereConditions = []
         Parameters = []
         
         if Category:
-            WhereConditions.append("C.Category = ?")
             Parameters.append(Category)
-            
         if Subject:
-            WhereConditions.append("S.Subject = ?")
             Parameters.append(Subject)
-            
-        # Build query with proper JOIN types based on filters
-        if Category and Subject:
-            # Both filters - use INNER JOIN for both
-            JoinClause = """
-            INNER JOIN Categories C ON B.CategoryId = C.Id
-            INNER JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        elif Category:
-            # Category filter only - use INNER JOIN for Categories
-            JoinClause = """
-            INNER JOIN Categories C ON B.CategoryId = C.Id
-            LEFT JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        elif Subject:
-            # Subject filter only - use INNER JOIN for Subjects
-            JoinClause = """
-            LEFT JOIN Categories C ON B.CategoryId = C.Id
-            INNER JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        else:
-            # No filters - use LEFT JOIN for both
-            JoinClause = """
-            LEFT JOIN Categories C ON B.CategoryId = C.Id
-            LEFT JOIN Subjects S ON B.SubjectId = S.Id
-            """
-        
-        if WhereConditions:
-            WhereClause = "WHERE " + " AND ".join(WhereConditions)
-        else:
-            WhereClause = ""
         
-        Query = f"""SELECT COUNT(*) as FilteredCount 
-                   FROM Books B
-                   {JoinClause}
-                   {WhereClause}"""
+        Query = _GetFilterSql(bool(Category), bool(Subject), True)
         
-        Results = self.ExecuteQuery(Query, tuple(Parameters))
-        return Results[0]['FilteredCount'] if Results else 0
+        Results = self.ExecuteQuery(Query, tuple(Parameters), RowFactory=None)
+        return Results[0][0] if Results else 0
 
     # ==================== CATEGORY AND SUBJECT METHODS ====================
 
@@ -423,7 +702,7 @@ class DatabaseManager:
         FROM Categories 
         ORDER BY Category ASC
         """
-        return self.ExecuteQuery(Query)
+        return self._CachedMetadataQuery(('Categories',), Query)
 
     def GetCategoriesWithCounts(self) -> List[sqlite3.Row]:
         """
@@ -443,7 +722,7 @@ class DatabaseManager:
             GROUP BY C.Category
             ORDER BY BookCount DESC, C.Category ASC
             """
-            return self.ExecuteQuery(Query)
+            return self._CachedMetadataQuery(('CategoriesWithCounts',), Query)
         except:
             # Fallback to simple query if complex schema doesn't exist
             Query = """
@@ -481,7 +760,7 @@ class DatabaseManager:
         FROM Subjects 
         ORDER BY Subject ASC
         """
-        return self.ExecuteQuery(Query)
+        return self._CachedMetadataQuery(('Subjects',), Query)
 
     def GetSubjectsWithCounts(self) -> List[sqlite3.Row]:
         """
@@ -496,7 +775,7 @@ class DatabaseManager:
             GROUP BY S.Subject 
             ORDER BY BookCount DESC, S.Subject ASC
             """
-            return self.ExecuteQuery(Query)
+            return self._CachedMetadataQuery(('SubjectsWithCounts',), Query)
         except:
             # Fallback - get subjects directly from Books table
             Query = """
@@ -529,7 +808,7 @@ class DatabaseManager:
             """
             self.Logger.info(f"GetSubjectsByCategory query: {Query}")
             self.Logger.info(f"GetSubjectsByCategory parameters: {(Category,)}")
-            Results = self.ExecuteQuery(Query, (Category,))
+            Results = self._CachedMetadataQuery(('SubjectsByCategory', Category), Query, (Category,))
         except:
             # Fallback - get subjects directly from Books table filtered by category
             Query = """
@@ -560,7 +839,7 @@ class DatabaseManager:
         GROUP BY Author 
         ORDER BY BookCount DESC, Author ASC
         """
-        return self.ExecuteQuery(Query)
+        return self._CachedMetadataQuery(('Authors',), Query)
 
     # ==================== STATISTICS AND ANALYTICS ====================
 
@@ -572,65 +851,17 @@ class DatabaseManager:
         Stats = {}
         
         try:
-            # Basic counts
-            BookCountQuery = "SELECT COUNT(*) as Total FROM Books"
-            BookCountResult = self.ExecuteQuery(BookCountQuery)
-            Stats['TotalBooks'] = BookCountResult[0]['Total'] if BookCountResult else 0
-            
-            # Category count
-            CategoryCountQuery = "SELECT COUNT(*) as Total FROM Categories"
-            CategoryCountResult = self.ExecuteQuery(CategoryCountQuery)
-            Stats['TotalCategories'] = CategoryCountResult[0]['Total'] if CategoryCountResult else 0
-            
-            # Subject count
-            SubjectCountQuery = "SELECT COUNT(*) as Total FROM Subjects"
-            SubjectCountResult = self.ExecuteQuery(SubjectCountQuery)
-            Stats['TotalSubjects'] = SubjectCountResult[0]['Total'] if SubjectCountResult else 0
-            
-            # Author count
-            AuthorCountQuery = """
-            SELECT COUNT(DISTINCT Author) as Total 
-            FROM Books 
-            WHERE Author IS NOT NULL AND Author != ''
-            """
-            AuthorCountResult = self.ExecuteQuery(AuthorCountQuery)
-            Stats['TotalAuthors'] = AuthorCountResult[0]['Total'] if AuthorCountResult else 0
-            
-            # File size statistics
-            FileSizeQuery = """
-            SELECT 
-                COALESCE(SUM(FileSize), 0) as TotalSize,
-                COALESCE(AVG(FileSize), 0) as AverageSize
-            FROM Books 
-            WHERE FileSize IS NOT NULL AND FileSize > 0
-            """
-            FileSizeResult = self.ExecuteQuery(FileSizeQuery)
-            if FileSizeResult:
-                Stats['TotalFileSize'] = FileSizeResult[0]['TotalSize']
-                Stats['AverageFileSize'] = FileSizeResult[0]['AverageSize']
-            else:
-                Stats['TotalFileSize'] = 0
-                Stats['AverageFileSize'] = 0
+            # All statistics in one statement: one prepare, one VM pass
+            (Stats['TotalBooks'], Stats['TotalCategories'], Stats['TotalSubjects'],
+             Stats['TotalAuthors'], Stats['TotalFileSize'], Stats['AverageFileSize'],
+             TotalPages, AveragePages) = self.Connection.execute(_LIBRARY_STATS_SQL).fetchone()
             
             # Rating statistics (REMOVED as column does not exist)
             Stats['AverageRating'] = 0.0
             Stats['RatedBooks'] = 0
             
-            # Page count statistics
-            PageQuery = """
-            SELECT 
-                COALESCE(SUM(PageCount), 0) as TotalPages,
-                COALESCE(AVG(PageCount), 0) as AveragePages
-            FROM Books 
-            WHERE PageCount IS NOT NULL AND PageCount > 0
-            """
-            PageResult = self.ExecuteQuery(PageQuery)
-            if PageResult:
-                Stats['TotalPages'] = PageResult[0]['TotalPages']
-                Stats['AveragePages'] = round(PageResult[0]['AveragePages'], 1)
-            else:
-                Stats['TotalPages'] = 0
-                Stats['AveragePages'] = 0
+            Stats['TotalPages'] = TotalPages
+            Stats['AveragePages'] = round(AveragePages, 1)
             
             self.Logger.debug(f"Retrieved library statistics: {Stats['TotalBooks']} books")
             return Stats
@@ -737,11 +968,13 @@ class DatabaseManager:
         Runs ANALYZE and VACUUM commands
         """
         try:
-            # Update statistics for query optimizer
-            self.Connection.execute("ANALYZE")
-            
-            # Compact database (careful with large databases)
-            self.Connection.execute("VACUUM")
+            Connection = self.Connection
+            with self._WriteLock:
+                # Update statistics for query optimizer
+                Connection.execute("ANALYZE")
+                
+                # Compact database (careful with large databases)
+                Connection.execute("VACUUM")
             
             self.Logger.info("Database optimization completed")
             return True
@@ -794,20 +1027,51 @@ class DatabaseManager:
         Returns:
             bytes: Thumbnail image data or None if not found
         """
+        return self.GetBookThumbnailStream(BookId)
+
+    def GetBookThumbnailStream(self, BookId: int, Offset: int = 0,
+                               Length: Optional[int] = None) -> Optional[bytes]:
+        """
+        Read thumbnail bytes (optionally a byte range) straight from the BLOB
+        Uses incremental BLOB I/O so only the requested range is copied
+        
+        Args:
+            BookId: ID of the book to get thumbnail for
+            Offset: Byte offset to start reading from
+            Length: Number of bytes to read (None reads to the end)
+            
+        Returns:
+            bytes: Thumbnail image data or None if not found
+        """
+        if not self.Connection:
+            self.Logger.error("No database connection available")
+            return None
+        
         try:
-            Query = """
-            SELECT ThumbnailImage 
-            FROM Books 
-            WHERE Id = ?
-            """
+            if hasattr(self.Connection, 'blobopen'):
+                # Python 3.11+: incremental BLOB I/O (Books.Id is the rowid)
+                with self.Connection.blobopen("Books", "ThumbnailImage", BookId, readonly=True) as Blob:
+                    Blob.seek(Offset)
+                    Data = Blob.read(-1 if Length is None else Length)
+            elif Length is None:
+                # Older Python: let SQLite cut the range
+                Result = self.ExecuteQuery(
+                    "SELECT substr(ThumbnailImage, ?) FROM Books WHERE Id = ?",
+                    (Offset + 1, BookId), RowFactory=None
+                )
+                Data = Result[0][0] if Result else None
+            else:
+                Result = self.ExecuteQuery(
+                    "SELECT substr(ThumbnailImage, ?, ?) FROM Books WHERE Id = ?",
+                    (Offset + 1, Length, BookId), RowFactory=None
+                )
+                Data = Result[0][0] if Result else None
             
-            Result = self.ExecuteQuery(Query, (BookId,))
+            return Data or None
             
-            if Result and Result[0]['ThumbnailImage']:
-                return Result[0]['ThumbnailImage']
-            else:
-                return None
-                
+        except sqlite3.OperationalError:
+            # Missing row or NULL thumbnail
+            return None
         except Exception as Error:
             self.Logger.error(f"Error getting thumbnail for book {BookId}: {Error}")
             return None
@@ -829,10 +1093,10 @@ class DatabaseManager:
             WHERE Id = ?
             """
             
-            Result = self.ExecuteQuery(Query, (BookId,))
+            Result = self.ExecuteQuery(Query, (BookId,), RowFactory=None)
             
             if Result:
-                return bool(Result[0]['HasThumb'])
+                return bool(Result[0][0])
             else:
                 return False
                 
@@ -924,8 +1188,23 @@ class DatabaseManager:
 
     def __del__(self):
         """Destructor to ensure connection cleanup"""
-        if hasattr(self, 'Connection') and self.Connection:
+        for Connection in getattr(self, '_Connections', ()):
             try:
-                self.Connection.close()
+                Connection.close()
             except:
-                pass  # Ignore errors during cleanup
\ No newline at end of file
+                pass  # Ignore errors during cleanup
+
+
+@lru_cache(maxsize=None)
+def GetDatabaseManager(DatabasePath: Optional[str] = None) -> DatabaseManager:
+    """
+    Get the shared DatabaseManager for a database path
+    Used as the FastAPI dependency so requests reuse the pooled per-thread connections
+    
+    Args:
+        DatabasePath: Path to SQLite database file (defaults to MyLibraryWeb.db)
+        
+    Returns:
+        DatabaseManager instance shared by all callers with the same path
+    """
+    return DatabaseManager(DatabasePath)
@@ -11,8 +11,8 @@ Detects HP printer conflicts and other port issues automatically.
 
 import sys
 import subprocess
+import importlib.util
 import webbrowser
-import time
 import os
 import socket
 from pathlib import Path
@@ -128,31 +128,31 @@ class SmartAndyWebLauncher:
         return True
         
     def CheckDependencies(self) -> bool:
-        """Check and install required dependencies."""
-        try:
-            # Check if FastAPI is installed
-            import fastapi
-            import uvicorn
+        """Check required dependencies are installed (without importing them)."""
+        if importlib.util.find_spec("fastapi") is not None and importlib.util.find_spec("uvicorn") is not None:
             Logger.info("FastAPI dependencies found ✓")
-            return True 
+            return True
+        
+        Logger.error("FastAPI dependencies not found")
+        Logger.error("Install them with: python StartAndyWeb.py --bootstrap")
+        return False
+        
+    def BootstrapDependencies(self) -> bool:
+        """Install required dependencies from requirements.txt (--bootstrap only)."""
+        if not self.RequirementsPath.exists():
+            Logger.error("requirements.txt not found")
+            return False
             
-        except ImportError:
-            Logger.warning("FastAPI not found. Attempting to install dependencies...")
+        try:
+            subprocess.check_call([
+                sys.executable, "-m", "pip", "install", "-r", str(self.RequirementsPath)
+            ])
+            Logger.info("Dependencies installed successfully ✓")
+            return True
             
-            if not self.RequirementsPath.exists():
-                Logger.error("requirements.txt not found")
-                return False
-                
-            try:
-                subprocess.check_call([
-                    sys.executable, "-m", "pip", "install", "-r", str(self.RequirementsPath)
-                ])
-                Logger.info("Dependencies installed successfully ✓")
-                return True
-                
-            except subprocess.CalledProcessError as Error:
-                Logger.error(f"Failed to install dependencies: {Error}")
-                return False
+        except subprocess.CalledProcessError as Error:
+            Logger.error(f"Failed to install dependencies: {Error}")
+            return False
                 
     def CheckAPIFile(self) -> bool:
         """Verify API file exists."""
@@ -181,16 +181,23 @@ class SmartAndyWebLauncher:
             Logger.error(f"Failed to setup environment: {Error}")
             return False
             
-    def StartServer(self) -> None:
-        """Start FastAPI development server with smart port selection."""
+    def StartServer(self, Reload: bool = False, OpenBrowser: bool = True) -> None:
+        """
+        Start FastAPI server with smart port selection.
+        
+        Args:
+            Reload: Run uvicorn in a subprocess with auto-reload (development)
+            OpenBrowser: Open the frontend once the server has started
+        """
         try:
             # Find available port
             Port = self.FindAvailablePort()
+            AppURL = f"http://127.0.0.1:{Port}/"
             
             Logger.info("🚀 Starting AndyWeb API server...")
             Logger.info(f"📡 Server will be available at: http://127.0.0.1:{Port}")
             Logger.info(f"📚 API documentation at: http://127.0.0.1:{Port}/api/docs")
-            Logger.info(f"🌐 Frontend application at: http://127.0.0.1:{Port}/")
+            Logger.info(f"🌐 Frontend application at: {AppURL}")
             
             if Port != 8000:
                 Logger.info(f"🔄 Note: Using port {Port} instead of 8000 due to conflicts")
@@ -199,47 +206,48 @@ class SmartAndyWebLauncher:
             Logger.info("Press Ctrl+C to stop the server")
             Logger.info("=" * 70)
             
-            # Change to API directory for relative imports
             APIDirectory = self.APIPath.parent
-            os.chdir(APIDirectory)
-            
-            # Start uvicorn server with selected port
-            subprocess.run([
-                sys.executable, "-m", "uvicorn",
-                "MainAPI:App",
-                "--host", "127.0.0.1",
-                "--port", str(Port),
-                "--reload",
-                "--log-level", "info"
-            ])
             
-        except KeyboardInterrupt:
-            Logger.info("\nServer stopped by user")
-        except Exception as Error:
-            Logger.error(f"Failed to start server: {Error}")
-            
-    def OpenBrowser(self) -> None:
-        """Open web browser to application with smart port detection."""
-        try:
-            # Wait a moment for server to start
-            time.sleep(3)
+            if Reload:
+                # Development mode: uvicorn's reloader needs its own process
+                subprocess.run([
+                    sys.executable, "-m", "uvicorn",
+                    "MainAPI:App",
+                    "--app-dir", str(APIDirectory),
+                    "--host", "127.0.0.1",
+                    "--port", str(Port),
+                    "--reload",
+                    "--log-level", "info"
+                ])
+                return
             
-            # Use the selected port or default
-            Port = self.SelectedPort or 8000
-            AppURL = f"http://127.0.0.1:{Port}/"
+            # Run uvicorn in-process; the browser opens once startup completes
+            if str(APIDirectory) not in sys.path:
+                sys.path.insert(0, str(APIDirectory))
+            import uvicorn
+            from MainAPI import App
             
-            # Suppress GTK module warnings
-            os.environ['GTK_MODULES'] = ''
-            os.environ['GIO_EXTRA_MODULES'] = ''
+            if OpenBrowser:
+                async def OpenBrowserOnStartup() -> None:
+                    try:
+                        # Suppress GTK module warnings
+                        os.environ['GTK_MODULES'] = ''
+                        os.environ['GIO_EXTRA_MODULES'] = ''
+                        webbrowser.open(AppURL)
+                        Logger.info(f"🌐 Opening browser to: {AppURL}")
+                    except Exception as Error:
+                        Logger.warning(f"Could not open browser automatically: {Error}")
+                        Logger.info(f"Please manually navigate to: {AppURL}")
+                
+                App.add_event_handler("startup", OpenBrowserOnStartup)
             
-            # Try to open the frontend application
-            webbrowser.open(AppURL)
-            Logger.info(f"🌐 Opening browser to: {AppURL}")
+            Config = uvicorn.Config(App, host="127.0.0.1", port=Port, log_level="info", reload=False)
+            uvicorn.Server(Config).run()
             
+        except KeyboardInterrupt:
+            Logger.info("\nServer stopped by user")
         except Exception as Error:
-            Logger.warning(f"Could not open browser automatically: {Error}")
-            Port = self.SelectedPort or 8000
-            Logger.info(f"Please manually navigate to: http://127.0.0.1:{Port}/app")
+            Logger.error(f"Failed to start server: {Error}")
             
     def ShowPortInfo(self) -> None:
         """Display helpful information about port conflicts."""
@@ -254,7 +262,7 @@ class SmartAndyWebLauncher:
         print("• Your selected port will be shown when server starts")
         print()
             
-    def Run(self) -> None:
+    def Run(self, Reload: bool = False, OpenBrowser: bool = True) -> None:
         """Main launcher routine with intelligent port management."""
         print("🚀 AndyWeb Library - Smart Startup")
         print("=" * 50)
@@ -282,16 +290,9 @@ class SmartAndyWebLauncher:
         # Show port info for educational purposes
         self.ShowPortInfo()
         
-        # Start server (this will block)
+        # Start the server (blocking)
         try:
-            # Start browser in a separate thread after short delay
-            import threading
-            BrowserThread = threading.Thread(target=self.OpenBrowser)
-            BrowserThread.daemon = True
-            BrowserThread.start()
-            
-            # Start the server (blocking)
-            self.StartServer()
+            self.StartServer(Reload=Reload, OpenBrowser=OpenBrowser)
             
         except Exception as Error:
             Logger.error(f"Startup failed: {Error}")
@@ -306,7 +307,9 @@ Usage: python StartAndyWeb.py [options]
 Options:
   --help, -h     Show this help message
   --check        Run environment checks only (don't start server)
+  --bootstrap    Install dependencies from requirements.txt, then exit
   --no-browser   Don't open browser automatically
+  --reload       Development mode: run uvicorn with auto-reload
   --port XXXX    Try specific port first (still falls back if occupied)
 
 Smart Features:
@@ -320,7 +323,7 @@ What this script does:
 ✓ Validates Python version (3.8+)
 ✓ Checks database file exists  
 ✓ Verifies API files are present  
-✓ Installs missing dependencies
+✓ Checks dependencies (install with --bootstrap)
 ✓ Configures environment
 ✓ Finds available port automatically
 ✓ Starts FastAPI development server
@@ -340,6 +343,10 @@ if __name__ == "__main__":
         if sys.argv[1] in ['--help', '-h']:
             ShowHelp()
             sys.exit(0)
+        elif sys.argv[1] == '--bootstrap':
+            # Explicit dependency installation
+            Launcher = SmartAndyWebLauncher()
+            sys.exit(0 if Launcher.BootstrapDependencies() else 1)
         elif sys.argv[1] == '--check':
             # Run checks only
             Launcher = SmartAndyWebLauncher()
@@ -375,7 +382,10 @@ if __name__ == "__main__":
     # Normal startup
     try:
         Launcher = SmartAndyWebLauncher()
-        Launcher.Run()
+        Launcher.Run(
+            Reload='--reload' in sys.argv,
+            OpenBrowser='--no-browser' not in sys.argv
+        )
     except KeyboardInterrupt:
         print("\n👋 AndyWeb launcher stopped")
     except Exception as Error: